@@ -49,6 +49,10 @@ Functions
     :toctree: ../stubs/
 
     least_busy
+    enable_backend_config_cache
+    disable_backend_config_cache
+    enable_properties_history_cache
+    disable_properties_history_cache
 
 Classes
 =======
@@ -56,10 +60,15 @@ Classes
     :toctree: ../stubs/
 
     AccountProvider
+    BackendHandle
     BackendJobLimit
+    CachePolicy
     IBMQBackend
     IBMQBackendService
     IBMQFactory
+    JobHandle
+    ProviderHandle
+    ThroughputSelector
 
 Exceptions
 ==========
@@ -82,7 +91,6 @@ Exceptions
 
 import logging
 from typing import List, Optional
-from datetime import datetime, timedelta
 
 from .ibmqfactory import IBMQFactory
 from .ibmqbackend import IBMQBackend, BaseBackend
@@ -90,6 +98,12 @@ from .job import IBMQJob
 from .managed import IBMQJobManager
 from .accountprovider import AccountProvider
 from .backendjoblimit import BackendJobLimit
+from .cachepolicy import CachePolicy
+from .handles import ProviderHandle, BackendHandle, JobHandle
+from .backendcache import enable_backend_config_cache, disable_backend_config_cache
+from .backendstatus import available_backends
+from .backendselector import ThroughputSelector
+from .propertieshistory import enable_properties_history_cache, disable_properties_history_cache
 from .exceptions import *
 from .ibmqbackendservice import IBMQBackendService
 from .utils.utils import setup_logger
@@ -114,7 +128,9 @@ QISKIT_IBMQ_PROVIDER_LOG_FILE = 'QISKIT_IBMQ_PROVIDER_LOG_FILE'
 
 def least_busy(
         backends: List[BaseBackend],
-        reservation_lookahead: Optional[int] = 60
+        reservation_lookahead: Optional[int] = 60,
+        max_status_age: Optional[float] = None,
+        max_workers: int = 8
 ) -> BaseBackend:
     """Return the least busy backend from a list.
 
@@ -122,12 +138,19 @@ def least_busy(
     have a ``pending_jobs`` in their ``status``. Note that local
     backends may not have this attribute.
 
+    The status of the backends is retrieved once per backend, with
+    concurrent queries, and so are the reservations of the operational
+    backends.
+
     Args:
         backends: The backends to choose from.
         reservation_lookahead: A backend is considered unavailable if it
             has reservations in the next ``n`` minutes, where ``n`` is
             the value of ``reservation_lookahead``.
             If ``None``, reservations are not taken into consideration.
+        max_status_age: If set, the status of a backend retrieved at most
+            this many seconds ago is reused instead of being queried again.
+        max_workers: Maximum number of concurrent queries.
 
     Returns:
         The backend with the fewest number of pending jobs.
@@ -141,23 +164,11 @@ def least_busy(
         raise IBMQError('Unable to find the least_busy '
                         'backend from an empty list.') from None
     try:
-        candidates = []
-        now = datetime.now()
-        for back in backends:
-            if not back.status().operational:
-                continue
-            if reservation_lookahead and isinstance(back, IBMQBackend):
-                end_time = now + timedelta(minutes=reservation_lookahead)
-                try:
-                    if back.reservations(now, end_time):
-                        continue
-                except Exception as err:  # pylint: disable=broad-except
-                    logger.warning("Unable to find backend reservation information. "
-                                   "It will not be taken into consideration. %s", str(err))
-            candidates.append(back)
+        candidates = available_backends(backends, reservation_lookahead,
+                                        max_status_age=max_status_age, max_workers=max_workers)
         if not candidates:
             raise IBMQError('No backend matches the criteria.')
-        return min(candidates, key=lambda b: b.status().pending_jobs)
+        return min(candidates, key=lambda candidate: candidate[1].pending_jobs)[0]
     except AttributeError as ex:
         raise IBMQError('A backend in the list does not have the `pending_jobs` '
                         'attribute in its status.') from ex
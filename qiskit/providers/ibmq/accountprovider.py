@@ -14,8 +14,10 @@
 
 """Provider for a single IBM Quantum Experience account."""
 
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Union
 from collections import OrderedDict
 
 from qiskit.providers import BaseProvider  # type: ignore[attr-defined]
@@ -23,8 +25,10 @@ from qiskit.providers.models import (QasmBackendConfiguration,
                                      PulseBackendConfiguration)
 
 from .api.clients import AccountClient
-from .ibmqbackend import IBMQBackend, IBMQSimulator
+from .ibmqbackend import IBMQBackend, IBMQSimulator, IBMQRetiredBackend
 from .credentials import Credentials
+from .backendcache import (backend_config_cache, backend_config_cache_key,
+                           BACKEND_INTERN_TABLE, raw_digest)
 from .ibmqbackendservice import IBMQBackendService
 from .utils.json_decoder import decode_backend_configuration
 from .random.ibmqrandomservice import IBMQRandomService
@@ -89,8 +93,13 @@ class AccountProvider(BaseProvider):
                                          credentials,
                                          **credentials.connection_parameters())
 
-        # Initialize the internal list of backends.
-        self._backends = self._discover_remote_backends()
+        # Backends are discovered lazily, from the raw configurations.
+        self._raw_configs = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._backend_instances = OrderedDict()  # type: Dict[str, IBMQBackend]
+        self._all_backends_discovered = False
+        self._retired_backends = {}  # type: Dict[str, IBMQRetiredBackend]
+        self._discovery_lock = threading.RLock()
+        self._revalidate_configs = True
         self.backends = IBMQBackendService(self)  # type: ignore[assignment]
 
         # Initialize other services.
@@ -107,6 +116,18 @@ class AccountProvider(BaseProvider):
         # replaced by a `IBMQBackendService` instance.
         pass
 
+    @property
+    def _backends(self) -> Dict[str, IBMQBackend]:
+        """Return all the remote backends, keyed by backend name."""
+        return self._discover_remote_backends()
+
+    @_backends.setter
+    def _backends(self, backends: Dict[str, IBMQBackend]) -> None:
+        """Replace the remote backends."""
+        with self._discovery_lock:
+            self._backend_instances = backends
+            self._all_backends_discovered = True
+
     def _discover_remote_backends(self, timeout: Optional[float] = None) -> Dict[str, IBMQBackend]:
         """Return the remote backends available for this provider.
 
@@ -117,35 +138,238 @@ class AccountProvider(BaseProvider):
         Returns:
             A dict of the remote backend instances, keyed by backend name.
         """
-        ret = OrderedDict()  # type: ignore[var-annotated]
-        configs_list = self._api_client.list_backends(timeout=timeout)
+        with self._discovery_lock:
+            if self._all_backends_discovered:
+                return self._backend_instances
+
+            ret = OrderedDict()  # type: ignore[var-annotated]
+            for backend_name, raw_config in self._raw_backend_configs(timeout).items():
+                backend = self._backend_instances.get(backend_name) or \
+                    self._backend_from_raw_config(raw_config)
+                if backend is not None:
+                    ret[backend_name] = backend
+
+            self._backend_instances = ret
+            self._all_backends_discovered = True
+            return ret
+
+    def _get_remote_backend(
+            self,
+            name: str,
+            timeout: Optional[float] = None
+    ) -> Optional[IBMQBackend]:
+        """Return a single remote backend, instantiating only that backend.
+
+        Args:
+            name: Name of the backend.
+            timeout: Maximum number of seconds to wait for the discovery of
+                remote backends.
+
+        Returns:
+            The backend instance, or ``None`` if there is no backend
+            with that name.
+        """
+        with self._discovery_lock:
+            backend = self._backend_instances.get(name)
+            if backend is not None or self._all_backends_discovered:
+                return backend
+
+            raw_config = self._raw_backend_configs(timeout).get(name)
+            if raw_config is None:
+                return None
+            backend = self._backend_from_raw_config(raw_config)
+            if backend is not None:
+                self._backend_instances[name] = backend
+            return backend
+
+    def _add_remote_backend(self, raw_config: Dict[str, Any]) -> Optional[IBMQBackend]:
+        """Return a remote backend from its raw configuration, if not instantiated yet.
+
+        The other backends are not discovered.
+
+        Args:
+            raw_config: Raw configuration of the backend. It is left unchanged.
+
+        Returns:
+            The backend instance, or ``None`` if the configuration is invalid.
+        """
+        name = raw_config.get('backend_name')
+        with self._discovery_lock:
+            backend = self._backend_instances.get(name)
+            if backend is None and not self._all_backends_discovered:
+                backend = self._backend_from_raw_config(raw_config)
+                if backend is not None:
+                    self._backend_instances[name] = backend
+            return backend
+
+    def _get_job_backend(self, name: str) -> IBMQBackend:
+        """Return the backend with the given name, for jobs submitted to it.
+
+        Args:
+            name: Name of the backend.
+
+        Returns:
+            The backend with the given name, or an ``IBMQRetiredBackend``
+            if the backend is no longer available to this provider. Retired
+            backends are created once per name.
+        """
+        backend = self._get_remote_backend(name)
+        if backend is not None:
+            return backend
+
+        with self._discovery_lock:
+            retired = self._retired_backends.get(name)
+            if retired is None:
+                retired = IBMQRetiredBackend.from_name(name, self, self.credentials,
+                                                       self._api_client)
+                self._retired_backends[name] = retired
+            return retired
+
+    def _raw_backend_configs(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Return the raw configurations of the remote backends.
+
+        The configurations are read from the disk cache, if enabled, and
+        revalidated in a background thread, unless revalidation is disabled
+        for this provider. Otherwise they are downloaded.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the download of the
+                configurations.
+
+        Returns:
+            The raw configurations, keyed by backend name.
+        """
+        with self._discovery_lock:
+            if self._raw_configs is not None:
+                return self._raw_configs
+
+            disk_cache = backend_config_cache()
+            cached = disk_cache.get(backend_config_cache_key(self.credentials)) \
+                if disk_cache else None
+            if isinstance(cached, list):
+                self._raw_configs = self._index_raw_configs(cached)
+                if self._revalidate_configs:
+                    threading.Thread(target=self._revalidate_raw_configs, daemon=True,
+                                     name='ibmq_backend_configs_{}'.format(
+                                         self.credentials.unique_id())).start()
+            else:
+                configs_list = self._api_client.list_backends(timeout=timeout)
+                self._raw_configs = self._index_raw_configs(configs_list)
+                if disk_cache:
+                    disk_cache.put(backend_config_cache_key(self.credentials), configs_list)
+            return self._raw_configs
+
+    def _revalidate_raw_configs(self) -> None:
+        """Download the raw configurations and refresh the cached ones."""
+        try:
+            configs_list = self._api_client.list_backends()
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.debug('Unable to revalidate the backend configurations of %s: %s',
+                         self.credentials.unique_id(), ex)
+            return
+
+        disk_cache = backend_config_cache()
+        if disk_cache:
+            disk_cache.put(backend_config_cache_key(self.credentials), configs_list)
+
+        raw_configs = self._index_raw_configs(configs_list)
+        with self._discovery_lock:
+            if raw_configs == self._raw_configs:
+                return
+            previous, self._raw_configs = self._raw_configs or {}, raw_configs
+            for backend_name, backend in list(self._backend_instances.items()):
+                raw_config = raw_configs.get(backend_name)
+                if raw_config is None:
+                    # The backend is no longer available.
+                    del self._backend_instances[backend_name]
+                    continue
+                if raw_config == previous.get(backend_name):
+                    continue
+                try:
+                    backend._configuration = self._decode_raw_config(raw_config)
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.debug('Unable to refresh the configuration of %s: %s',
+                                 backend_name, ex)
+            if self._all_backends_discovered:
+                for backend_name, raw_config in raw_configs.items():
+                    if backend_name not in self._backend_instances:
+                        backend = self._backend_from_raw_config(raw_config)
+                        if backend is not None:
+                            self._backend_instances[backend_name] = backend
+        logger.debug('Refreshed the backend configurations of %s.',
+                     self.credentials.unique_id())
+
+    @staticmethod
+    def _index_raw_configs(configs_list: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """Index raw backend configurations by backend name.
+
+        Args:
+            configs_list: Raw configurations, as returned by the server.
+
+        Returns:
+            The raw configurations, keyed by backend name, in server order.
+        """
+        raw_configs = OrderedDict()  # type: ignore[var-annotated]
         for raw_config in configs_list:
             # Make sure the raw_config is of proper type
             if not isinstance(raw_config, dict):
                 logger.warning("An error occurred when retrieving backend "
                                "information. Some backends might not be available.")
                 continue
+            backend_name = raw_config.get('backend_name', raw_config.get('name', 'unknown'))
+            raw_configs[backend_name] = raw_config
+        return raw_configs
+
+    def _backend_from_raw_config(self, raw_config: Dict[str, Any]) -> Optional[IBMQBackend]:
+        """Instantiate a backend from its raw configuration.
+
+        Args:
+            raw_config: Raw configuration of the backend. It is left unchanged.
 
-            try:
-                decode_backend_configuration(raw_config)
-                if raw_config.get('open_pulse', False):
-                    config = PulseBackendConfiguration.from_dict(raw_config)
-                else:
-                    config = QasmBackendConfiguration.from_dict(raw_config)
-                backend_cls = IBMQSimulator if config.simulator else IBMQBackend
-                ret[config.backend_name] = backend_cls(
-                    configuration=config,
-                    provider=self,
-                    credentials=self.credentials,
-                    api_client=self._api_client)
-            except Exception as ex:  # pylint: disable=broad-except
-                logger.warning(
-                    'Remote backend "%s" could not be instantiated due to an '
-                    'invalid config: %s: %s',
-                    raw_config.get('backend_name', raw_config.get('name', 'unknown')),
-                    type(ex).__name__, ex)
-
-        return ret
+        Returns:
+            The backend instance, or ``None`` if the configuration is invalid.
+        """
+        try:
+            config = self._decode_raw_config(raw_config)
+            backend_cls = IBMQSimulator if config.simulator else IBMQBackend
+            return backend_cls(
+                configuration=config,
+                provider=self,
+                credentials=self.credentials,
+                api_client=self._api_client)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning(
+                'Remote backend "%s" could not be instantiated due to an '
+                'invalid config: %s: %s',
+                raw_config.get('backend_name', raw_config.get('name', 'unknown')),
+                type(ex).__name__, ex)
+            return None
+
+    @staticmethod
+    def _decode_raw_config(
+            raw_config: Dict[str, Any]
+    ) -> Union[QasmBackendConfiguration, PulseBackendConfiguration]:
+        """Decode a raw backend configuration.
+
+        Identical configurations, as seen by different providers, are decoded
+        once and shared through the backend intern table.
+
+        Args:
+            raw_config: Raw configuration of the backend. It is left unchanged.
+
+        Returns:
+            The backend configuration.
+        """
+        def _decode() -> Union[QasmBackendConfiguration, PulseBackendConfiguration]:
+            decoded = copy.deepcopy(raw_config)
+            decode_backend_configuration(decoded)
+            if decoded.get('open_pulse', False):
+                return PulseBackendConfiguration.from_dict(decoded)
+            return QasmBackendConfiguration.from_dict(decoded)
+
+        key = ('configuration', raw_config.get('backend_name'),
+               raw_config.get('backend_version'), raw_digest(raw_config))
+        return BACKEND_INTERN_TABLE.intern(key, _decode)
 
     @property
     def experiment(self) -> ExperimentService:
@@ -17,13 +17,16 @@
 import asyncio
 import logging
 import time
+import json
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime
 
 from qiskit.providers.ibmq.apiconstants import (API_JOB_FINAL_STATES, ApiJobStatus,
                                                 ApiJobShareLevel)
 from qiskit.providers.ibmq.utils.utils import RefreshQueue
+from qiskit.providers.ibmq.utils.timing import PhaseTimer
+from qiskit.providers.ibmq.utils.json_encoder import IQXJsonEncoder
 from qiskit.providers.ibmq.credentials import Credentials
 
 from ..exceptions import (RequestsApiError, WebsocketError,
@@ -160,7 +163,8 @@ class AccountClient(BaseClient):
             limit: int = 10,
             skip: int = 0,
             descending: bool = True,
-            extra_filter: Optional[Dict[str, Any]] = None
+            extra_filter: Optional[Dict[str, Any]] = None,
+            fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Return a list of job data, with filtering and pagination.
 
@@ -172,29 +176,34 @@ class AccountClient(BaseClient):
             skip: Offset for the items to return.
             descending: Whether the jobs should be in descending order.
             extra_filter: Additional filtering passed to the query.
+            fields: Names of the job fields to return, as used by the server.
+                If ``None``, all the fields are returned.
 
         Returns:
             A list of job data.
         """
         return self.account_api.jobs(limit=limit, skip=skip, descending=descending,
-                                     extra_filter=extra_filter)
+                                     extra_filter=extra_filter, fields=fields)
 
     def job_submit(
             self,
             backend_name: str,
-            qobj_dict: Dict[str, Any],
+            qobj_dict: Union[Dict[str, Any], str, bytes],
             job_name: Optional[str] = None,
             job_share_level: Optional[ApiJobShareLevel] = None,
-            job_tags: Optional[List[str]] = None
+            job_tags: Optional[List[str]] = None,
+            timer: Optional[PhaseTimer] = None
     ) -> Dict[str, Any]:
         """Submit a ``Qobj`` to the backend.
 
         Args:
             backend_name: The name of the backend.
-            qobj_dict: The ``Qobj`` to be executed, as a dictionary.
+            qobj_dict: The ``Qobj`` to be executed, as a dictionary or
+                already encoded as JSON.
             job_name: Custom name to be assigned to the job.
             job_share_level: Level the job should be shared at.
             job_tags: Tags to be assigned to the job.
+            timer: Timer used to record the duration of each submission phase.
 
         Returns:
             Job data.
@@ -202,33 +211,128 @@ class AccountClient(BaseClient):
         Raises:
             RequestsApiError: If an error occurred communicating with the server.
         """
+        timer = timer or PhaseTimer()
+
+        if isinstance(qobj_dict, (str, bytes)):
+            qobj_data = qobj_dict
+        else:
+            with timer.phase('submit.json_encode'):
+                qobj_data = json.dumps(qobj_dict, cls=IQXJsonEncoder)
+
+        # Create a remote job instance on the server.
+        with timer.phase('submit.create_remote_job'):
+            job_id, upload_url = self.job_create(
+                backend_name,
+                job_name=job_name,
+                job_share_level=job_share_level,
+                job_tags=job_tags)
+
+        # Upload the Qobj to object storage.
+        with timer.phase('submit.upload'):
+            self.job_upload_qobj(job_id, upload_url, qobj_data)
+        # Notify the API via the callback.
+        with timer.phase('submit.callback_upload'):
+            return self.job_callback_upload(job_id)
+
+    def job_create(
+            self,
+            backend_name: str,
+            job_name: Optional[str] = None,
+            job_share_level: Optional[ApiJobShareLevel] = None,
+            job_tags: Optional[List[str]] = None
+    ) -> Tuple[str, str]:
+        """Create a job on the server, without its ``Qobj``.
+
+        This is the first step of :meth:`job_submit()`. The job does not run
+        until its ``Qobj`` is uploaded with :meth:`job_upload_qobj()` and the
+        upload is acknowledged with :meth:`job_callback_upload()`.
+
+        Args:
+            backend_name: The name of the backend.
+            job_name: Custom name to be assigned to the job.
+            job_share_level: Level the job should be shared at.
+            job_tags: Tags to be assigned to the job.
+
+        Returns:
+            The job ID and the URL the ``Qobj`` should be uploaded to.
+
+        Raises:
+            RequestsApiError: If an error occurred communicating with the server.
+            ApiIBMQProtocolError: If unexpected data is received from the server.
+        """
         # Check for the job share level.
         _job_share_level = job_share_level.value if job_share_level else None
 
-        # Create a remote job instance on the server.
         job_info = self.account_api.create_remote_job(
             backend_name,
             job_name=job_name,
             job_share_level=_job_share_level,
             job_tags=job_tags)
 
-        # Get the upload URL.
-        job_id = job_info['id']
-        upload_url = job_info['objectStorageInfo']['uploadUrl']
+        try:
+            return job_info['id'], job_info['objectStorageInfo']['uploadUrl']
+        except (KeyError, TypeError) as err:
+            raise ApiIBMQProtocolError(
+                'Unexpected return value received from the server: {}'.format(str(err))) from err
+
+    def job_upload_qobj(
+            self,
+            job_id: str,
+            upload_url: str,
+            qobj_data: Union[Dict[str, Any], str, bytes]
+    ) -> None:
+        """Upload the ``Qobj`` of a job created with :meth:`job_create()`.
+
+        The job is cancelled if the upload fails, so it does not remain on
+        the server without a ``Qobj``.
+
+        Args:
+            job_id: The ID of the job.
+            upload_url: The URL returned by :meth:`job_create()`.
+            qobj_data: The ``Qobj``, as a dictionary or encoded as JSON.
+
+        Raises:
+            RequestsApiError: If an error occurred communicating with the server.
+        """
         job_api = self.account_api.job(job_id)
+        try:
+            _ = job_api.put_object_storage(upload_url, qobj_data)
+        except RequestsApiError:
+            self._job_cancel_quietly(job_id)
+            raise
+
+    def job_callback_upload(self, job_id: str) -> Dict[str, Any]:
+        """Notify the server that the ``Qobj`` of a job was uploaded.
+
+        The job is cancelled if the notification fails, so it does not remain
+        on the server without running.
+
+        Args:
+            job_id: The ID of the job.
 
+        Returns:
+            Job data.
+
+        Raises:
+            RequestsApiError: If an error occurred communicating with the server.
+        """
         try:
-            # Upload the Qobj to object storage.
-            _ = job_api.put_object_storage(upload_url, qobj_dict)
-            # Notify the API via the callback.
-            response = job_api.callback_upload()
-            return response['job']
+            response = self.account_api.job(job_id).callback_upload()
         except RequestsApiError:
-            try:
-                job_api.cancel()    # Cancel the job so it doesn't become a phantom job.
-            except RequestsApiError:
-                pass
+            self._job_cancel_quietly(job_id)
             raise
+        return response['job']
+
+    def _job_cancel_quietly(self, job_id: str) -> None:
+        """Cancel a job that failed to be submitted, ignoring any error.
+
+        Args:
+            job_id: The ID of the job.
+        """
+        try:
+            self.account_api.job(job_id).cancel()   # So it doesn't become a phantom job.
+        except RequestsApiError:
+            pass
 
     def job_download_qobj(self, job_id: str, use_object_storage: bool) -> Dict:
         """Retrieve and return a ``Qobj``.
@@ -262,12 +366,18 @@ class AccountClient(BaseClient):
         # Download the result from object storage.
         return job_api.get_object_storage(download_url)
 
-    def job_result(self, job_id: str, use_object_storage: bool) -> Dict:
+    def job_result(
+            self,
+            job_id: str,
+            use_object_storage: bool,
+            timer: Optional[PhaseTimer] = None
+    ) -> Dict:
         """Retrieve and return the job result.
 
         Args:
             job_id: The ID of the job.
             use_object_storage: ``True`` if object storage should be used.
+            timer: Timer used to record the duration of each retrieval phase.
 
         Returns:
             Job result.
@@ -275,20 +385,23 @@ class AccountClient(BaseClient):
         Raises:
             ApiIBMQProtocolError: If unexpected data is received from the server.
         """
+        timer = timer or PhaseTimer()
         if use_object_storage:
-            return self._job_result_object_storage(job_id)
+            return self._job_result_object_storage(job_id, timer)
 
         try:
-            return self.job_get(job_id)['qObjectResult']
+            with timer.phase('result.download'):
+                return self.job_get(job_id)['qObjectResult']
         except KeyError as err:
             raise ApiIBMQProtocolError(
                 'Unexpected return value received from the server: {}'.format(str(err))) from err
 
-    def _job_result_object_storage(self, job_id: str) -> Dict:
+    def _job_result_object_storage(self, job_id: str, timer: PhaseTimer) -> Dict:
         """Retrieve and return the job result using object storage.
 
         Args:
             job_id: The ID of the job.
+            timer: Timer used to record the duration of each retrieval phase.
 
         Returns:
             Job result.
@@ -296,14 +409,17 @@ class AccountClient(BaseClient):
         job_api = self.account_api.job(job_id)
 
         # Get the download URL.
-        download_url = job_api.result_url()['url']
+        with timer.phase('result.result_url'):
+            download_url = job_api.result_url()['url']
 
         # Download the result from object storage.
-        result_response = job_api.get_object_storage(download_url)
+        with timer.phase('result.download'):
+            result_response = job_api.get_object_storage(download_url)
 
         # Notify the API via the callback
         try:
-            _ = job_api.callback_download()
+            with timer.phase('result.callback_download'):
+                _ = job_api.callback_download()
         except (RequestsApiError, ValueError) as ex:
             logger.warning('An error occurred while sending download completion acknowledgement: '
                            '%s', ex)
@@ -97,7 +97,8 @@ class Account(RestAdapterBase):
             limit: int = 10,
             skip: int = 0,
             descending: bool = True,
-            extra_filter: Dict[str, Any] = None
+            extra_filter: Dict[str, Any] = None,
+            fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Return a list of job information.
 
@@ -106,6 +107,8 @@ class Account(RestAdapterBase):
             skip: Offset for the items to return.
             descending: Whether the jobs should be in descending order.
             extra_filter: Additional filtering passed to the query.
+            fields: Names of the job fields to return. If ``None``, all the
+                fields are returned.
 
         Returns:
             JSON response.
@@ -121,6 +124,8 @@ class Account(RestAdapterBase):
         }
         if extra_filter:
             query['where'] = extra_filter
+        if fields:
+            query['fields'] = {field: True for field in fields}
 
         if logger.getEffectiveLevel() is logging.DEBUG:
             logger.debug("Endpoint: %s. Method: GET. Request Data: {'filter': %s}",
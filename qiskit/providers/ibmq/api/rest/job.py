@@ -176,17 +176,25 @@ class Job(RestAdapterBase):
         url = self.get_url('upload_url')
         return self.session.get(url).json()
 
-    def put_object_storage(self, url: str, qobj_dict: Dict[str, Any]) -> str:
+    def put_object_storage(
+            self,
+            url: str,
+            qobj_dict: Union[Dict[str, Any], str, bytes]
+    ) -> str:
         """Upload a ``Qobj`` via object storage.
 
         Args:
             url: Object storage URL.
-            qobj_dict: The ``Qobj`` to be uploaded, in dictionary form.
+            qobj_dict: The ``Qobj`` to be uploaded, in dictionary form or
+                already encoded as JSON.
 
         Returns:
             Text response, which is empty if the request was successful.
         """
-        data = json.dumps(qobj_dict, cls=json_encoder.IQXJsonEncoder)
+        if isinstance(qobj_dict, (str, bytes)):
+            data = qobj_dict
+        else:
+            data = json.dumps(qobj_dict, cls=json_encoder.IQXJsonEncoder)
         logger.debug('Uploading to object storage.')
         response = self.session.put(url, data=data, bare=True, timeout=600,
                                     headers={'Content-Type': 'application/json'})
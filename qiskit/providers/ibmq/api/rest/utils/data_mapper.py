@@ -16,19 +16,104 @@
 
 import re
 import keyword
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
+_NON_IDENTIFIER_RE = re.compile(r"\W|^(?=\d)", re.ASCII)
+_CAMEL_CASE_RE = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)(?<!_)[A-Z](?=[a-z]))')
 
-def map_job_response(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Map the job information fields.
 
-    Args:
-        data: Data to be mapped.
+class ResponseMapper:
+    """Key mapper compiled for a single response schema.
 
-    Returns:
-        Mapped data.
+    The mapper keeps a translation table from the server field names to the
+    Python identifiers used by the provider. The table is seeded with the
+    explicit field renames of the schema and grows as new field names are
+    seen, so most field names are converted only once per process. At most
+    ``_max_learned_keys`` field names are added to the table, so unexpected
+    server fields cannot grow it without bound; any further field names are
+    converted on each use.
     """
-    field_map = {
+
+    _max_learned_keys = 256
+    """Maximum number of field names added to the table as they are seen."""
+
+    def __init__(
+            self,
+            field_map: Optional[Dict[str, str]] = None,
+            nested: Optional[Dict[str, Tuple[str, 'ResponseMapper']]] = None
+    ) -> None:
+        """ResponseMapper constructor.
+
+        Args:
+            field_map: Mapper of selected field names to rename.
+            nested: Fields whose values are objects that need to be mapped
+                with a different schema, in the format
+                ``{field_name: (new_field_name, mapper)}``. Nested objects
+                are only kept if they are not empty.
+        """
+        self._table = dict(field_map or {})  # type: Dict[str, str]
+        self._max_table_size = len(self._table) + self._max_learned_keys
+        self._nested = nested or {}
+
+    def translate(self, key: str) -> str:
+        """Return the new name of a field.
+
+        Args:
+            key: Name of the field in the server response.
+
+        Returns:
+            The new name of the field.
+        """
+        try:
+            return self._table[key]
+        except KeyError:
+            new_key = to_python_identifier(key)
+            if len(self._table) < self._max_table_size:
+                self._table[key] = new_key
+            return new_key
+
+    def map(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map the keys of the input data in place, in a single pass.
+
+        Args:
+            data: Data to be mapped.
+
+        Returns:
+            Mapped data.
+        """
+        table = self._table
+        mapped = {}
+        nested_data = []
+        for key, value in data.items():
+            if key in self._nested:
+                nested_data.append((key, value))
+                continue
+            try:
+                mapped[table[key]] = value
+            except KeyError:
+                mapped[self.translate(key)] = value
+
+        for key, value in nested_data:
+            new_key, mapper = self._nested[key]
+            if value:
+                mapped[new_key] = mapper.map(value)
+
+        data.clear()
+        data.update(mapped)
+        return data
+
+
+_INFO_QUEUE_MAPPER = ResponseMapper({
+    'estimatedStartTime': 'estimated_start_time',
+    'estimatedCompleteTime': 'estimated_complete_time',
+    'hubPriority': 'hub_priority',
+    'groupPriority': 'group_priority',
+    'projectPriority': 'project_priority'
+})
+
+_JOB_RESPONSE_MAPPER = ResponseMapper(
+    {
         'id': 'job_id',
         'backend': '_backend_info',
         'creationDate': 'creation_date',
@@ -37,12 +122,58 @@ def map_job_response(data: Dict[str, Any]) -> Dict[str, Any]:
         'timePerStep': 'time_per_step',
         'shots': '_api_shots',
         'runMode': 'run_mode'
-    }
-    info_queue = map_info_queue(data.pop('infoQueue', {}))
-    dict_to_identifier(data, field_map)
-    if info_queue:
-        data['info_queue'] = info_queue
-    return data
+    },
+    nested={'infoQueue': ('info_queue', _INFO_QUEUE_MAPPER)})
+
+_JOB_FIELD_NAMES = {
+    'job_id': 'id',
+    'backend_name': 'backend',
+    'creation_date': 'creationDate',
+    'qobj': 'qObject',
+    'result': 'qObjectResult',
+    'time_per_step': 'timePerStep',
+    'run_mode': 'runMode',
+    'info_queue': 'infoQueue',
+    'share_level': 'shareLevel',
+    'client_info': 'clientInfo'
+}
+
+_JOB_STATUS_RESPONSE_MAPPER = ResponseMapper(
+    nested={'infoQueue': ('info_queue', _INFO_QUEUE_MAPPER)})
+
+_JOBS_LIMIT_RESPONSE_MAPPER = ResponseMapper({
+    'maximumJobs': 'maximum_jobs',
+    'runningJobs': 'running_jobs'
+})
+
+
+def map_job_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the job information fields.
+
+    Args:
+        data: Data to be mapped.
+
+    Returns:
+        Mapped data.
+    """
+    return _JOB_RESPONSE_MAPPER.map(data)
+
+
+def job_api_field_name(name: str) -> str:
+    """Return the server name of a job field.
+
+    Args:
+        name: Name of the field, either as used by the server or as the
+            corresponding ``IBMQJob`` attribute, such as ``time_per_step``.
+
+    Returns:
+        The name of the field used by the server.
+    """
+    try:
+        return _JOB_FIELD_NAMES[name]
+    except KeyError:
+        head, *tail = name.split('_')
+        return head + ''.join(word.capitalize() for word in tail)
 
 
 def map_info_queue(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -54,15 +185,7 @@ def map_info_queue(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Mapped data.
     """
-    field_map = {
-        'estimatedStartTime': 'estimated_start_time',
-        'estimatedCompleteTime': 'estimated_complete_time',
-        'hubPriority': 'hub_priority',
-        'groupPriority': 'group_priority',
-        'projectPriority': 'project_priority'
-    }
-    dict_to_identifier(data, field_map)
-    return data
+    return _INFO_QUEUE_MAPPER.map(data)
 
 
 def map_job_status_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -74,11 +197,7 @@ def map_job_status_response(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Mapped data.
     """
-    info_queue = map_info_queue(data.pop('infoQueue', {}))
-    dict_to_identifier(data)
-    if info_queue:
-        data['info_queue'] = info_queue
-    return data
+    return _JOB_STATUS_RESPONSE_MAPPER.map(data)
 
 
 def map_jobs_limit_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,12 +209,7 @@ def map_jobs_limit_response(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Mapped data.
     """
-    field_map = {
-        'maximumJobs': 'maximum_jobs',
-        'runningJobs': 'running_jobs'
-    }
-    dict_to_identifier(data, field_map)
-    return data
+    return _JOBS_LIMIT_RESPONSE_MAPPER.map(data)
 
 
 def rename_fields(data: Dict[str, Any], mapper: dict) -> None:
@@ -134,6 +248,7 @@ def dict_to_identifier(data: Dict[str, Any], mapper: Optional[dict] = None) -> N
         data[new_key] = data.pop(key)
 
 
+@lru_cache(maxsize=1024)
 def to_python_identifier(name: str) -> str:
     """Convert a name to a valid Python identifier.
 
@@ -145,12 +260,11 @@ def to_python_identifier(name: str) -> str:
     """
     # Python identifiers can only contain alphanumeric characters
     # and underscores and cannot start with a digit.
-    pattern = re.compile(r"\W|^(?=\d)", re.ASCII)
     if not name.isidentifier():
-        name = re.sub(pattern, '_', name)
+        name = _NON_IDENTIFIER_RE.sub('_', name)
 
     # Convert to snake case
-    name = re.sub('((?<=[a-z0-9])[A-Z]|(?!^)(?<!_)[A-Z](?=[a-z]))', r'_\1', name).lower()
+    name = _CAMEL_CASE_RE.sub(r'_\1', name).lower()
 
     while keyword.iskeyword(name):
         name += '_'
@@ -68,3 +68,14 @@ class ApiJobShareLevel(enum.Enum):
     GROUP = 'group'
     PROJECT = 'project'
     NONE = 'none'
+
+
+JOB_REQUIRED_FIELDS = ('id', 'status', 'creationDate', 'kind', 'backend')
+"""Job fields always requested when retrieving jobs, needed to build a job."""
+
+JOB_FIELDS_PRESETS = {
+    'status_only': JOB_REQUIRED_FIELDS,
+    'summary': JOB_REQUIRED_FIELDS + ('name', 'tags', 'shareLevel', 'runMode',
+                                      'timePerStep', 'infoQueue', 'error')
+}
+"""Named sets of job fields that can be requested when retrieving jobs."""
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Caches for backend information shared by providers."""
+
+import json
+import hashlib
+from threading import Lock
+from weakref import WeakValueDictionary
+from typing import Optional, Callable, Tuple, NamedTuple, Dict, Any, TypeVar
+
+from .credentials import Credentials
+from .utils.diskcache import DiskCache
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+
+BACKEND_CONFIG_CACHE_VERSION = 1
+"""Format version of the on-disk backend configuration entries."""
+
+_config_disk_cache = None  # type: Optional[DiskCache]
+
+
+def enable_backend_config_cache(directory: Optional[str] = None) -> None:
+    """Cache the raw backend configurations of providers on disk.
+
+    Once enabled, providers read the configurations of their backends from
+    the disk instead of downloading them, and revalidate the cached
+    configurations against the server in a background thread. The cache is
+    keyed by the URL, hub, group and project of the provider.
+
+    Args:
+        directory: Root directory of the cache. If ``None``, the directory
+            set by the ``QISKIT_IBMQ_PROVIDER_CACHE_DIR`` environment variable
+            or ``$HOME/.qiskit/ibmq_cache`` is used.
+    """
+    global _config_disk_cache  # pylint: disable=global-statement
+    _config_disk_cache = DiskCache('backend_configs', directory,
+                                   version=BACKEND_CONFIG_CACHE_VERSION)
+
+
+def disable_backend_config_cache() -> None:
+    """Stop caching the raw backend configurations on disk.
+
+    Entries already on disk are left untouched.
+    """
+    global _config_disk_cache  # pylint: disable=global-statement
+    _config_disk_cache = None
+
+
+def backend_config_cache() -> Optional[DiskCache]:
+    """Return the disk cache for raw backend configurations.
+
+    Returns:
+        The disk cache, or ``None`` if it is not enabled.
+    """
+    return _config_disk_cache
+
+
+def backend_config_cache_key(credentials: Credentials) -> str:
+    """Return the cache key of the backend configurations of a provider.
+
+    Args:
+        credentials: Credentials of the provider.
+
+    Returns:
+        The cache key.
+    """
+    return '{}_{}_{}_{}'.format(credentials.base_url, credentials.hub,
+                                credentials.group, credentials.project)
+
+
+class InternTableInfo(NamedTuple):
+    """Statistics of a :class:`BackendInternTable`."""
+    hits: int
+    misses: int
+    entries: int
+
+
+class BackendInternTable:
+    """Process-wide table of immutable backend objects.
+
+    The same backend is usually available through several providers, one
+    per hub, group and project, which would otherwise each decode and hold
+    their own copy of its configuration, properties and pulse defaults.
+    The table keeps a single instance of each of these objects per backend
+    name and version or timestamp, for as long as any backend still
+    references it. Objects found in the table are not decoded again.
+    """
+
+    def __init__(self) -> None:
+        """BackendInternTable constructor."""
+        self._objects = WeakValueDictionary()  # type: WeakValueDictionary[Tuple, Any]
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    def intern(self, key: Tuple, build: Callable[[], T]) -> T:
+        """Return the object stored for a key, building it if needed.
+
+        Args:
+            key: Key of the object, including the backend name and the
+                version or timestamp of the object.
+            build: Function that builds the object, called if the key is not
+                in the table.
+
+        Returns:
+            The shared object.
+        """
+        with self._lock:
+            obj = self._objects.get(key)
+            if obj is not None:
+                self._hits += 1
+                return obj
+
+        obj = build()
+        with self._lock:
+            self._misses += 1
+            shared = self._objects.get(key)
+            if shared is not None:
+                # Built concurrently by another thread.
+                return shared
+            try:
+                self._objects[key] = obj
+            except TypeError:
+                # Not weakly referenceable, e.g. ``None``.
+                pass
+        return obj
+
+    def cache_info(self) -> InternTableInfo:
+        """Return the table statistics.
+
+        Returns:
+            The number of lookups that found an object, the number of objects
+            built, and the number of objects currently in the table.
+        """
+        with self._lock:
+            return InternTableInfo(self._hits, self._misses, len(self._objects))
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+BACKEND_INTERN_TABLE = BackendInternTable()
+"""Configurations, properties and pulse defaults shared by all backends in this process."""
+
+
+def raw_digest(raw_data: Dict[str, Any]) -> str:
+    """Return a digest of a raw JSON document returned by the server.
+
+    Args:
+        raw_data: The document.
+
+    Returns:
+        The hexadecimal SHA-1 digest of its canonical JSON encoding.
+    """
+    return hashlib.sha1(json.dumps(raw_data, sort_keys=True, default=str)
+                        .encode('utf-8')).hexdigest()
@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Backend selection based on the observed throughput of the backends."""
+
+import time
+import logging
+from collections import OrderedDict
+from concurrent import futures
+from queue import Queue, Empty
+from threading import Lock, RLock, Thread, current_thread
+from typing import Dict, List, Optional, Tuple, Union, Any
+
+from qiskit.providers.basebackend import BaseBackend  # type: ignore[attr-defined]
+from qiskit.providers.jobstatus import JobStatus, JOB_FINAL_STATES
+from qiskit.qobj import QasmQobj, PulseQobj
+
+from .job import IBMQJob
+from .job.exceptions import IBMQJobTimeoutError
+from .job.queueinfo import QueueInfo
+from .backendstatus import available_backends
+from .exceptions import IBMQError
+from .utils.converters import str_to_utc
+from .utils.diskcache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+BACKEND_THROUGHPUT_CACHE_VERSION = 1
+"""Format version of the throughput model stored on disk."""
+
+DEFAULT_SHOTS = 1024
+"""Number of shots assumed for a Qobj that does not specify it."""
+
+
+def qobj_workload(qobj: Union[QasmQobj, PulseQobj]) -> int:
+    """Return the size of a Qobj, as its total number of shots.
+
+    Args:
+        qobj: The Qobj.
+
+    Returns:
+        The number of experiments times the number of shots.
+    """
+    return len(qobj.experiments) * (getattr(qobj.config, 'shots', None) or DEFAULT_SHOTS)
+
+
+class ThroughputSelector:
+    """Select the backend expected to complete a job the soonest.
+
+    The selector keeps, for each backend, a rolling estimate of how fast its
+    queue drains, in jobs per second, and of how long it takes to run a job,
+    in seconds per shot. The estimates are exponentially weighted moving
+    averages of the samples taken from observed jobs:
+
+        * the queue position of a job and the time it was seen at that
+          position, together with the time it started running, taken from
+          :meth:`IBMQJob.time_per_step()`, give a drain rate sample.
+        * the time a job spent running divided by the number of shots in its
+          Qobj gives a runtime sample.
+
+    The predicted completion time of a job on a backend is then::
+
+        pending_jobs / drain_rate + seconds_per_shot * shots
+
+    The model is updated incrementally every time a job is observed, and
+    stored on disk, so that it is kept across sessions::
+
+        selector = ThroughputSelector()
+        backend = selector.select(provider.backends(simulator=False), qobj=qobj)
+        job = backend.run(qobj)
+        selector.track(job)
+
+    Note:
+        The model is written to disk after every finished job, and loaded
+        when the selector is created. Several processes can share the same directory,
+        but the updates of one process are only seen by the selectors created
+        after them.
+    """
+
+    _max_pending = 1000
+    """Maximum number of queued jobs waiting for a drain rate sample."""
+
+    _max_seen = 1000
+    """Maximum number of finished job IDs remembered to avoid counting a job twice."""
+
+    _track_timeout = 24 * 60 * 60
+    """Default maximum number of seconds a job is tracked for by :meth:`track()`."""
+
+    _save_interval = 60
+    """Minimum number of seconds between two writes of the model for queued jobs."""
+
+    def __init__(
+            self,
+            directory: Optional[str] = None,
+            smoothing: float = 0.2,
+            max_tracked: int = 8
+    ) -> None:
+        """ThroughputSelector constructor.
+
+        Args:
+            directory: Root directory of the disk caches. If ``None``, the
+                default cache directory is used.
+            smoothing: Weight given to a new sample in the moving averages,
+                between 0 and 1.
+            max_tracked: Maximum number of jobs tracked concurrently by
+                :meth:`track()`.
+
+        Raises:
+            IBMQError: If `smoothing` is not between 0 and 1.
+        """
+        if not 0 < smoothing <= 1:
+            raise IBMQError('The smoothing factor must be between 0 and 1, '
+                            'got {}.'.format(smoothing))
+        self._smoothing = smoothing
+        self._max_tracked = max_tracked
+        self._cache = DiskCache('backend_throughput', directory,
+                                version=BACKEND_THROUGHPUT_CACHE_VERSION)
+        self._lock = RLock()
+        self._save_lock = Lock()
+        self._last_save = time.monotonic()
+        self._version = 0
+        self._saved_version = 0
+        self._tracked = Queue()  # type: Queue
+        self._trackers = []  # type: List[Thread]
+
+        model = self._cache.get('model') or {}
+        self._backends = model.get('backends', {})  # type: Dict[str, Dict[str, Any]]
+        self._pending = OrderedDict(
+            model.get('pending', []))  # type: OrderedDict[str, Dict[str, Any]]
+        self._seen = OrderedDict.fromkeys(model.get('seen', []))  # type: OrderedDict[str, None]
+
+    def estimates(self, backend_name: str) -> Dict[str, Any]:
+        """Return the current estimates for a backend.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            A dictionary with the ``drain_rate``, in jobs per second, and
+            ``seconds_per_shot`` estimates, ``None`` if unknown, and the
+            number of samples each estimate is based on.
+        """
+        with self._lock:
+            state = self._backends.get(backend_name, {})
+            return {'drain_rate': state.get('drain_rate'),
+                    'drain_samples': state.get('drain_samples', 0),
+                    'seconds_per_shot': state.get('seconds_per_shot'),
+                    'runtime_samples': state.get('runtime_samples', 0)}
+
+    def observe(
+            self,
+            job: IBMQJob,
+            job_status: Optional[JobStatus] = None,
+            queue_info: Optional[QueueInfo] = None
+    ) -> None:
+        """Update the model with the information of a job.
+
+        No query is made to the server. If `job_status` is not given, the job
+        status, queue information and time per step last retrieved by the job
+        are used. A queued job is remembered with its queue position, and a
+        finished job gives a drain rate sample, if it was seen in the queue,
+        and a runtime sample.
+
+        The model is written to disk after each finished job. Queued jobs are
+        written with it, or at most every ``_save_interval`` seconds.
+
+        Args:
+            job: The job to observe.
+            job_status: Status of the job, as passed to the callback of
+                :meth:`IBMQJob.wait_for_final_state()`.
+            queue_info: Queue information of the job, as passed to the
+                callback of :meth:`IBMQJob.wait_for_final_state()`. Only used
+                if `job_status` is given.
+        """
+        # pylint: disable=protected-access
+        job_id = job.job_id()
+        backend_name = job.backend().name()
+        if job_status is None:
+            job_status, queue_info = job._status, job._queue_info
+        status = job_status
+
+        snapshot = None
+        with self._lock:
+            if job_id in self._seen:
+                return
+            if status is JobStatus.QUEUED and queue_info and queue_info.position:
+                if job_id not in self._pending:
+                    self._pending[job_id] = {'backend': backend_name,
+                                             'position': queue_info.position,
+                                             'observed_at': time.time()}
+                    while len(self._pending) > self._max_pending:
+                        self._pending.popitem(last=False)
+                    snapshot = self._snapshot(force=False)
+            elif status in JOB_FINAL_STATES:
+                self._seen[job_id] = None
+                while len(self._seen) > self._max_seen:
+                    self._seen.popitem(last=False)
+                queued = self._pending.pop(job_id, None)
+
+                steps = job._time_per_step or {}
+                started = str_to_utc(steps.get('RUNNING'))
+                completed = str_to_utc(steps.get('COMPLETED'))
+                if queued and started:
+                    elapsed = started.timestamp() - queued['observed_at']
+                    if elapsed > 0:
+                        self._update(backend_name, 'drain_rate', queued['position'] / elapsed)
+                if status is JobStatus.DONE and started and completed and job._qobj:
+                    elapsed = (completed - started).total_seconds()
+                    if elapsed > 0:
+                        self._update(backend_name, 'seconds_per_shot',
+                                     elapsed / qobj_workload(job._qobj))
+                snapshot = self._snapshot(force=True)
+        self._save(snapshot)
+
+    def track(self, job: IBMQJob, timeout: Optional[float] = None) -> futures.Future:
+        """Observe a job, in the background, until it reaches a final state.
+
+        The jobs are waited for by at most `max_tracked` daemon threads, so
+        that tracking does not keep the interpreter alive. The other jobs wait
+        for their turn in a queue, and the threads stop once it is empty.
+
+        Args:
+            job: The job to track.
+            timeout: Maximum number of seconds to track the job for, counted
+                from this call. Defaults to one day.
+
+        Returns:
+            A future that completes when the job reaches a final state, or
+            when it is no longer tracked.
+        """
+        future = futures.Future()  # type: futures.Future
+        timeout = self._track_timeout if timeout is None else timeout
+        self._tracked.put((job, time.monotonic() + timeout, future))
+        with self._lock:
+            if len(self._trackers) < self._max_tracked:
+                tracker = Thread(target=self._run_tracker, daemon=True,
+                                 name='throughput_selector_tracker')
+                self._trackers.append(tracker)
+                tracker.start()
+        return future
+
+    def _run_tracker(self) -> None:
+        """Track the queued jobs, one at a time, until the queue is empty."""
+        while True:
+            with self._lock:
+                try:
+                    job, deadline, future = self._tracked.get_nowait()
+                except Empty:
+                    self._trackers.remove(current_thread())
+                    return
+            try:
+                self._track(job, deadline)
+            finally:
+                future.set_result(None)
+
+    def _track(self, job: IBMQJob, deadline: float) -> None:
+        """Wait for a job to finish, observing each change of its status.
+
+        Final statuses are only observed once the job has been refreshed, so
+        that its time per step is known.
+        """
+        def _observe(_job_id: str, job_status: JobStatus, _job: IBMQJob, **kwargs: Any) -> None:
+            if job_status not in JOB_FINAL_STATES:
+                self.observe(job, job_status, kwargs.get('queue_info'))
+
+        timeout = deadline - time.monotonic()
+        try:
+            if timeout > 0:
+                job.wait_for_final_state(timeout=timeout, callback=_observe)
+                self.observe(job)
+                return
+        except IBMQJobTimeoutError:
+            pass
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning('Unable to track job %s: %s', job.job_id(), str(err))
+            return
+        logger.debug('Job %s did not finish in time and is no longer tracked.', job.job_id())
+
+    def predict(
+            self,
+            backend_name: str,
+            pending_jobs: int,
+            workload: int
+    ) -> Optional[float]:
+        """Return the predicted completion time of a job.
+
+        If a backend has no estimate yet, the mean estimate of the other
+        backends is used instead.
+
+        Args:
+            backend_name: Name of the backend.
+            pending_jobs: Number of jobs in the queue of the backend.
+            workload: Size of the job, as its total number of shots.
+
+        Returns:
+            The predicted number of seconds before the job completes, or
+            ``None`` if there is no estimate for any backend.
+        """
+        with self._lock:
+            drain_rate = self._estimate(backend_name, 'drain_rate')
+            seconds_per_shot = self._estimate(backend_name, 'seconds_per_shot')
+        if (pending_jobs and drain_rate is None) or seconds_per_shot is None:
+            return None
+        wait = pending_jobs / drain_rate if pending_jobs else 0.0
+        return wait + seconds_per_shot * workload
+
+    def select(
+            self,
+            backends: List[BaseBackend],
+            qobj: Optional[Union[QasmQobj, PulseQobj]] = None,
+            workload: Optional[int] = None,
+            reservation_lookahead: Optional[int] = 60,
+            max_status_age: Optional[float] = None,
+            max_workers: int = 8
+    ) -> BaseBackend:
+        """Return the backend expected to complete a job the soonest.
+
+        The available backends are the same as for
+        :func:`~qiskit.providers.ibmq.least_busy`. If no completion time can
+        be predicted yet, the backend with the fewest pending jobs is returned.
+
+        Args:
+            backends: The backends to choose from.
+            qobj: The Qobj to run, used to compute the size of the job.
+            workload: The size of the job, as its total number of shots, if
+                `qobj` is not given. Defaults to one experiment with
+                ``1024`` shots.
+            reservation_lookahead: A backend is considered unavailable if it
+                has reservations in the next ``n`` minutes, where ``n`` is
+                the value of ``reservation_lookahead``.
+                If ``None``, reservations are not taken into consideration.
+            max_status_age: If set, the status of a backend retrieved at most
+                this many seconds ago is reused instead of being queried again.
+            max_workers: Maximum number of concurrent queries.
+
+        Returns:
+            The backend with the lowest predicted completion time.
+
+        Raises:
+            IBMQError: If the backends list is empty, or if none of the
+                backends is available.
+        """
+        if not backends:
+            raise IBMQError('Unable to select a backend from an empty list.')
+        if qobj is not None:
+            workload = qobj_workload(qobj)
+        elif workload is None:
+            workload = DEFAULT_SHOTS
+
+        candidates = available_backends(backends, reservation_lookahead,
+                                        max_status_age=max_status_age, max_workers=max_workers)
+        if not candidates:
+            raise IBMQError('No backend matches the criteria.')
+
+        predictions = [(self.predict(backend.name(), getattr(status, 'pending_jobs', 0),
+                                     workload), backend, status)
+                       for backend, status in candidates]
+        if all(prediction is not None for prediction, _, _ in predictions):
+            return min(predictions, key=lambda prediction: prediction[0])[1]
+
+        logger.debug('Unable to predict the completion time on every backend. '
+                     'Selecting the backend with the fewest pending jobs.')
+        return min(predictions, key=lambda prediction: getattr(
+            prediction[2], 'pending_jobs', 0))[1]
+
+    def _estimate(self, backend_name: str, name: str) -> Optional[float]:
+        """Return an estimate for a backend, or the mean estimate of all the backends."""
+        value = self._backends.get(backend_name, {}).get(name)
+        if value is not None:
+            return value
+        known = [state[name] for state in self._backends.values()
+                 if state.get(name) is not None]
+        return sum(known) / len(known) if known else None
+
+    def _update(self, backend_name: str, name: str, sample: float) -> None:
+        """Add a sample to an estimate of a backend."""
+        state = self._backends.setdefault(backend_name, {})
+        previous = state.get(name)
+        if previous is None:
+            state[name] = sample
+        else:
+            state[name] = (1 - self._smoothing) * previous + self._smoothing * sample
+        samples_key = 'drain_samples' if name == 'drain_rate' else 'runtime_samples'
+        state[samples_key] = state.get(samples_key, 0) + 1
+
+    def _snapshot(self, force: bool) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Return a copy of the model to write to disk.
+
+        Must be called with the lock held.
+
+        Args:
+            force: Whether to write the model even if it was written less
+                than ``_save_interval`` seconds ago.
+
+        Returns:
+            The version and a copy of the model, or ``None`` if the model is
+            not written yet.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_save < self._save_interval:
+            return None
+        self._last_save = now
+        self._version += 1
+        return self._version, {
+            'backends': {name: dict(state) for name, state in self._backends.items()},
+            'pending': list(self._pending.items()),
+            'seen': list(self._seen)}
+
+    def _save(self, snapshot: Optional[Tuple[int, Dict[str, Any]]]) -> None:
+        """Write a copy of the model to disk, unless a newer one was written.
+
+        Args:
+            snapshot: The version and the copy of the model, as returned by
+                :meth:`_snapshot()`.
+        """
+        if snapshot is None:
+            return
+        version, model = snapshot
+        with self._save_lock:
+            if version > self._saved_version:
+                self._cache.put('model', model)
+                self._saved_version = version
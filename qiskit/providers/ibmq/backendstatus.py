@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Concurrent retrieval of the status of several backends."""
+
+import time
+import logging
+from datetime import datetime, timedelta
+from concurrent import futures
+from typing import Dict, List, Optional, Tuple
+
+from qiskit.providers.basebackend import BaseBackend  # type: ignore[attr-defined]
+from qiskit.providers.models import BackendStatus
+
+from qiskit.providers.ibmq import accountprovider  # pylint: disable=unused-import
+from .ibmqbackend import IBMQBackend
+from .backendreservation import BackendReservation
+from .utils.refresher import BackgroundRefresher
+
+logger = logging.getLogger(__name__)
+
+
+def backend_statuses(
+        backends: List[BaseBackend],
+        max_age: Optional[float] = None,
+        max_workers: int = 8
+) -> List[BackendStatus]:
+    """Return the status of several backends, retrieved concurrently.
+
+    Args:
+        backends: The backends.
+        max_age: If set, the last status retrieved for a backend is reused if
+            it was retrieved at most `max_age` seconds ago.
+        max_workers: Maximum number of concurrent queries.
+
+    Returns:
+        The status of each backend, in the same order as `backends`.
+    """
+    def _status(backend: BaseBackend) -> BackendStatus:
+        if isinstance(backend, IBMQBackend):
+            return backend.status(max_age=max_age)
+        return backend.status()
+
+    if len(backends) <= 1:
+        return [_status(backend) for backend in backends]
+    with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(backends))) as executor:
+        return list(executor.map(_status, backends))
+
+
+def upcoming_reservations(
+        backends: List[BaseBackend],
+        lookahead: float,
+        max_workers: int = 8
+) -> List[Optional[List[BackendReservation]]]:
+    """Return the upcoming reservations of several backends, retrieved concurrently.
+
+    Args:
+        backends: The backends.
+        lookahead: Number of minutes to look ahead.
+        max_workers: Maximum number of concurrent queries.
+
+    Returns:
+        The reservations of each backend starting within the next `lookahead`
+        minutes, in the same order as `backends`. Backends that do not
+        support reservations have none, and the reservations of a backend
+        are ``None`` if they could not be retrieved.
+    """
+    start = datetime.now()
+    end = start + timedelta(minutes=lookahead)
+
+    def _reservations(backend: BaseBackend) -> Optional[List[BackendReservation]]:
+        if not isinstance(backend, IBMQBackend):
+            return []
+        try:
+            return backend.reservations(start, end)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Unable to find backend reservation information. "
+                           "It will not be taken into consideration. %s", str(err))
+            return None
+
+    if len(backends) <= 1:
+        return [_reservations(backend) for backend in backends]
+    with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(backends))) as executor:
+        return list(executor.map(_reservations, backends))
+
+
+def available_backends(
+        backends: List[BaseBackend],
+        reservation_lookahead: Optional[float] = 60,
+        max_status_age: Optional[float] = None,
+        max_workers: int = 8
+) -> List[Tuple[BaseBackend, BackendStatus]]:
+    """Return the operational backends without upcoming reservations.
+
+    Args:
+        backends: The backends to choose from.
+        reservation_lookahead: A backend is considered unavailable if it
+            has reservations in the next ``n`` minutes, where ``n`` is
+            the value of ``reservation_lookahead``.
+            If ``None``, reservations are not taken into consideration.
+        max_status_age: If set, the status of a backend retrieved at most
+            this many seconds ago is reused instead of being queried again.
+        max_workers: Maximum number of concurrent queries.
+
+    Returns:
+        The available backends, with their status, in the same order as
+        `backends`.
+    """
+    statuses = backend_statuses(backends, max_age=max_status_age, max_workers=max_workers)
+    candidates = [(backend, status) for backend, status in zip(backends, statuses)
+                  if status.operational]
+    if reservation_lookahead and candidates:
+        reservations = upcoming_reservations([backend for backend, _ in candidates],
+                                             reservation_lookahead, max_workers=max_workers)
+        candidates = [candidate for candidate, backend_reservations
+                      in zip(candidates, reservations) if not backend_reservations]
+    return candidates
+
+
+class BackendStatusSnapshot(BackgroundRefresher):
+    """Status of all the backends of a provider, refreshed in the background.
+
+    While the snapshot is running, the status of every backend of the provider
+    is queried concurrently every ``interval`` seconds, and
+    :meth:`IBMQBackend.status()` returns the status from the last refresh
+    instead of querying the server. The number of status queries is then set
+    by the refresh interval, regardless of the number of callers.
+
+    Use :meth:`IBMQBackendService.start_status_refresh()
+    <qiskit.providers.ibmq.IBMQBackendService.start_status_refresh>` to start
+    the snapshot of a provider.
+    """
+
+    _thread_name = 'backend_status_snapshot'
+
+    def __init__(
+            self,
+            provider: 'accountprovider.AccountProvider',
+            max_workers: int = 8
+    ) -> None:
+        """BackendStatusSnapshot constructor.
+
+        Args:
+            provider: The provider whose backends are refreshed.
+            max_workers: Maximum number of concurrent queries.
+        """
+        super().__init__()
+        self._provider = provider
+        self._max_workers = max_workers
+
+    def refresh(self) -> Dict[str, BackendStatus]:
+        """Query the status of all the backends of the provider, concurrently.
+
+        Returns:
+            The status of each backend, keyed by backend name. Backends whose
+            status could not be retrieved are left out.
+        """
+        backends = list(self._provider._backends.values())
+
+        def _fetch(backend: IBMQBackend) -> Optional[BackendStatus]:
+            try:
+                return backend._fetch_status()
+            except Exception as err:  # pylint: disable=broad-except
+                logger.warning('Unable to refresh the status of backend %s: %s',
+                               backend.name(), str(err))
+                return None
+
+        with futures.ThreadPoolExecutor(
+                max_workers=max(1, min(self._max_workers, len(backends)))) as executor:
+            statuses = list(executor.map(_fetch, backends))
+        self.last_refresh = time.monotonic()
+        return {backend.name(): status for backend, status in zip(backends, statuses)
+                if status is not None}
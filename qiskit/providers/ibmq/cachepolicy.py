@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache policy of the backend properties and pulse defaults."""
+
+import time
+import logging
+from concurrent import futures
+from threading import Lock
+from typing import Any, Callable, Optional, Tuple
+
+from .exceptions import IBMQBackendValueError
+
+logger = logging.getLogger(__name__)
+
+
+class CachePolicy:
+    """Policy deciding when the cached properties and pulse defaults of a backend are refreshed.
+
+    By default, the properties and pulse defaults of a backend are retrieved
+    once and cached until ``refresh=True`` is passed. With a time to live,
+    they are retrieved again once they are older than `ttl` seconds. With a
+    refresh ahead period, they are refreshed in the background when they
+    are older than ``ttl - refresh_ahead`` seconds, while the cached values
+    keep being returned, so that callers rarely wait for the server::
+
+        backend.set_cache_policy(CachePolicy(ttl=3600, refresh_ahead=300))
+
+    In addition, when the refreshed properties have a new ``last_update_date``,
+    that is after the backend is calibrated, the pulse defaults are refreshed
+    too, unless `refresh_on_update` is ``False``.
+    """
+
+    def __init__(
+            self,
+            ttl: Optional[float] = None,
+            refresh_ahead: float = 0,
+            refresh_on_update: bool = True
+    ) -> None:
+        """CachePolicy constructor.
+
+        Args:
+            ttl: Number of seconds the cached values are used for. If ``None``,
+                they are used until explicitly refreshed.
+            refresh_ahead: Number of seconds before the end of the time to
+                live at which the cached values are refreshed in the background.
+            refresh_on_update: Whether to refresh the pulse defaults when the
+                properties are updated.
+
+        Raises:
+            IBMQBackendValueError: If `ttl` is not positive, or `refresh_ahead`
+                is negative or not smaller than `ttl`.
+        """
+        if ttl is not None and ttl <= 0:
+            raise IBMQBackendValueError('The time to live must be positive, got {}.'.format(ttl))
+        if refresh_ahead < 0 or (refresh_ahead and (ttl is None or refresh_ahead >= ttl)):
+            raise IBMQBackendValueError(
+                'The refresh ahead period must be positive and smaller than the time '
+                'to live, got {} for a time to live of {}.'.format(refresh_ahead, ttl))
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.refresh_on_update = refresh_on_update
+
+    def is_expired(self, age: float) -> bool:
+        """Return whether a cached value must be refreshed before being used.
+
+        Args:
+            age: Number of seconds since the value was retrieved.
+
+        Returns:
+            Whether the value is older than the time to live.
+        """
+        return self.ttl is not None and age >= self.ttl
+
+    def should_refresh_ahead(self, age: float) -> bool:
+        """Return whether a cached value should be refreshed in the background.
+
+        Args:
+            age: Number of seconds since the value was retrieved.
+
+        Returns:
+            Whether the value is within the refresh ahead period.
+        """
+        return bool(self.refresh_ahead) and age >= self.ttl - self.refresh_ahead
+
+    def __repr__(self) -> str:
+        return '<{}(ttl={}, refresh_ahead={}, refresh_on_update={})>'.format(
+            self.__class__.__name__, self.ttl, self.refresh_ahead, self.refresh_on_update)
+
+
+DEFAULT_CACHE_POLICY = CachePolicy()
+"""Cache policy of the backends, which caches the values until explicitly refreshed."""
+
+_refresh_executor = None  # type: Optional[futures.ThreadPoolExecutor]
+_refresh_executor_lock = Lock()
+
+
+def _get_refresh_executor() -> futures.ThreadPoolExecutor:
+    """Return the executor used for background refreshes, shared by all the caches."""
+    global _refresh_executor  # pylint: disable=global-statement
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = futures.ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix='ibmq_cache_refresh')
+        return _refresh_executor
+
+
+class RefreshingCache:
+    """A cached value, refreshed according to a :class:`CachePolicy`.
+
+    The value and the time it was retrieved are held in a single immutable
+    entry, which is replaced as a whole when the value is refreshed. Reads
+    only load the entry and never take a lock. A lock is only taken by the
+    refreshes, so that concurrent callers of an expired value wait for a
+    single query, and at most one background refresh is in flight.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[[], Any],
+            on_refresh: Optional[Callable[[Any, Any], None]] = None
+    ) -> None:
+        """RefreshingCache constructor.
+
+        Args:
+            fetch: Function retrieving the value. A ``None`` value is
+                returned but not cached.
+            on_refresh: Function called with the previous value and the new
+                value after each refresh.
+        """
+        self._fetch = fetch
+        self._on_refresh = on_refresh
+        self._entry = None  # type: Optional[Tuple[float, Any]]
+        self._refresh_lock = Lock()
+
+    def get(self, policy: CachePolicy, refresh: bool = False) -> Any:
+        """Return the value, refreshing it if required by the policy.
+
+        Args:
+            policy: The cache policy.
+            refresh: If ``True``, retrieve the value again.
+
+        Returns:
+            The value.
+        """
+        entry = self._entry
+        if refresh or entry is None:
+            return self._refresh(entry, force=refresh)
+        age = time.monotonic() - entry[0]
+        if policy.is_expired(age):
+            return self._refresh(entry)
+        if policy.should_refresh_ahead(age):
+            self.refresh_in_background()
+        return entry[1]
+
+    def refresh_in_background(self) -> None:
+        """Refresh the value in the background, unless a refresh is in flight."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            _get_refresh_executor().submit(self._background_refresh)
+        except BaseException:
+            self._refresh_lock.release()
+            raise
+
+    def is_cached(self) -> bool:
+        """Return whether a value is cached.
+
+        Returns:
+            Whether a value is cached.
+        """
+        return self._entry is not None
+
+    def clear(self) -> None:
+        """Discard the cached value."""
+        self._entry = None
+
+    def _refresh(self, seen_entry: Optional[Tuple[float, Any]], force: bool = False) -> Any:
+        """Retrieve the value, unless another caller refreshed it in the meantime."""
+        with self._refresh_lock:
+            entry = self._entry
+            if not force and entry is not None and entry is not seen_entry:
+                return entry[1]
+            return self._update()
+
+    def _background_refresh(self) -> None:
+        """Retrieve the value, holding the refresh lock acquired by the caller."""
+        try:
+            self._update()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning('Unable to refresh a cached value in the background: %s', str(err))
+        finally:
+            self._refresh_lock.release()
+
+    def _update(self) -> Any:
+        """Retrieve the value and swap it in."""
+        value = self._fetch()
+        previous = self._entry
+        self._entry = (time.monotonic(), value) if value is not None else None
+        if self._on_refresh is not None and previous is not None:
+            self._on_refresh(previous[1], value)
+        return value
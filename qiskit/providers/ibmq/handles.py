@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Picklable handles of providers, backends and jobs."""
+
+import os
+import logging
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from qiskit.providers.ibmq import accountprovider  # pylint: disable=unused-import
+from .ibmqbackend import IBMQBackend
+from .credentials import Credentials
+from .backendcache import (backend_config_cache, backend_config_cache_key,
+                           enable_backend_config_cache)
+from .propertieshistory import properties_history_cache, enable_properties_history_cache
+from .job import IBMQJob
+from .job.artifactcache import job_disk_cache, enable_job_disk_cache
+from .job.jobindex import job_index_directory, enable_job_index
+
+logger = logging.getLogger(__name__)
+
+_CACHES = {
+    'backend_configs': (
+        lambda: getattr(backend_config_cache(), 'directory', None), enable_backend_config_cache),
+    'properties_history': (
+        lambda: getattr(properties_history_cache(), 'directory', None),
+        enable_properties_history_cache),
+    'jobs': (lambda: getattr(job_disk_cache(), 'directory', None), enable_job_disk_cache),
+    'job_index': (job_index_directory, enable_job_index)
+}  # type: Dict[str, Tuple[Callable[[], Optional[str]], Callable[[Optional[str]], None]]]
+"""Disk caches shared with the processes using the handles, as functions
+returning their root directory, or ``None`` if disabled, and enabling them."""
+
+
+def _enabled_caches() -> Dict[str, str]:
+    """Return the root directories of the disk caches enabled in this process."""
+    directories = {}
+    for name, (directory, _) in _CACHES.items():
+        cache_directory = directory()
+        if cache_directory is not None:
+            directories[name] = cache_directory
+    return directories
+
+
+def _enable_caches(directories: Dict[str, str]) -> None:
+    """Enable the given disk caches that are not enabled in this process."""
+    for name, cache_directory in directories.items():
+        directory, enable = _CACHES[name]
+        if directory() is None:
+            enable(cache_directory)
+
+
+class _ProviderRegistry:
+    """Providers created from handles, shared by all the handles of a process.
+
+    The registry is emptied when it is used from a process other than the one
+    that filled it, so that a forked process does not use the connections
+    of its parent.
+    """
+
+    def __init__(self) -> None:
+        """_ProviderRegistry constructor."""
+        self._pid = os.getpid()
+        self._lock = Lock()
+        self._providers = {}  # type: Dict[Tuple[str, str], accountprovider.AccountProvider]
+
+    def get(self, handle: 'ProviderHandle') -> 'accountprovider.AccountProvider':
+        """Return the provider of a handle, creating it if needed.
+
+        Args:
+            handle: The provider handle.
+
+        Returns:
+            The provider.
+        """
+        self._check_process()
+        with self._lock:
+            provider = self._providers.get(handle.key())
+            if provider is None:
+                _enable_caches(handle.cache_directories)
+                logger.debug('Reconnecting provider %s in process %s.',
+                             handle.credentials.unique_id(), self._pid)
+                provider = accountprovider.AccountProvider(handle.credentials,
+                                                           handle.access_token)
+                # The process that created the handle revalidates the cached
+                # backend configurations, so that the workers do not query them.
+                provider._revalidate_configs = False
+                self._providers[handle.key()] = provider
+            return provider
+
+    def register(self, handle: 'ProviderHandle', provider: 'accountprovider.AccountProvider') -> None:
+        """Register the provider a handle was created from, unless one is registered.
+
+        Args:
+            handle: The provider handle.
+            provider: The provider.
+        """
+        self._check_process()
+        with self._lock:
+            self._providers.setdefault(handle.key(), provider)
+
+    def _check_process(self) -> None:
+        """Empty the registry if it was inherited from a parent process."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._lock = Lock()
+            self._providers = {}
+
+
+_PROVIDER_REGISTRY = _ProviderRegistry()
+
+
+class ProviderHandle:
+    """Picklable reference to an :class:`~qiskit.providers.ibmq.AccountProvider`.
+
+    Providers, backends and jobs hold live connections and threads, so they
+    cannot be sent to other processes. Their handles only hold the
+    credentials, the access token and the identifiers needed to reconnect,
+    and can be passed to the workers of a ``ProcessPoolExecutor``::
+
+        handle = ProviderHandle.from_provider(provider)
+        with ProcessPoolExecutor() as executor:
+            executor.map(post_process, [handle] * 4)
+
+    where a worker calls ``handle.provider()`` to get the provider. The
+    provider is created in the worker the first time it is needed, with the
+    access token of the original provider, so that the worker does not log
+    in again. It is then shared by all the handles with the same credentials
+    in that process. The disk caches enabled when the handle was created,
+    such as the backend configurations cache, are enabled in the worker too,
+    so that the backends are not discovered again from the server. The
+    cached backend configurations are not revalidated by the workers, and
+    backend and job handles carry the configuration of their backend, so
+    that the workers do not retrieve the list of backends.
+
+    Note:
+        A handle contains the credentials of the account, including the API
+        token in plain text, and so does every pickled copy of it. Handles
+        should not be stored, logged or sent outside of the machine. The
+        access token expires at the end of the session of the original
+        provider.
+    """
+
+    def __init__(
+            self,
+            credentials: Credentials,
+            access_token: str,
+            cache_directories: Optional[Dict[str, str]] = None
+    ) -> None:
+        """ProviderHandle constructor.
+
+        Args:
+            credentials: Credentials of the provider.
+            access_token: IBM Quantum Experience access token.
+            cache_directories: Root directories of the disk caches to enable
+                in the process using the handle, keyed by cache name.
+        """
+        self.credentials = credentials
+        self.access_token = access_token
+        self.cache_directories = cache_directories or {}
+
+    @classmethod
+    def from_provider(cls, provider: 'accountprovider.AccountProvider') -> 'ProviderHandle':
+        """Return the handle of a provider.
+
+        Args:
+            provider: The provider.
+
+        Returns:
+            The handle of the provider. In this process, the handle returns
+            `provider` itself.
+        """
+        handle = cls(provider.credentials, provider._api_client._session.access_token,
+                     _enabled_caches())
+        _PROVIDER_REGISTRY.register(handle, provider)
+        return handle
+
+    def provider(self) -> 'accountprovider.AccountProvider':
+        """Return the provider, reconnecting to it if needed.
+
+        Returns:
+            The provider.
+        """
+        return _PROVIDER_REGISTRY.get(self)
+
+    def key(self) -> Tuple[str, str]:
+        """Return a value identifying the provider and the session of the handle.
+
+        Returns:
+            The key of the handle.
+        """
+        return backend_config_cache_key(self.credentials), self.access_token
+
+    def __repr__(self) -> str:
+        return "<{}(hub='{}', group='{}', project='{}')>".format(
+            self.__class__.__name__, self.credentials.hub, self.credentials.group,
+            self.credentials.project)
+
+
+class BackendHandle:
+    """Picklable reference to an :class:`~qiskit.providers.ibmq.IBMQBackend`.
+
+    The handle holds the raw configuration of the backend, so that the
+    backend is instantiated the first time it is needed without retrieving
+    the configurations of the backends of the provider. Without it, the
+    backend is looked up by name from the configurations of the provider.
+    """
+
+    def __init__(
+            self,
+            provider_handle: ProviderHandle,
+            backend_name: str,
+            raw_config: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """BackendHandle constructor.
+
+        Args:
+            provider_handle: Handle of the provider of the backend.
+            backend_name: Name of the backend.
+            raw_config: Raw configuration of the backend, as returned by the
+                server.
+        """
+        self.provider_handle = provider_handle
+        self.backend_name = backend_name
+        self.raw_config = raw_config
+
+    @classmethod
+    def from_backend(cls, backend: IBMQBackend) -> 'BackendHandle':
+        """Return the handle of a backend.
+
+        Args:
+            backend: The backend.
+
+        Returns:
+            The handle of the backend.
+        """
+        provider = backend.provider()
+        raw_config = (provider._raw_configs or {}).get(backend.name())
+        return cls(ProviderHandle.from_provider(provider), backend.name(), raw_config)
+
+    def backend(self) -> IBMQBackend:
+        """Return the backend, reconnecting to its provider if needed.
+
+        Returns:
+            The backend, or an ``IBMQRetiredBackend`` if the backend is no
+            longer available to the provider.
+        """
+        provider = self.provider_handle.provider()
+        if self.raw_config is not None:
+            backend = provider._add_remote_backend(self.raw_config)
+            if backend is not None:
+                return backend
+        return provider.backends._get_job_backend(self.backend_name)
+
+    def __repr__(self) -> str:
+        return "<{}('{}')>".format(self.__class__.__name__, self.backend_name)
+
+
+class JobHandle:
+    """Picklable reference to an :class:`~qiskit.providers.ibmq.job.IBMQJob`.
+
+    The job is rebuilt from the fields held by the handle, and the rest of
+    its fields are retrieved from the server the first time one of them is
+    needed. The Qobj and properties of the job are read from the job disk
+    cache, if it is enabled.
+    """
+
+    def __init__(
+            self,
+            backend_handle: BackendHandle,
+            job_id: str,
+            creation_date: str,
+            status: str,
+            kind: Optional[str] = None
+    ) -> None:
+        """JobHandle constructor.
+
+        Args:
+            backend_handle: Handle of the backend of the job.
+            job_id: Job ID.
+            creation_date: Job creation date, in ISO format.
+            status: Job status returned by the server.
+            kind: Job type.
+        """
+        self.backend_handle = backend_handle
+        self.job_id = job_id
+        self.creation_date = creation_date
+        self.status = status
+        self.kind = kind
+        self._job = None  # type: Optional[IBMQJob]
+
+    @classmethod
+    def from_job(cls, job: IBMQJob) -> 'JobHandle':
+        """Return the handle of a job.
+
+        Args:
+            job: The job.
+
+        Returns:
+            The handle of the job.
+        """
+        return cls(BackendHandle.from_backend(job.backend()), job.job_id(),
+                   job._creation_date.isoformat(), job._api_status,
+                   job._kind.value if job._kind else None)
+
+    def job(self) -> IBMQJob:
+        """Return the job, reconnecting to its provider if needed.
+
+        The job is rebuilt once per handle in each process.
+
+        Returns:
+            The job.
+        """
+        if self._job is None:
+            provider = self.backend_handle.provider_handle.provider()
+            self._job = IBMQJob(backend=self.backend_handle.backend(),
+                                api_client=provider._api_client, job_id=self.job_id,
+                                creation_date=self.creation_date, status=self.status,
+                                kind=self.kind, partial_data=True)
+        return self._job
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state['_job'] = None
+        return state
+
+    def __repr__(self) -> str:
+        return "<{}('{}')>".format(self.__class__.__name__, self.job_id)
@@ -14,11 +14,15 @@
 
 """Module for interfacing with an IBM Quantum Experience Backend."""
 
+import copy
+import time
 import logging
 import warnings
+import threading
+from concurrent import futures
 
-from typing import Dict, List, Union, Optional, Any
-from datetime import datetime as python_datetime
+from typing import Dict, List, Union, Optional, Any, Tuple
+from datetime import datetime as python_datetime, timedelta, timezone
 
 from qiskit.qobj import QasmQobj, PulseQobj, validate_qobj_against_schema
 from qiskit.providers.basebackend import BaseBackend  # type: ignore[attr-defined]
@@ -35,16 +39,24 @@ from .api.clients import AccountClient
 from .api.exceptions import ApiError
 from .backendjoblimit import BackendJobLimit
 from .backendreservation import BackendReservation
+from .cachepolicy import CachePolicy, RefreshingCache, DEFAULT_CACHE_POLICY
+from .backendcache import BACKEND_INTERN_TABLE, raw_digest
+from .propertieshistory import PROPERTIES_HISTORY
 from .credentials import Credentials
 from .exceptions import (IBMQBackendError, IBMQBackendValueError,
                          IBMQBackendApiError, IBMQBackendApiProtocolError,
                          IBMQBackendJobLimitError)
 from .job import IBMQJob
+from .job.jobrecord import JobRecordBatch
+from .submitpipeline import SubmitPipeline
+from .jobscheduler import BackendJobScheduler
 from .utils import update_qobj_config, validate_job_tags
 from .utils.converters import utc_to_local_all, local_to_utc
 from .utils.json_decoder import decode_pulse_defaults, decode_backend_properties
 from .utils.backend import convert_reservation_data
 from .utils.utils import api_status_to_job_status
+from .utils.timing import PhaseTimer
+from .utils.qobj_encoder import qobj_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +102,12 @@ class IBMQBackend(BaseBackend):
         job_limit = backend.job_limit()
     """
 
+    _job_scheduler_lock = threading.Lock()
+    """Lock used to create the job scheduler of a backend."""
+
+    _properties_history_step = timedelta(days=1)
+    """Interval between the dates first queried when retrieving historical properties."""
+
     def __init__(
             self,
             configuration: Union[QasmBackendConfiguration, PulseBackendConfiguration],
@@ -114,8 +132,14 @@ class IBMQBackend(BaseBackend):
         self.project = credentials.project
 
         # Attributes used by caching functions.
-        self._properties = None
-        self._defaults = None
+        self._cache_policy = DEFAULT_CACHE_POLICY
+        self._properties_cache = RefreshingCache(self._fetch_properties,
+                                                 self._properties_refreshed)
+        self._defaults_cache = RefreshingCache(self._fetch_defaults)
+        self._last_status = None  # type: Optional[Tuple[float, BackendStatus]]
+        self._status_lock = threading.Lock()
+
+        self._job_scheduler = None  # type: Optional[BackendJobScheduler]
 
     def run(
             self,
@@ -159,23 +183,135 @@ class IBMQBackend(BaseBackend):
             IBMQBackendValueError: If an input parameter value is not valid.
         """
         # pylint: disable=arguments-differ
-        if job_share_level:
-            try:
-                api_job_share_level = ApiJobShareLevel(job_share_level.lower())
-            except ValueError:
-                valid_job_share_levels_str = ', '.join(level.value for level in ApiJobShareLevel)
-                raise IBMQBackendValueError(
-                    '"{}" is not a valid job share level. '
-                    'Valid job share levels are: {}.'
-                    .format(job_share_level, valid_job_share_levels_str)) from None
-        else:
-            api_job_share_level = ApiJobShareLevel.NONE
-
+        api_job_share_level = self._get_api_job_share_level(job_share_level)
         validate_job_tags(job_tags, IBMQBackendValueError)
         if validate_qobj:
             validate_qobj_against_schema(qobj)
         return self._submit_job(qobj, job_name, api_job_share_level, job_tags)
 
+    def schedule(
+            self,
+            qobj: Union[QasmQobj, PulseQobj],
+            job_name: Optional[str] = None,
+            job_share_level: Optional[str] = None,
+            job_tags: Optional[List[str]] = None,
+            validate_qobj: bool = False,
+            priority: int = 0
+    ) -> futures.Future:
+        """Run a Qobj once the job limit of the backend allows it.
+
+        Unlike :meth:`run()`, which fails if you already have the maximum
+        number of active jobs on the backend (see :meth:`job_limit()`), this
+        method queues the Qobj locally and submits it as soon as one of your
+        jobs on the backend finishes. Qobjs with a higher `priority` are
+        submitted first::
+
+            future = backend.schedule(qobj)
+            job = future.result()
+
+        Args:
+            qobj: The Qobj to be executed.
+            job_name: Custom name to be assigned to the job.
+            job_share_level: Level the job should be shared at. See
+                :meth:`run()` for the possible values.
+            job_tags: Tags to be assigned to the job.
+            validate_qobj: If ``True``, run JSON schema validation against the
+                submitted payload.
+            priority: Priority of the Qobj in the local queue.
+
+        Returns:
+            A future that resolves to the submitted job. If the job cannot be
+            submitted, the future holds the error raised by :meth:`run()`.
+
+        Raises:
+            IBMQBackendValueError: If an input parameter value is not valid.
+        """
+        self._get_api_job_share_level(job_share_level)
+        validate_job_tags(job_tags, IBMQBackendValueError)
+        with self._job_scheduler_lock:
+            if self._job_scheduler is None:
+                self._job_scheduler = BackendJobScheduler(self)
+        return self._job_scheduler.submit(
+            qobj, priority, job_name=job_name, job_share_level=job_share_level,
+            job_tags=job_tags, validate_qobj=validate_qobj)
+
+    def run_many(
+            self,
+            qobjs: List[Union[QasmQobj, PulseQobj]],
+            job_name: Optional[str] = None,
+            job_share_level: Optional[str] = None,
+            job_tags: Optional[List[str]] = None,
+            validate_qobj: bool = False,
+            max_workers: int = 4
+    ) -> Tuple[List[Optional[IBMQJob]], Dict[int, IBMQBackendError]]:
+        """Run several Qobjs asynchronously, pipelining their submission.
+
+        Submitting a job takes several round trips to the server: creating
+        the job, uploading its Qobj and confirming the upload. This method
+        runs each of these steps as a separate stage, each with its own
+        threads, and serializes the next Qobj while the previous ones are
+        being uploaded. Submitting many jobs this way is considerably faster
+        than calling :meth:`run()` for each of them::
+
+            jobs, errors = backend.run_many(qobjs, job_tags=['sweep'])
+
+        A failure to submit a Qobj does not stop the submission of the others.
+
+        Args:
+            qobjs: The Qobjs to be executed.
+            job_name: Custom name to be assigned to the jobs.
+            job_share_level: Level the jobs should be shared at. See
+                :meth:`run()` for the possible values.
+            job_tags: Tags to be assigned to the jobs.
+            validate_qobj: If ``True``, run JSON schema validation against the
+                submitted payloads.
+            max_workers: Maximum number of threads used by each network stage
+                of the submission.
+
+        Returns:
+            A tuple containing:
+
+                * The submitted jobs, in the same order as `qobjs`. The entry
+                  of a Qobj that could not be submitted is ``None``.
+                * A dictionary mapping the position of each Qobj that could not
+                  be submitted to the error that occurred.
+
+        Raises:
+            IBMQBackendValueError: If an input parameter value is not valid.
+        """
+        api_job_share_level = self._get_api_job_share_level(job_share_level)
+        validate_job_tags(job_tags, IBMQBackendValueError)
+        if validate_qobj:
+            for qobj in qobjs:
+                validate_qobj_against_schema(qobj)
+        pipeline = SubmitPipeline(self, max_workers=max_workers)
+        return pipeline.submit(qobjs, job_name, api_job_share_level, job_tags)
+
+    @staticmethod
+    def _get_api_job_share_level(job_share_level: Optional[str]) -> ApiJobShareLevel:
+        """Convert a job share level to the value used by the server.
+
+        Args:
+            job_share_level: Job share level, or ``None`` if the job should
+                not be shared.
+
+        Returns:
+            The job share level used by the server.
+
+        Raises:
+            IBMQBackendValueError: If the job share level is not valid.
+        """
+        if not job_share_level:
+            return ApiJobShareLevel.NONE
+        try:
+            return ApiJobShareLevel(job_share_level.lower())
+        except ValueError:
+            valid_job_share_levels_str = ', '.join(level.value for level in ApiJobShareLevel)
+            raise IBMQBackendValueError(
+                '"{}" is not a valid job share level. '
+                'Valid job share levels are: {}.'
+                .format(job_share_level, valid_job_share_levels_str)) from None
+
     def _submit_job(
             self,
             qobj: Union[QasmQobj, PulseQobj],
@@ -199,6 +335,7 @@ class IBMQBackend(BaseBackend):
 
         Events:
             ibmq.job.start: The job has started.
+            ibmq.job.timings: The client-side submission phases were timed.
 
         Raises:
             IBMQBackendApiError: If an unexpected error occurred while submitting
@@ -210,19 +347,67 @@ class IBMQBackend(BaseBackend):
             IBMQBackendJobLimitError: If the job could not be submitted because
                 the job limit has been reached.
         """
+        timer = PhaseTimer()
+        encoder = qobj_encoder()
         try:
-            qobj_dict = qobj.to_dict()
+            if encoder:
+                with timer.phase('submit.encode'):
+                    qobj_data = encoder.encode(qobj)  # type: Union[Dict[str, Any], bytes]
+            else:
+                with timer.phase('submit.to_dict'):
+                    qobj_data = qobj.to_dict()
             submit_info = self._api_client.job_submit(
                 backend_name=self.name(),
-                qobj_dict=qobj_dict,
+                qobj_dict=qobj_data,
                 job_name=job_name,
                 job_share_level=job_share_level,
-                job_tags=job_tags)
+                job_tags=job_tags,
+                timer=timer)
         except ApiError as ex:
-            if 'Error code: 3458' in str(ex):
-                raise IBMQBackendJobLimitError('Error submitting job: {}'.format(str(ex))) from ex
-            raise IBMQBackendApiError('Error submitting job: {}'.format(str(ex))) from ex
+            raise self._submit_error(ex) from ex
+
+        return self._job_from_submit_info(qobj, submit_info, timer)
+
+    @staticmethod
+    def _submit_error(ex: ApiError) -> IBMQBackendError:
+        """Return the exception to raise for a failed job submission.
+
+        Args:
+            ex: The error returned by the server.
+
+        Returns:
+            The exception to raise.
+        """
+        if 'Error code: 3458' in str(ex):
+            return IBMQBackendJobLimitError('Error submitting job: {}'.format(str(ex)))
+        return IBMQBackendApiError('Error submitting job: {}'.format(str(ex)))
 
+    def _job_from_submit_info(
+            self,
+            qobj: Union[QasmQobj, PulseQobj],
+            submit_info: Dict[str, Any],
+            timer: PhaseTimer
+    ) -> IBMQJob:
+        """Create the job instance for a submitted Qobj.
+
+        Args:
+            qobj: The submitted Qobj.
+            submit_info: Job data returned by the server after the submission.
+            timer: Timer holding the submission phases.
+
+        Returns:
+            The submitted job.
+
+        Events:
+            ibmq.job.start: The job has started.
+            ibmq.job.timings: The client-side submission phases were timed.
+
+        Raises:
+            IBMQBackendError: If an unexpected error occurred after submitting
+                the job.
+            IBMQBackendApiProtocolError: If an unexpected value is received from
+                 the server.
+        """
         # Error in the job after submission:
         # Transition to the `ERROR` final state.
         if 'error' in submit_info:
@@ -231,13 +416,15 @@ class IBMQBackend(BaseBackend):
 
         # Submission success.
         try:
-            job = IBMQJob(backend=self, api_client=self._api_client, qobj=qobj, **submit_info)
+            job = IBMQJob(backend=self, api_client=self._api_client, qobj=qobj,
+                          client_timer=timer, **submit_info)
             logger.debug('Job %s was successfully submitted.', job.job_id())
         except TypeError as err:
             logger.debug("Invalid job data received: %s", submit_info)
             raise IBMQBackendApiProtocolError('Unexpected return value received from the server '
                                               'when submitting job: {}'.format(str(err))) from err
         Publisher().publish("ibmq.job.start", job)
+        Publisher().publish("ibmq.job.timings", job, job.client_timings())
         return job
 
     def properties(
@@ -255,6 +442,9 @@ class IBMQBackend(BaseBackend):
         `Qiskit/ibm-quantum-schemas
         <https://github.com/Qiskit/ibm-quantum-schemas/blob/main/schemas/backend_properties_schema.json>`_.
 
+        The current properties are cached according to the cache policy of
+        the backend, see :meth:`set_cache_policy`.
+
         Args:
             refresh: If ``True``, re-query the server for the backend properties.
                 Otherwise, return a cached version.
@@ -279,23 +469,235 @@ class IBMQBackend(BaseBackend):
         if datetime:
             warnings.warn('Unless a UTC timezone information is present, the parameter `datetime`'
                           'is now expected to be in local time instead of UTC.', stacklevel=2)
-            datetime = local_to_utc(datetime)
-
-        if datetime or refresh or self._properties is None:
-            api_properties = self._api_client.backend_properties(self.name(), datetime=datetime)
-            if not api_properties:
-                return None
-            decode_backend_properties(api_properties)
-            api_properties = utc_to_local_all(api_properties)
-            backend_properties = BackendProperties.from_dict(api_properties)
-            if datetime:    # Don't cache result.
-                return backend_properties
-            self._properties = backend_properties
-        return self._properties
-
-    def status(self) -> BackendStatus:
+            return self._historical_properties(local_to_utc(datetime))
+
+        return self._properties_cache.get(self._cache_policy, refresh)
+
+    def set_cache_policy(self, policy: Optional[CachePolicy] = None) -> None:
+        """Set when the cached properties and pulse defaults are refreshed.
+
+        For example, to use the properties and pulse defaults for at most an
+        hour, and refresh them in the background during the last 5 minutes::
+
+            from qiskit.providers.ibmq import CachePolicy
+
+            backend.set_cache_policy(CachePolicy(ttl=3600, refresh_ahead=300))
+
+        Args:
+            policy: The cache policy. If ``None``, the values are cached until
+                explicitly refreshed, which is the default.
+        """
+        self._cache_policy = policy or DEFAULT_CACHE_POLICY
+
+    def _fetch_properties(self) -> Optional[BackendProperties]:
+        """Query the server for the current backend properties.
+
+        Returns:
+            The backend properties or ``None`` if they are not available.
+        """
+        api_properties = self._api_client.backend_properties(self.name())
+        if not api_properties:
+            return None
+        return self._intern_properties(api_properties)
+
+    def _properties_refreshed(
+            self,
+            previous: BackendProperties,
+            properties: Optional[BackendProperties]
+    ) -> None:
+        """Refresh the pulse defaults in the background if the properties were updated.
+
+        Args:
+            previous: The properties before the refresh.
+            properties: The properties after the refresh.
+        """
+        if properties is None or properties is previous or \
+                not self._cache_policy.refresh_on_update or not self._defaults_cache.is_cached():
+            return
+        if properties.last_update_date != previous.last_update_date:
+            logger.debug('The properties of %s were updated, refreshing the pulse defaults.',
+                         self.name())
+            self._defaults_cache.refresh_in_background()
+
+    def properties_history(
+            self,
+            start_datetime: python_datetime,
+            end_datetime: Optional[python_datetime] = None,
+            max_workers: int = 8
+    ) -> List[BackendProperties]:
+        """Return the backend properties in effect during a period.
+
+        The properties are retrieved with concurrent queries, and kept in a
+        local time series shared by all the backend instances in this
+        process, which also answers :meth:`properties` calls with `datetime`
+        within the period. Only the parts of the period not already known
+        are queried. The time series can also be stored on disk, see
+        :func:`~qiskit.providers.ibmq.enable_properties_history_cache`.
+
+        For example, to retrieve the calibrations of the last 30 days::
+
+            from datetime import datetime, timedelta
+
+            history = backend.properties_history(datetime.now() - timedelta(days=30))
+            t1_drift = [props.t1(0) for props in history]
+
+        Args:
+            start_datetime: Start of the period, in local time.
+            end_datetime: End of the period, in local time. Defaults to now.
+            max_workers: Maximum number of concurrent queries.
+
+        Returns:
+            The properties in effect at `start_datetime`, if any, followed by
+            all the properties updated before `end_datetime`, in chronological
+            order.
+
+        Raises:
+            TypeError: If an input argument is not of the correct type.
+        """
+        if not isinstance(start_datetime, python_datetime) or \
+                (end_datetime and not isinstance(end_datetime, python_datetime)):
+            raise TypeError('The start and end of the period need to be of type datetime.')
+        start = local_to_utc(start_datetime)
+        end = local_to_utc(end_datetime) if end_datetime else python_datetime.now(timezone.utc)
+
+        # Query a grid of dates first, then fill the gaps between the snapshots.
+        query_dates = PROPERTIES_HISTORY.missing_dates(self.name(), start, end)
+        if query_dates:
+            grid = [start + step * self._properties_history_step
+                    for step in range(int((end - start) / self._properties_history_step) + 1)]
+            query_dates = sorted(set(query_dates).union(
+                date for date in grid if not PROPERTIES_HISTORY.is_known(self.name(), date)))
+        query_count = 0
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while query_dates:
+                for api_properties, date in zip(executor.map(self._query_properties,
+                                                             query_dates), query_dates):
+                    PROPERTIES_HISTORY.add(self.name(), date, api_properties)
+                query_count += len(query_dates)
+                missing_dates = PROPERTIES_HISTORY.missing_dates(self.name(), start, end)
+                if missing_dates == query_dates:
+                    # The server answers are inconsistent, stop querying.
+                    break
+                query_dates = missing_dates
+        PROPERTIES_HISTORY.save(self.name())
+        logger.debug('Retrieved the properties history of %s with %d queries.',
+                     self.name(), query_count)
+
+        return PROPERTIES_HISTORY.snapshots(self.name(), start, end, self._intern_properties)
+
+    def _historical_properties(self, datetime: python_datetime) -> Optional[BackendProperties]:
+        """Return the backend properties in effect at a date, from the time series if known.
+
+        Args:
+            datetime: The date, in UTC.
+
+        Returns:
+            The most recent backend properties older than `datetime`, or
+            ``None`` if there are none.
+        """
+        # pylint: disable=redefined-outer-name
+        known, backend_properties = PROPERTIES_HISTORY.get(
+            self.name(), datetime, self._intern_properties)
+        if known:
+            return backend_properties
+
+        api_properties = self._query_properties(datetime)
+        PROPERTIES_HISTORY.add(self.name(), datetime, api_properties)
+        PROPERTIES_HISTORY.save(self.name(), deferred=True)
+        known, backend_properties = PROPERTIES_HISTORY.get(
+            self.name(), datetime, self._intern_properties)
+        if known or not api_properties:
+            return backend_properties
+        # The server returned properties more recent than requested.
+        return self._intern_properties(copy.deepcopy(api_properties))
+
+    def _query_properties(self, datetime: python_datetime) -> Optional[Dict[str, Any]]:
+        """Retrieve the raw backend properties in effect at a date.
+
+        Args:
+            datetime: The date, in UTC.
+
+        Returns:
+            The raw backend properties, or ``None`` if there are none.
+        """
+        # pylint: disable=redefined-outer-name
+        return self._api_client.backend_properties(self.name(), datetime=datetime) or None
+
+    def _intern_properties(self, api_properties: Dict[str, Any]) -> BackendProperties:
+        """Return the backend properties for raw properties, shared across backend instances.
+
+        Args:
+            api_properties: Raw backend properties. They are modified in
+                place if they need to be decoded.
+
+        Returns:
+            The backend properties.
+        """
+        return BACKEND_INTERN_TABLE.intern(
+            ('properties', self.name(), str(api_properties.get('last_update_date'))),
+            lambda: self._decode_properties(api_properties))
+
+    @staticmethod
+    def _decode_properties(api_properties: Dict[str, Any]) -> BackendProperties:
+        """Decode the backend properties returned by the server.
+
+        Args:
+            api_properties: Raw backend properties. They are modified in place.
+
+        Returns:
+            The backend properties.
+        """
+        decode_backend_properties(api_properties)
+        api_properties = utc_to_local_all(api_properties)
+        return BackendProperties.from_dict(api_properties)
+
+    @staticmethod
+    def _decode_defaults(api_defaults: Dict[str, Any]) -> PulseDefaults:
+        """Decode the pulse defaults returned by the server.
+
+        Args:
+            api_defaults: Raw pulse defaults. They are modified in place.
+
+        Returns:
+            The pulse defaults.
+        """
+        decode_pulse_defaults(api_defaults)
+        return PulseDefaults.from_dict(api_defaults)
+
+    def status(self, max_age: Optional[float] = None) -> BackendStatus:
         """Return the backend status.
 
+        If the provider refreshes the status of its backends in the background,
+        using :meth:`IBMQBackendService.start_status_refresh()
+        <qiskit.providers.ibmq.IBMQBackendService.start_status_refresh>`,
+        the status from the last refresh is returned, unless it is older than
+        twice the refresh interval.
+
+        Args:
+            max_age: If set, the last status retrieved is returned if it was
+                retrieved at most this many seconds ago, instead of querying
+                the server. Concurrent calls wait for a single query.
+
+        Returns:
+            The status of the backend.
+
+        Raises:
+            IBMQBackendApiProtocolError: If the status for the backend cannot be formatted properly.
+        """
+        if max_age is None:
+            max_age = self._status_refresh_max_age()
+        if max_age is None:
+            return self._fetch_status()
+
+        status = self._recent_status(max_age)
+        if status is not None:
+            return status
+        with self._status_lock:
+            return self._recent_status(max_age) or self._fetch_status()
+
+    def _fetch_status(self) -> BackendStatus:
+        """Query the server for the backend status.
+
         Returns:
             The status of the backend.
 
@@ -305,11 +707,40 @@ class IBMQBackend(BaseBackend):
         api_status = self._api_client.backend_status(self.name())
 
         try:
-            return BackendStatus.from_dict(api_status)
+            status = BackendStatus.from_dict(api_status)
         except TypeError as ex:
             raise IBMQBackendApiProtocolError(
                 'Unexpected return value received from the server when '
                 'getting backend status: {}'.format(str(ex))) from ex
+        self._last_status = (time.monotonic(), status)
+        return status
+
+    def _status_refresh_max_age(self) -> Optional[float]:
+        """Return the maximum age of the statuses refreshed in the background.
+
+        Returns:
+            Twice the refresh interval of the provider status snapshot, or
+            ``None`` if the statuses are not refreshed in the background.
+        """
+        try:
+            return self._provider.backends._status_snapshot.max_age
+        except AttributeError:
+            return None
+
+    def _recent_status(self, max_age: float) -> Optional[BackendStatus]:
+        """Return the last status retrieved, if recent enough.
+
+        Args:
+            max_age: Maximum age of the status, in seconds.
+
+        Returns:
+            The last status retrieved by :meth:`status`, or ``None`` if it was
+            retrieved more than `max_age` seconds ago.
+        """
+        last_status = self._last_status
+        if last_status and time.monotonic() - last_status[0] <= max_age:
+            return last_status[1]
+        return None
 
     def defaults(self, refresh: bool = False) -> Optional[PulseDefaults]:
         """Return the pulse defaults for the backend.
@@ -318,6 +749,9 @@ class IBMQBackend(BaseBackend):
         `Qiskit/ibm-quantum-schemas
         <https://github.com/Qiskit/ibm-quantum-schemas/blob/main/schemas/default_pulse_configuration_schema.json>`_.
 
+        The pulse defaults are cached according to the cache policy of the
+        backend, see :meth:`set_cache_policy`.
+
         Args:
             refresh: If ``True``, re-query the server for the backend pulse defaults.
                 Otherwise, return a cached version.
@@ -328,15 +762,20 @@ class IBMQBackend(BaseBackend):
         if not self.configuration().open_pulse:
             return None
 
-        if refresh or self._defaults is None:
-            api_defaults = self._api_client.backend_pulse_defaults(self.name())
-            if api_defaults:
-                decode_pulse_defaults(api_defaults)
-                self._defaults = PulseDefaults.from_dict(api_defaults)
-            else:
-                self._defaults = None
+        return self._defaults_cache.get(self._cache_policy, refresh)
+
+    def _fetch_defaults(self) -> Optional[PulseDefaults]:
+        """Query the server for the pulse defaults.
 
-        return self._defaults
+        Returns:
+            The pulse defaults or ``None`` if they are not available.
+        """
+        api_defaults = self._api_client.backend_pulse_defaults(self.name())
+        if not api_defaults:
+            return None
+        return BACKEND_INTERN_TABLE.intern(
+            ('defaults', self.name(), raw_digest(api_defaults)),
+            lambda: self._decode_defaults(api_defaults))
 
     def job_limit(self) -> BackendJobLimit:
         """Return the job limit for the backend.
@@ -420,8 +859,9 @@ class IBMQBackend(BaseBackend):
             job_tags: Optional[List[str]] = None,
             job_tags_operator: Optional[str] = "OR",
             descending: bool = True,
-            db_filter: Optional[Dict[str, Any]] = None
-    ) -> List[IBMQJob]:
+            db_filter: Optional[Dict[str, Any]] = None,
+            lightweight: bool = False
+    ) -> Union[List[IBMQJob], JobRecordBatch]:
         """Return the jobs submitted to this backend, subject to optional filtering.
 
         Retrieve jobs submitted to this backend that match the given filters
@@ -469,9 +909,15 @@ class IBMQBackend(BaseBackend):
 
                   filter = {'hubInfo.hub.name': 'ibm-q'}
                   job_list = backend.jobs(limit=5, db_filter=filter)
+            lightweight: If ``True``, return lightweight job records instead of
+                ``IBMQJob`` instances. See
+                :meth:`IBMQBackendService.jobs()<qiskit.providers.ibmq.IBMQBackendService.jobs>`
+                for more details.
 
         Returns:
-            A list of jobs that match the criteria.
+            A list of jobs that match the criteria, or a
+            :class:`~qiskit.providers.ibmq.job.JobRecordBatch` if `lightweight`
+            is ``True``.
 
         Raises:
             IBMQBackendValueError: If a keyword value is not recognized.
@@ -479,7 +925,7 @@ class IBMQBackend(BaseBackend):
         return self._provider.backends.jobs(
             limit, skip, self.name(), status,
             job_name, start_datetime, end_datetime, job_tags, job_tags_operator,
-            descending, db_filter)
+            descending, db_filter, lightweight)
 
     def active_jobs(self, limit: int = 10) -> List[IBMQJob]:
         """Return the unfinished jobs submitted to this backend.
@@ -541,6 +987,11 @@ class IBMQBackend(BaseBackend):
         Some of the reservation information, such as scheduling mode, is only
         available if you are the owner of the reservation.
 
+        If the provider indexes the reservations of its backends in the
+        background, using :meth:`IBMQBackendService.start_reservation_refresh()
+        <qiskit.providers.ibmq.IBMQBackendService.start_reservation_refresh>`,
+        the reservations within the indexed period are returned from the index.
+
         Args:
             start_datetime: Filter by the given start date/time, in local timezone.
             end_datetime: Filter by the given end date/time, in local timezone.
@@ -548,8 +999,34 @@ class IBMQBackend(BaseBackend):
         Returns:
             A list of reservations that match the criteria.
         """
+        try:
+            reservation_index = self._provider.backends._reservation_index
+        except AttributeError:
+            reservation_index = None
+        if reservation_index is not None:
+            reservations = reservation_index.reservations(
+                self.name(), start_datetime, end_datetime)
+            if reservations is not None:
+                return reservations
+
         start_datetime = local_to_utc(start_datetime) if start_datetime else None
         end_datetime = local_to_utc(end_datetime) if end_datetime else None
+        return self._fetch_reservations(start_datetime, end_datetime)
+
+    def _fetch_reservations(
+            self,
+            start_datetime: Optional[python_datetime],
+            end_datetime: Optional[python_datetime]
+    ) -> List[BackendReservation]:
+        """Query the server for the backend reservations.
+
+        Args:
+            start_datetime: Filter by the given start date/time, in UTC.
+            end_datetime: Filter by the given end date/time, in UTC.
+
+        Returns:
+            A list of reservations that match the criteria.
+        """
         raw_response = self._api_client.backend_reservations(
             self.name(), start_datetime, end_datetime)
         return convert_reservation_data(raw_response, self.name())
@@ -564,6 +1041,12 @@ class IBMQBackend(BaseBackend):
         `Qiskit/ibm-quantum-schemas
         <https://github.com/Qiskit/ibm-quantum-schemas/blob/main/schemas/backend_configuration_schema.json>`_.
 
+        Note:
+            The configuration is shared by all the backends with the same
+            configuration, for example through other providers, and should
+            be treated as read-only. Use ``copy.deepcopy()`` to get a
+            configuration that can be changed.
+
         Returns:
             The configuration for the backend.
         """
@@ -662,7 +1145,7 @@ class IBMQRetiredBackend(IBMQBackend):
         """Return the pulse defaults for the backend."""
         return None
 
-    def status(self) -> BackendStatus:
+    def status(self, max_age: Optional[float] = None) -> BackendStatus:
         """Return the backend status."""
         return self._status
 
@@ -696,6 +1179,18 @@ class IBMQRetiredBackend(IBMQBackend):
         """Run a Qobj."""
         raise IBMQBackendError('This backend ({}) is no longer available.'.format(self.name()))
 
+    def run_many(
+            self,
+            qobjs: List[Union[QasmQobj, PulseQobj]],
+            job_name: Optional[str] = None,
+            job_share_level: Optional[str] = None,
+            job_tags: Optional[List[str]] = None,
+            validate_qobj: bool = False,
+            max_workers: int = 4
+    ) -> None:
+        """Run several Qobjs."""
+        raise IBMQBackendError('This backend ({}) is no longer available.'.format(self.name()))
+
     @classmethod
     def from_name(
             cls,
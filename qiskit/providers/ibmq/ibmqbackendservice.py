@@ -16,22 +16,33 @@
 
 import logging
 import warnings
-import copy
+import functools
 
-from typing import Dict, List, Callable, Optional, Any, Union
+from typing import Dict, List, Callable, Optional, Any, Union, Tuple, Iterator, Sequence
 from datetime import datetime
+from collections import OrderedDict
+from concurrent import futures
 
 from qiskit.providers.jobstatus import JobStatus
-from qiskit.providers.exceptions import QiskitBackendNotFoundError
+from qiskit.providers.models import BackendStatus
 from qiskit.providers.providerutils import filter_backends
 from qiskit.providers.ibmq import accountprovider  # pylint: disable=unused-import
 
 from .api.exceptions import ApiError
-from .apiconstants import ApiJobStatus
-from .exceptions import (IBMQBackendValueError, IBMQBackendApiError, IBMQBackendApiProtocolError)
-from .ibmqbackend import IBMQBackend, IBMQRetiredBackend
+from .apiconstants import ApiJobStatus, JOB_REQUIRED_FIELDS, JOB_FIELDS_PRESETS
+from .api.rest.utils.data_mapper import job_api_field_name
+from .exceptions import (IBMQBackendError, IBMQBackendValueError, IBMQBackendApiError,
+                         IBMQBackendApiProtocolError)
+from .ibmqbackend import IBMQBackend
 from .backendreservation import BackendReservation
+from .backendstatus import BackendStatusSnapshot, backend_statuses
+from .reservationindex import ReservationIndex
+from .backendcache import backend_config_cache_key
 from .job import IBMQJob
+from .job.jobrecord import JobRecordBatch
+from .job.jobindex import JobIndex, job_index
+from .job.bulk import JobOperationReport, run_job_operation
+from .job.utils import api_to_job_error, get_cancel_status
 from .utils.utils import to_python_identifier, validate_job_tags, filter_data
 from .utils.converters import local_to_utc
 from .utils.backend import convert_reservation_data
@@ -60,8 +71,24 @@ class IBMQBackendService:
     It is also possible to retrieve a single job without specifying the backend name::
 
         job = provider.backends.retrieve_job(<JOB_ID>)
+
+    Many jobs can be retrieved at once, with concurrent queries, using::
+
+        jobs, errors = provider.backends.retrieve_jobs([<JOB_ID>, <JOB_ID>])
+
+    To go through a large number of jobs without holding all of them in
+    memory, iterate over them as they are retrieved using::
+
+        for job in provider.backends.iter_jobs(status='ERROR'):
+            print(job.job_id())
     """
 
+    _job_page_size = 20
+    """Number of jobs requested per page when retrieving all the jobs."""
+
+    _job_index_chunk_size = 20
+    """Number of unfinished jobs requested per query when updating the job index."""
+
     def __init__(self, provider: 'accountprovider.AccountProvider') -> None:
         """IBMQBackendService constructor.
 
@@ -71,10 +98,17 @@ class IBMQBackendService:
         super().__init__()
 
         self._provider = provider
-        self._discover_backends()
+        self._backends_discovered = False
+        self._backend_name_aliases = self._aliased_backend_names()
+        self._backend_name_aliases.update(self._deprecated_backend_names())
+        self._status_snapshot = BackendStatusSnapshot(provider)
+        self._reservation_index = ReservationIndex(provider)
 
     def _discover_backends(self) -> None:
         """Discovers the remote backends for this provider, if not already known."""
+        if self._backends_discovered:
+            return
+        self._backends_discovered = True
         for backend in self._provider._backends.values():
             backend_name = to_python_identifier(backend.name())
 
@@ -84,6 +118,22 @@ class IBMQBackendService:
 
             setattr(self, backend_name, backend)
 
+    def __getattr__(self, name: str) -> IBMQBackend:
+        """Return the backend for an attribute, discovering the backends if needed."""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        self._discover_backends()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__, name)) from None
+
+    def __dir__(self) -> List[str]:
+        """Return the attributes, including the backends, for autocompletion."""
+        self._discover_backends()
+        return list(super().__dir__())
+
     def __call__(
             self,
             name: Optional[str] = None,
@@ -110,18 +160,86 @@ class IBMQBackendService:
         Returns:
             The list of available backends that match the filter.
         """
-        backends = self._provider._backends.values()
-
         # Special handling of the `name` parameter, to support alias
-        # resolution.
+        # resolution. Only the named backend is instantiated.
         if name:
-            aliases = self._aliased_backend_names()
-            aliases.update(self._deprecated_backend_names())
-            name = aliases.get(name, name)
+            name = self._backend_name_aliases.get(name, name)
             kwargs['backend_name'] = name
+            backend = self._provider._get_remote_backend(name, timeout=timeout)
+            backends = [backend] if backend else []  # type: List[IBMQBackend]
+        else:
+            backends = list(self._provider._discover_remote_backends(timeout=timeout).values())
 
         return filter_backends(backends, filters=filters, **kwargs)
 
+    def statuses(
+            self,
+            max_age: Optional[float] = None,
+            max_workers: int = 8
+    ) -> Dict[str, BackendStatus]:
+        """Return the status of all the backends, retrieved concurrently.
+
+        Args:
+            max_age: If set, the last status retrieved for a backend is reused
+                if it was retrieved at most this many seconds ago. If ``None``
+                and the statuses are refreshed in the background, see
+                :meth:`start_status_refresh()`, the statuses from the last
+                refresh are returned.
+            max_workers: Maximum number of concurrent queries.
+
+        Returns:
+            The status of each backend, keyed by backend name.
+        """
+        backends = list(self._provider._backends.values())
+        statuses = backend_statuses(backends, max_age=max_age, max_workers=max_workers)
+        return {backend.name(): status for backend, status in zip(backends, statuses)}
+
+    def start_status_refresh(self, interval: float = 60) -> None:
+        """Refresh the status of all the backends in the background.
+
+        The status of every backend is queried concurrently every `interval`
+        seconds. Until :meth:`stop_status_refresh()` is called,
+        :meth:`IBMQBackend.status()` and the backend filters return the
+        status from the last refresh instead of querying the server, so the
+        number of status queries does not grow with the number of callers::
+
+            provider.backends.start_status_refresh(interval=30)
+            backend = least_busy(provider.backends(simulator=False, operational=True))
+
+        Args:
+            interval: Number of seconds between refreshes.
+        """
+        self._status_snapshot.start(interval)
+
+    def stop_status_refresh(self) -> None:
+        """Stop refreshing the status of the backends in the background."""
+        self._status_snapshot.stop()
+
+    def start_reservation_refresh(self, interval: float = 600, horizon: float = 2880) -> None:
+        """Index the upcoming reservations of all the backends in the background.
+
+        The reservations of every backend starting within the next `horizon`
+        minutes are retrieved concurrently every `interval` seconds. Until
+        :meth:`stop_reservation_refresh()` is called,
+        :meth:`IBMQBackend.reservations()`, :func:`~qiskit.providers.ibmq.least_busy`
+        and the dashboard answer the queries within that period from the
+        index instead of querying the server::
+
+            provider.backends.start_reservation_refresh()
+            now = datetime.now()
+            reserved = backend.reservations(now, now + timedelta(hours=1))
+
+        Args:
+            interval: Number of seconds between refreshes.
+            horizon: Number of minutes after each refresh covered by the index.
+        """
+        self._reservation_index.horizon = horizon
+        self._reservation_index.start(interval)
+
+    def stop_reservation_refresh(self) -> None:
+        """Stop indexing the reservations of the backends in the background."""
+        self._reservation_index.stop()
+
     def jobs(
             self,
             limit: int = 10,
@@ -134,8 +252,10 @@ class IBMQBackendService:
             job_tags: Optional[List[str]] = None,
             job_tags_operator: Optional[str] = "OR",
             descending: bool = True,
-            db_filter: Optional[Dict[str, Any]] = None
-    ) -> List[IBMQJob]:
+            db_filter: Optional[Dict[str, Any]] = None,
+            lightweight: bool = False,
+            fields: Optional[Union[str, List[str]]] = None
+    ) -> Union[List[IBMQJob], JobRecordBatch]:
         """Return a list of jobs, subject to optional filtering.
 
         Retrieve jobs that match the given filters and paginate the results
@@ -183,15 +303,164 @@ class IBMQBackendService:
 
                   filter = {'hubInfo.hub.name': 'ibm-q'}
                   job_list = backend.jobs(limit=5, db_filter=filter)
+            lightweight: If ``True``, return a
+                :class:`~qiskit.providers.ibmq.job.JobRecordBatch` of
+                lightweight job records instead of ``IBMQJob`` instances. This
+                uses considerably less memory when retrieving a large number of
+                jobs. Each record can be upgraded to an ``IBMQJob`` using its
+                ``to_job()`` method.
+            fields: Job fields to retrieve, to reduce the amount of data
+                transferred. Either the name of a preset, ``status_only`` or
+                ``summary``, or a list of field names, such as
+                ``['name', 'tags']``. The job ID, status, creation date, kind
+                and backend are always retrieved. Other fields are retrieved
+                from the server the first time one of them is needed. If
+                ``None``, all the fields are retrieved.
+
+        Returns:
+            A list of ``IBMQJob`` instances, or a ``JobRecordBatch`` if
+            `lightweight` is ``True``.
+
+        Raises:
+            IBMQBackendValueError: If a keyword value is not recognized.
+            TypeError: If the input `start_datetime` or `end_datetime` parameter value
+                is not valid.
+        """
+        api_filter = self._get_jobs_filter(
+            backend_name=backend_name, status=status, job_name=job_name,
+            start_datetime=start_datetime, end_datetime=end_datetime,
+            job_tags=job_tags, job_tags_operator=job_tags_operator, db_filter=db_filter)
+        api_fields = self._get_api_job_fields(fields)
+
+        if lightweight:
+            job_pages, partial_data = self._select_job_pages(
+                api_filter, limit, skip, descending, api_fields)
+            job_list = JobRecordBatch(functools.partial(
+                self._job_from_response,
+                partial_data=partial_data))  # type: Union[List[IBMQJob], JobRecordBatch]
+            for job_page in job_pages:
+                for job_info in job_page:
+                    job_list.append(job_info)
+            return job_list
+
+        return list(self._iter_jobs(api_filter, limit, skip, descending, api_fields))
+
+    def iter_jobs(
+            self,
+            limit: Optional[int] = None,
+            skip: int = 0,
+            backend_name: Optional[str] = None,
+            status: Optional[Union[JobStatus, str, List[Union[JobStatus, str]]]] = None,
+            job_name: Optional[str] = None,
+            start_datetime: Optional[datetime] = None,
+            end_datetime: Optional[datetime] = None,
+            job_tags: Optional[List[str]] = None,
+            job_tags_operator: Optional[str] = "OR",
+            descending: bool = True,
+            db_filter: Optional[Dict[str, Any]] = None,
+            fields: Optional[Union[str, List[str]]] = None
+    ) -> Iterator[IBMQJob]:
+        """Return an iterator over the jobs, subject to optional filtering.
+
+        Unlike :meth:`jobs`, the jobs are yielded as soon as each page is
+        returned by the server, while the next page is being retrieved in
+        the background. Only the current and next pages are held in memory,
+        so iterating over the whole job history does not require holding
+        all of it at once::
+
+            for job in provider.backends.iter_jobs(status='ERROR'):
+                print(job.job_id())
+
+        The arguments are the same as for :meth:`jobs`, except that by
+        default all the matching jobs are returned.
+
+        Args:
+            limit: Number of jobs to retrieve. If ``None``, all the matching
+                jobs are retrieved.
+            skip: Starting index for the job retrieval.
+            backend_name: Name of the backend to retrieve jobs from.
+            status: Only get jobs with this status or one of the statuses.
+            job_name: Filter by job name, matched partially as a regular expression.
+            start_datetime: Filter by the given start date, in local time.
+            end_datetime: Filter by the given end date, in local time.
+            job_tags: Filter by tags assigned to jobs.
+            job_tags_operator: Logical operator to use when filtering by job
+                tags. Valid values are "AND" and "OR".
+            descending: If ``True``, return the jobs in descending order of the job
+                creation date (i.e. newest first).
+            db_filter: A `loopback-based filter
+                <https://loopback.io/doc/en/lb2/Querying-data.html>`_.
+            fields: Job fields to retrieve, either the name of a preset,
+                ``status_only`` or ``summary``, or a list of field names.
+                If ``None``, all the fields are retrieved.
 
         Returns:
-            A list of ``IBMQJob`` instances.
+            An iterator over the ``IBMQJob`` instances.
 
         Raises:
             IBMQBackendValueError: If a keyword value is not recognized.
             TypeError: If the input `start_datetime` or `end_datetime` parameter value
                 is not valid.
         """
+        api_filter = self._get_jobs_filter(
+            backend_name=backend_name, status=status, job_name=job_name,
+            start_datetime=start_datetime, end_datetime=end_datetime,
+            job_tags=job_tags, job_tags_operator=job_tags_operator, db_filter=db_filter)
+        return self._iter_jobs(api_filter, limit, skip, descending,
+                               self._get_api_job_fields(fields))
+
+    @staticmethod
+    def _get_api_job_fields(
+            fields: Optional[Union[str, List[str]]]
+    ) -> Optional[List[str]]:
+        """Return the server names of the job fields to retrieve.
+
+        Args:
+            fields: Name of a preset, or list of field names.
+
+        Returns:
+            The field names used by the server, including the ones always
+            needed, or ``None`` to retrieve all the fields.
+
+        Raises:
+            IBMQBackendValueError: If `fields` is not a valid preset name.
+        """
+        if fields is None:
+            return None
+        if isinstance(fields, str):
+            try:
+                api_fields = list(JOB_FIELDS_PRESETS[fields])
+            except KeyError:
+                raise IBMQBackendValueError(
+                    '"{}" is not a valid fields preset. Valid values are {}.'.format(
+                        fields, ', '.join(JOB_FIELDS_PRESETS))) from None
+        else:
+            api_fields = [job_api_field_name(field) for field in fields]
+        return list(JOB_REQUIRED_FIELDS) + \
+            [field for field in OrderedDict.fromkeys(api_fields)
+             if field not in JOB_REQUIRED_FIELDS]
+
+    def _get_jobs_filter(
+            self,
+            backend_name: Optional[str] = None,
+            status: Optional[Union[JobStatus, str, List[Union[JobStatus, str]]]] = None,
+            job_name: Optional[str] = None,
+            start_datetime: Optional[datetime] = None,
+            end_datetime: Optional[datetime] = None,
+            job_tags: Optional[List[str]] = None,
+            job_tags_operator: Optional[str] = "OR",
+            db_filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the filter of a job query.
+
+        See :meth:`jobs` for a description of the arguments.
+
+        Returns:
+            The filter to pass to the server.
+
+        Raises:
+            IBMQBackendValueError: If a keyword value is not recognized.
+        """
         # Build the filter for the query.
         api_filter = {}  # type: Dict[str, Any]
 
@@ -209,7 +478,7 @@ class IBMQBackendService:
         if start_datetime or end_datetime:
             warnings.warn('Unless a UTC timezone information is present, the parameters '
                           '`start_datetime` and `end_datetime` are now expected to be in '
-                          'local time instead of UTC.', stacklevel=2)
+                          'local time instead of UTC.', stacklevel=3)
 
             api_filter['creationDate'] = self._update_creation_date_filter(
                 cur_dt_filter={},
@@ -240,78 +509,345 @@ class IBMQBackendService:
             # Argument filters takes precedence over db_filter for same keys
             api_filter = {**db_filter, **api_filter}
 
-        # Retrieve the requested number of jobs, using pagination. The server
-        # might limit the number of jobs per request.
-        job_responses = []  # type: List[Dict[str, Any]]
-        current_page_limit = limit or 20
-        initial_filter = copy.deepcopy(api_filter)
+        return api_filter
 
-        while True:
-            job_page = self._provider._api_client.list_jobs_statuses(
-                limit=current_page_limit, skip=skip, descending=descending,
-                extra_filter=api_filter)
-            if logger.getEffectiveLevel() is logging.DEBUG:
-                filtered_data = [filter_data(job) for job in job_page]
-                logger.debug("jobs() response data is %s", filtered_data)
-            job_responses += job_page
+    def _iter_jobs(
+            self,
+            api_filter: Dict[str, Any],
+            limit: Optional[int],
+            skip: int,
+            descending: bool,
+            api_fields: Optional[List[str]] = None
+    ) -> Iterator[IBMQJob]:
+        """Yield the jobs matching a filter, page by page.
+
+        Args:
+            api_filter: Filter to pass to the server.
+            limit: Number of jobs to retrieve, or ``None`` for all of them.
+            skip: Starting index for the job retrieval.
+            descending: Whether to retrieve the newest jobs first.
+            api_fields: Server names of the job fields to retrieve, or
+                ``None`` for all of them.
+
+        Yields:
+            The ``IBMQJob`` instances.
+        """
+        job_pages, partial_data = self._select_job_pages(
+            api_filter, limit, skip, descending, api_fields)
+        for job_page in job_pages:
+            for job_info in job_page:
+                try:
+                    job = self._job_from_response(job_info, partial_data=partial_data)
+                except IBMQBackendApiProtocolError:
+                    logger.warning('Discarding job "%s" because it contains invalid data.',
+                                   job_info.get('job_id', ""))
+                    continue
+                yield job
+
+    def _select_job_pages(
+            self,
+            api_filter: Dict[str, Any],
+            limit: Optional[int],
+            skip: int,
+            descending: bool,
+            api_fields: Optional[List[str]] = None
+    ) -> Tuple[Iterator[List[Dict[str, Any]]], bool]:
+        """Return the pages of raw job data matching a filter, from the job index if possible.
+
+        Args:
+            api_filter: Filter to pass to the server.
+            limit: Number of jobs to retrieve, or ``None`` for all of them.
+            skip: Starting index for the job retrieval.
+            descending: Whether to retrieve the newest jobs first.
+            api_fields: Server names of the job fields to retrieve, or
+                ``None`` for all of them.
+
+        Returns:
+            An iterator over the pages of raw job data, and whether the job
+            data only includes some of the job fields.
+        """
+        index = self._job_index()
+        if index is not None and index.supports(api_filter):
+            self._sync_job_index(index)
+            # The index holds all the fields returned by the server.
+            return self._indexed_job_pages(index, api_filter, limit, skip, descending), False
+        return self._job_pages(api_filter, limit, skip, descending, api_fields), \
+            bool(api_fields)
+
+    def _job_index(self) -> Optional[JobIndex]:
+        """Return the job index of this provider.
+
+        Returns:
+            The job index, or ``None`` if the job index is not enabled.
+        """
+        return job_index(backend_config_cache_key(self._provider.credentials))
+
+    def _indexed_job_pages(
+            self,
+            index: JobIndex,
+            api_filter: Dict[str, Any],
+            limit: Optional[int],
+            skip: int,
+            descending: bool
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the pages of raw job data matching a filter from the job index.
+
+        Args:
+            index: The job index.
+            api_filter: Filter of the query, supported by the index.
+            limit: Number of jobs to retrieve, or ``None`` for all of them.
+            skip: Starting index for the job retrieval.
+            descending: Whether to retrieve the newest jobs first.
 
+        Yields:
+            The pages of raw job data.
+        """
+        retrieved_count = 0
+        while limit is None or retrieved_count < limit:
+            page_limit = self._job_page_size if limit is None \
+                else min(self._job_page_size, limit - retrieved_count)
+            job_page = index.query(api_filter, page_limit, skip + retrieved_count, descending)
             if not job_page:
-                # Stop if there are no more jobs returned by the server.
-                break
-
-            if limit:
-                if len(job_responses) >= limit:
-                    # Stop if we have reached the limit.
-                    break
-                current_page_limit = limit - len(job_responses)
-            else:
-                current_page_limit = 20
-
-            # Use the last received job for pagination.
-            skip = 0
-            last_job = job_page[-1]
-            api_filter = copy.deepcopy(initial_filter)
-            cur_dt_filter = api_filter.pop('creationDate', {})
-            if descending:
-                new_dt_filter = self._update_creation_date_filter(
-                    cur_dt_filter=cur_dt_filter, lte_dt=last_job['creation_date'])
-            else:
-                new_dt_filter = self._update_creation_date_filter(
-                    cur_dt_filter=cur_dt_filter, gte_dt=last_job['creation_date'])
-            if not cur_dt_filter:
-                api_filter['creationDate'] = new_dt_filter
-            else:
-                self._merge_logical_filters(
-                    api_filter, {'and': [{'creationDate': new_dt_filter}, cur_dt_filter]})
+                return
+            retrieved_count += len(job_page)
+            yield job_page
 
-            if 'id' not in api_filter:
-                api_filter['id'] = {'nin': [last_job['job_id']]}
-            else:
-                new_id_filter = {'and': [{'id': {'nin': [last_job['job_id']]}},
-                                         {'id': api_filter.pop('id')}]}
-                self._merge_logical_filters(api_filter, new_id_filter)
+    def sync_job_index(self, full: bool = False) -> int:
+        """Bring the local job index up to date.
 
-        job_list = []
-        for job_info in job_responses:
-            job_id = job_info.get('job_id', "")
-            # Recreate the backend used for this job.
-            backend_name = job_info.get('_backend_info', {}).get('name', 'unknown')
-            try:
-                backend = self._provider.get_backend(backend_name)
-            except QiskitBackendNotFoundError:
-                backend = IBMQRetiredBackend.from_name(backend_name,
-                                                       self._provider,
-                                                       self._provider.credentials,
-                                                       self._provider._api_client)
-            try:
-                job = IBMQJob(backend=backend, api_client=self._provider._api_client, **job_info)
-            except TypeError:
-                logger.warning('Discarding job "%s" because it contains invalid data.', job_id)
-                continue
+        Job queries update the index before using it, so calling this method
+        is only needed to update the index ahead of time, or to rebuild it.
+
+        Args:
+            full: If ``True``, discard the index and retrieve all the jobs again.
+                Otherwise, only retrieve the jobs created since the most
+                recent job in the index, and the jobs that were not in a
+                final state.
+
+        Returns:
+            The number of jobs in the index.
+
+        Raises:
+            IBMQBackendError: If the job index is not enabled.
+        """
+        index = self._job_index()
+        if index is None:
+            raise IBMQBackendError(
+                'The job index is not enabled. Use enable_job_index() to enable it.')
+        self._sync_job_index(index, full)
+        return len(index)
+
+    def _sync_job_index(self, index: JobIndex, full: bool = False) -> None:
+        """Retrieve the jobs created or updated since the job index was last updated.
+
+        Args:
+            index: The job index.
+            full: Whether to discard the index and retrieve all the jobs again.
+        """
+        with index.sync_lock:
+            if full:
+                index.clear()
+
+            # Unfinished jobs that are no longer returned by the server were
+            # deleted, and are removed so that they are not queried again.
+            unfinished_ids = index.unfinished_job_ids()
+            for start in range(0, len(unfinished_ids), self._job_index_chunk_size):
+                chunk = unfinished_ids[start:start+self._job_index_chunk_size]
+                missing_ids = set(chunk)
+                for job_page in self._job_pages({'id': {'inq': chunk}}, None, 0, False):
+                    index.add(job_page)
+                    missing_ids.difference_update(
+                        job_info.get('job_id') for job_info in job_page)
+                if missing_ids:
+                    index.remove(sorted(missing_ids))
+
+            # Continue from the most recent jobs already indexed, in the
+            # same way as the pagination of the job queries.
+            api_filter = {}  # type: Dict[str, Any]
+            last_date, last_ids = index.watermark()
+            if last_date:
+                api_filter = {'creationDate': {'gte': last_date}, 'id': {'nin': last_ids}}
+            added_count = 0
+            for job_page in self._job_pages(api_filter, None, 0, False):
+                index.add(job_page)
+                added_count += len(job_page)
+            logger.debug('Updated %d unfinished jobs and added %d new jobs to the job index.',
+                         len(unfinished_ids), added_count)
+
+    def _job_pages(
+            self,
+            api_filter: Dict[str, Any],
+            limit: Optional[int],
+            skip: int,
+            descending: bool,
+            api_fields: Optional[List[str]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield the pages of raw job data matching a filter.
+
+        The server might limit the number of jobs per request, so the jobs are
+        retrieved using pagination. The next page is requested in the
+        background as soon as a page arrives.
+
+        Args:
+            api_filter: Filter to pass to the server.
+            limit: Number of jobs to retrieve, or ``None`` for all of them.
+            skip: Starting index for the job retrieval.
+            descending: Whether to retrieve the newest jobs first.
+            api_fields: Server names of the job fields to retrieve, or
+                ``None`` for all of them.
+
+        Yields:
+            The pages of raw job data.
+        """
+        retrieved_count = 0
+        page_limit = limit or self._job_page_size
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = executor.submit(self._get_job_page, page_limit, skip,
+                                        descending, api_filter, api_fields)
+            while True:
+                job_page = next_page.result()
+                if not job_page:
+                    # Stop if there are no more jobs returned by the server.
+                    return
+
+                retrieved_count += len(job_page)
+                if limit:
+                    if retrieved_count >= limit:
+                        # Stop if we have reached the limit.
+                        yield job_page
+                        return
+                    page_limit = limit - retrieved_count
+
+                # Use the last received job for pagination.
+                next_page = executor.submit(
+                    self._get_job_page, page_limit, 0, descending,
+                    self._get_next_page_filter(api_filter, job_page[-1], descending),
+                    api_fields)
+                yield job_page
+        finally:
+            executor.shutdown(wait=False)
+
+    def _get_job_page(
+            self,
+            limit: int,
+            skip: int,
+            descending: bool,
+            api_filter: Dict[str, Any],
+            api_fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve a page of raw job data.
+
+        Args:
+            limit: Maximum number of jobs to retrieve.
+            skip: Starting index for the job retrieval.
+            descending: Whether to retrieve the newest jobs first.
+            api_filter: Filter to pass to the server.
+            api_fields: Server names of the job fields to retrieve, or
+                ``None`` for all of them.
+
+        Returns:
+            The raw job data.
+        """
+        job_page = self._provider._api_client.list_jobs_statuses(
+            limit=limit, skip=skip, descending=descending, extra_filter=api_filter,
+            fields=api_fields)
+        if logger.getEffectiveLevel() is logging.DEBUG:
+            filtered_data = [filter_data(job) for job in job_page]
+            logger.debug("jobs() response data is %s", filtered_data)
+        return job_page
+
+    def _get_next_page_filter(
+            self,
+            initial_filter: Dict[str, Any],
+            last_job: Dict[str, Any],
+            descending: bool
+    ) -> Dict[str, Any]:
+        """Return the filter for the page following a job.
+
+        Args:
+            initial_filter: Filter of the query. It is left unchanged.
+            last_job: Raw data of the last job received.
+            descending: Whether the jobs are retrieved newest first.
+
+        Returns:
+            The filter for the jobs following `last_job`.
+        """
+        # Only copy the parts of the filter modified below.
+        api_filter = dict(initial_filter)
+        for key in ('and', 'or'):
+            if key in api_filter:
+                api_filter[key] = list(api_filter[key])
+        cur_dt_filter = api_filter.pop('creationDate', {})
+        if isinstance(cur_dt_filter, dict):
+            cur_dt_filter = dict(cur_dt_filter)
+
+        if descending:
+            new_dt_filter = self._update_creation_date_filter(
+                cur_dt_filter=cur_dt_filter, lte_dt=last_job['creation_date'])
+        else:
+            new_dt_filter = self._update_creation_date_filter(
+                cur_dt_filter=cur_dt_filter, gte_dt=last_job['creation_date'])
+        if not cur_dt_filter:
+            api_filter['creationDate'] = new_dt_filter
+        else:
+            self._merge_logical_filters(
+                api_filter, {'and': [{'creationDate': new_dt_filter}, cur_dt_filter]})
+
+        if 'id' not in api_filter:
+            api_filter['id'] = {'nin': [last_job['job_id']]}
+        else:
+            new_id_filter = {'and': [{'id': {'nin': [last_job['job_id']]}},
+                                     {'id': api_filter.pop('id')}]}
+            self._merge_logical_filters(api_filter, new_id_filter)
+
+        return api_filter
+
+    def _get_job_backend(self, backend_name: str) -> IBMQBackend:
+        """Return the backend a job was submitted to.
+
+        Args:
+            backend_name: Name of the backend.
+
+        Returns:
+            The backend with the given name, or an ``IBMQRetiredBackend``
+            if the backend is no longer available to this provider.
+        """
+        name = self._backend_name_aliases.get(backend_name)
+        if name:
+            backend = self._provider._get_remote_backend(name)
+            if backend is not None:
+                return backend
+        return self._provider._get_job_backend(backend_name)
+
+    def _job_from_response(
+            self,
+            job_info: Dict[str, Any],
+            partial_data: bool = False
+    ) -> IBMQJob:
+        """Return a job instance built from the job data returned by the server.
+
+        Args:
+            job_info: Job data returned by the server.
+            partial_data: Whether the job data only includes some of the job fields.
 
-            job_list.append(job)
+        Returns:
+            The job instance.
 
-        return job_list
+        Raises:
+            IBMQBackendApiProtocolError: If the job data is not valid.
+        """
+        # Recreate the backend used for this job.
+        backend_name = job_info.get('_backend_info', {}).get('name', 'unknown')
+        backend = self._get_job_backend(backend_name)
+        try:
+            return IBMQJob(backend=backend, api_client=self._provider._api_client,
+                           partial_data=partial_data, **job_info)
+        except TypeError as ex:
+            raise IBMQBackendApiProtocolError(
+                'Unexpected return value received from the server when '
+                'retrieving job {}: {}'.format(job_info.get('job_id', ""), str(ex))) from ex
 
     def _merge_logical_filters(self, cur_filter: Dict, new_filter: Dict) -> None:
         """Merge the logical operators in the input filters.
@@ -461,23 +997,213 @@ class IBMQBackendService:
             raise IBMQBackendApiError('Failed to get job {}: {}'
                                       .format(job_id, str(ex))) from ex
 
-        # Recreate the backend used for this job.
-        backend_name = job_info.get('_backend_info', {}).get('name', 'unknown')
-        try:
-            backend = self._provider.get_backend(backend_name)
-        except QiskitBackendNotFoundError:
-            backend = IBMQRetiredBackend.from_name(backend_name,
-                                                   self._provider,
-                                                   self._provider.credentials,
-                                                   self._provider._api_client)
+        return self._job_from_response(job_info)
+
+    def retrieve_jobs(
+            self,
+            job_ids: List[str],
+            chunk_size: int = 20,
+            max_workers: int = 5
+    ) -> Tuple[List[Optional[IBMQJob]], Dict[str, IBMQBackendError]]:
+        """Return multiple jobs.
+
+        The jobs are retrieved in chunks of `chunk_size` IDs, using one job
+        listing query per chunk, and the chunks are retrieved concurrently.
+        This is much faster than calling :meth:`retrieve_job()` for each job
+        when retrieving a large number of jobs::
+
+            jobs, errors = provider.backends.retrieve_jobs(job_ids)
+            for job_id, error in errors.items():
+                print("Unable to retrieve job {}: {}".format(job_id, error))
+
+        Note:
+            Similar to :meth:`jobs()`, the server only sends back a subset of
+            the job information when listing jobs. The rest of the
+            information is retrieved when it is needed.
+
+        Args:
+            job_ids: IDs of the jobs to retrieve.
+            chunk_size: Maximum number of jobs to retrieve in a single query.
+            max_workers: Maximum number of queries to run concurrently.
+
+        Returns:
+            A tuple of the retrieved jobs, in the same order as `job_ids`, and
+            a dictionary of the errors encountered, keyed by job ID. An entry
+            in the list of jobs is ``None`` if the job could not be retrieved.
+
+        Raises:
+            IBMQBackendValueError: If `chunk_size` or `max_workers` is not
+                a positive integer.
+        """
+        if chunk_size < 1 or max_workers < 1:
+            raise IBMQBackendValueError(
+                '"chunk_size" and "max_workers" need to be positive integers.')
+
+        unique_ids = list(dict.fromkeys(job_ids))
+        chunks = [unique_ids[idx:idx+chunk_size]
+                  for idx in range(0, len(unique_ids), chunk_size)]
+        retrieved = {}  # type: Dict[str, IBMQJob]
+        errors = {}  # type: Dict[str, IBMQBackendError]
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_futures = {executor.submit(self._retrieve_jobs_chunk, chunk): chunk
+                             for chunk in chunks}
+            for future in futures.as_completed(chunk_futures):
+                chunk = chunk_futures[future]
+                try:
+                    chunk_jobs, chunk_errors = future.result()
+                except IBMQBackendError as ex:
+                    chunk_jobs = {}
+                    chunk_errors = {job_id: ex for job_id in chunk}
+                retrieved.update(chunk_jobs)
+                errors.update(chunk_errors)
+
+            # Jobs not returned by the listing are retrieved individually,
+            # which also reports the reason they are missing.
+            missing_ids = [job_id for job_id in unique_ids
+                           if job_id not in retrieved and job_id not in errors]
+            job_futures = {executor.submit(self.retrieve_job, job_id): job_id
+                           for job_id in missing_ids}
+            for future in futures.as_completed(job_futures):
+                job_id = job_futures[future]
+                try:
+                    retrieved[job_id] = future.result()
+                except IBMQBackendError as ex:
+                    errors[job_id] = ex
+
+        return [retrieved.get(job_id, None) for job_id in job_ids], errors
+
+    def _retrieve_jobs_chunk(
+            self,
+            job_ids: List[str]
+    ) -> Tuple[Dict[str, IBMQJob], Dict[str, IBMQBackendError]]:
+        """Retrieve a chunk of jobs using a single job listing query.
+
+        Args:
+            job_ids: IDs of the jobs to retrieve.
+
+        Returns:
+            A tuple of the retrieved jobs and the errors encountered, both
+            keyed by job ID. Jobs not returned by the server are in neither.
+
+        Raises:
+            IBMQBackendApiError: If an unexpected error occurred when retrieving
+                the jobs.
+        """
         try:
-            job = IBMQJob(backend=backend, api_client=self._provider._api_client, **job_info)
-        except TypeError as ex:
-            raise IBMQBackendApiProtocolError(
-                'Unexpected return value received from the server '
-                'when retrieving job {}: {}'.format(job_id, str(ex))) from ex
+            job_page = self._provider._api_client.list_jobs_statuses(
+                limit=len(job_ids), skip=0, extra_filter={'id': {'inq': job_ids}})
+        except ApiError as ex:
+            raise IBMQBackendApiError('Failed to get jobs: {}'.format(str(ex))) from ex
 
-        return job
+        retrieved = {}  # type: Dict[str, IBMQJob]
+        errors = {}  # type: Dict[str, IBMQBackendError]
+        for job_info in job_page:
+            job_id = job_info.get('job_id', "")
+            try:
+                retrieved[job_id] = self._job_from_response(job_info)
+            except IBMQBackendApiProtocolError as ex:
+                errors[job_id] = ex
+        return retrieved, errors
+
+    def cancel_jobs(
+            self,
+            jobs: Sequence[Union[str, IBMQJob]],
+            max_workers: int = 8,
+            max_rate: Optional[float] = 50
+    ) -> JobOperationReport:
+        """Cancel multiple jobs, concurrently.
+
+        For example, to cancel all the queued jobs on a backend::
+
+            queued = provider.backends.jobs(backend_name='ibmq_vigo', status='QUEUED',
+                                            limit=None, fields='status_only')
+            report = provider.backends.cancel_jobs(queued)
+            for job_id, error in report.errors.items():
+                print("Unable to cancel job {}: {}".format(job_id, error))
+
+        Note:
+            Depending on the state the jobs are in, it might be impossible to
+            cancel some of them.
+
+        Args:
+            jobs: The jobs, or IDs of the jobs, to cancel.
+            max_workers: Maximum number of requests run concurrently.
+            max_rate: Maximum number of requests started per second. If
+                ``None``, the rate is not limited.
+
+        Returns:
+            A report with, for each job, whether it was cancelled, or the error
+            raised when trying to cancel it.
+        """
+        def _cancel(job: Union[str, IBMQJob]) -> bool:
+            if isinstance(job, IBMQJob):
+                return job.cancel()
+            with api_to_job_error():
+                return get_cancel_status(self._provider._api_client.job_cancel(job))
+
+        return run_job_operation(jobs, self._bulk_job_id, _cancel,
+                                 max_workers=max_workers, max_rate=max_rate)
+
+    def update_jobs_tags(
+            self,
+            jobs: Sequence[Union[str, IBMQJob]],
+            replacement_tags: Optional[List[str]] = None,
+            additional_tags: Optional[List[str]] = None,
+            removal_tags: Optional[List[str]] = None,
+            max_workers: int = 8,
+            max_rate: Optional[float] = 50
+    ) -> JobOperationReport:
+        """Update the tags of multiple jobs, concurrently.
+
+        The tags of each job are updated as done by
+        :meth:`IBMQJob.update_tags()<qiskit.providers.ibmq.job.IBMQJob.update_tags>`.
+        The jobs given by ID are retrieved first, with :meth:`retrieve_jobs()`.
+
+        Args:
+            jobs: The jobs, or IDs of the jobs, to update.
+            replacement_tags: The tags that should replace the current tags
+                associated with each job.
+            additional_tags: The new tags that should be added to the current tags
+                associated with each job.
+            removal_tags: The tags that should be removed from the current tags
+                associated with each job.
+            max_workers: Maximum number of requests run concurrently.
+            max_rate: Maximum number of updates started per second. If
+                ``None``, the rate is not limited.
+
+        Returns:
+            A report with, for each job, its new tags, or the error raised when
+            trying to update them.
+
+        Raises:
+            IBMQBackendValueError: If none of the tags parameters are specified.
+        """
+        if (replacement_tags is None) and (additional_tags is None) and (removal_tags is None):
+            raise IBMQBackendValueError(
+                'The tags cannot be updated since none of the parameters are specified.')
+
+        report = JobOperationReport([self._bulk_job_id(job) for job in jobs])
+        job_ids = [job for job in jobs if not isinstance(job, IBMQJob)]
+        retrieved = {}  # type: Dict[str, IBMQJob]
+        if job_ids:
+            retrieved_jobs, errors = self.retrieve_jobs(job_ids, max_workers=max_workers)
+            retrieved = {job.job_id(): job for job in retrieved_jobs if job is not None}
+            report.errors.update(errors)
+        to_update = [job if isinstance(job, IBMQJob) else retrieved[job]
+                     for job in jobs if isinstance(job, IBMQJob) or job in retrieved]
+
+        return run_job_operation(
+            to_update, IBMQJob.job_id,
+            lambda job: job.update_tags(replacement_tags=replacement_tags,
+                                        additional_tags=additional_tags,
+                                        removal_tags=removal_tags),
+            max_workers=max_workers, max_rate=max_rate, report=report)
+
+    @staticmethod
+    def _bulk_job_id(job: Union[str, IBMQJob]) -> str:
+        """Return the ID of a job given as a job or a job ID."""
+        return job.job_id() if isinstance(job, IBMQJob) else job
 
     def my_reservations(self) -> List[BackendReservation]:
         """Return your upcoming reservations.
@@ -18,6 +18,7 @@ import logging
 import warnings
 from typing import Dict, List, Union, Callable, Optional, Any
 from collections import OrderedDict
+from concurrent import futures
 
 from .accountprovider import AccountProvider
 from .api.clients import AuthClient, VersionClient
@@ -44,6 +45,9 @@ UPDATE_ACCOUNT_TEXT = "Please update your accounts and programs by following the
 class IBMQFactory:
     """Factory and account manager for IBM Quantum Experience."""
 
+    _init_max_workers = 8
+    """Maximum number of providers initialized concurrently."""
+
     def __init__(self) -> None:
         """IBMQFactory constructor."""
         self._credentials = None  # type: Optional[Credentials]
@@ -467,8 +471,10 @@ class IBMQFactory:
         user_hubs = auth_client.user_hubs()
 
         self._credentials = credentials
-        for hub_info in user_hubs:
-            # Build credentials.
+        access_token = auth_client.current_access_token()
+
+        def _new_provider(hub_info: Dict[str, Any]) -> Optional[AccountProvider]:
+            """Build the provider for a hub, or ``None`` if it fails."""
             provider_credentials = Credentials(
                 credentials.token,
                 url=service_urls['http'],
@@ -477,13 +483,16 @@ class IBMQFactory:
                 verify=credentials.verify,
                 services=service_urls.get('services', {}),
                 **hub_info, )
-
-            # Build the provider.
             try:
-                provider = AccountProvider(provider_credentials,
-                                           auth_client.current_access_token())
-                self._providers[provider_credentials.unique_id()] = provider
+                return AccountProvider(provider_credentials, access_token)
             except Exception as ex:  # pylint: disable=broad-except
                 # Catch-all for errors instantiating the provider.
                 logger.warning('Unable to instantiate provider for %s: %s',
                                hub_info, ex)
+                return None
+
+        # Providers are built concurrently, but stored in the order of the hubs.
+        with futures.ThreadPoolExecutor(max_workers=self._init_max_workers) as executor:
+            for provider in executor.map(_new_provider, user_hubs):
+                if provider is not None:
+                    self._providers[provider.credentials.unique_id()] = provider
@@ -28,7 +28,11 @@ Classes
     :toctree: ../stubs/
 
     IBMQJob
+    JobRecord
+    JobRecordBatch
     QueueInfo
+    JobIndex
+    JobOperationReport
 
 Functions
 =========
@@ -37,6 +41,10 @@ Functions
     :toctree: ../stubs/
 
     job_monitor
+    enable_job_disk_cache
+    disable_job_disk_cache
+    enable_job_index
+    disable_job_index
 
 Exception
 =========
@@ -51,7 +59,11 @@ Exception
 """
 
 from .ibmqjob import IBMQJob
+from .jobrecord import JobRecord, JobRecordBatch
 from .queueinfo import QueueInfo
+from .artifactcache import enable_job_disk_cache, disable_job_disk_cache
+from .jobindex import JobIndex, enable_job_index, disable_job_index
+from .bulk import JobOperationReport
 from .exceptions import (IBMQJobError, IBMQJobApiError, IBMQJobFailureError,
                          IBMQJobInvalidStateError, IBMQJobTimeoutError)
 from .job_monitor import job_monitor
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Disk cache for immutable job artifacts."""
+
+from typing import Optional
+
+from ..utils.diskcache import DiskCache
+
+_job_disk_cache = None  # type: Optional[DiskCache]
+
+
+def enable_job_disk_cache(directory: Optional[str] = None) -> None:
+    """Cache the Qobj and properties of jobs on disk.
+
+    Once enabled, the Qobj and backend properties downloaded for a job are
+    stored on disk, keyed by job ID, and reused by any process that has the
+    cache enabled. Both are immutable once a job has run, so entries never
+    expire.
+
+    Args:
+        directory: Root directory of the cache. If ``None``, the directory
+            set by the ``QISKIT_IBMQ_PROVIDER_CACHE_DIR`` environment variable
+            or ``$HOME/.qiskit/ibmq_cache`` is used.
+    """
+    global _job_disk_cache  # pylint: disable=global-statement
+    _job_disk_cache = DiskCache('jobs', directory)
+
+
+def disable_job_disk_cache() -> None:
+    """Stop caching the Qobj and properties of jobs on disk.
+
+    Entries already on disk are left untouched.
+    """
+    global _job_disk_cache  # pylint: disable=global-statement
+    _job_disk_cache = None
+
+
+def job_disk_cache() -> Optional[DiskCache]:
+    """Return the disk cache for job artifacts.
+
+    Returns:
+        The disk cache, or ``None`` if it is not enabled.
+    """
+    return _job_disk_cache
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Operations applied to many jobs concurrently."""
+
+import time
+import logging
+from concurrent import futures
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+
+
+class RateLimiter:
+    """Space out operations, across threads, to at most a given rate."""
+
+    def __init__(self, max_rate: Optional[float] = None) -> None:
+        """RateLimiter constructor.
+
+        Args:
+            max_rate: Maximum number of operations per second. If ``None``,
+                the operations are not limited.
+        """
+        self._interval = 1 / max_rate if max_rate else 0.0
+        self._next_slot = 0.0
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        """Wait until the next operation is allowed."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class JobOperationReport:
+    """Outcome, for each job, of an operation applied to many jobs.
+
+    Attributes:
+        results: The result of the operation, keyed by the ID of each job the
+            operation completed for. For a cancellation, the result is whether
+            the job was cancelled. For a tags update, it is the new tags.
+        errors: The error raised by the operation, keyed by the ID of each job
+            the operation failed for.
+    """
+
+    def __init__(self, job_ids: Sequence[str]) -> None:
+        """JobOperationReport constructor.
+
+        Args:
+            job_ids: IDs of the jobs the operation is applied to.
+        """
+        self.job_ids = list(job_ids)
+        self.results = {}  # type: Dict[str, Any]
+        self.errors = {}  # type: Dict[str, Exception]
+
+    def succeeded(self) -> List[str]:
+        """Return the jobs the operation completed for.
+
+        Returns:
+            The IDs of the jobs the operation did not raise an error for, in
+            the order they were given.
+        """
+        return [job_id for job_id in self.job_ids if job_id in self.results]
+
+    def failed(self) -> List[str]:
+        """Return the jobs the operation failed for.
+
+        Returns:
+            The IDs of the jobs the operation raised an error for, in the order
+            they were given.
+        """
+        return [job_id for job_id in self.job_ids if job_id in self.errors]
+
+    def __repr__(self) -> str:
+        return '<{}(jobs={}, succeeded={}, failed={})>'.format(
+            self.__class__.__name__, len(self.job_ids), len(self.results), len(self.errors))
+
+
+def run_job_operation(
+        items: Sequence[T],
+        job_id: Callable[[T], str],
+        operation: Callable[[T], Any],
+        max_workers: int = 8,
+        max_rate: Optional[float] = None,
+        report: Optional[JobOperationReport] = None
+) -> JobOperationReport:
+    """Apply an operation to many jobs, concurrently.
+
+    Args:
+        items: The jobs, or job IDs, to apply the operation to.
+        job_id: Function returning the job ID of an item.
+        operation: The operation, applied to each item.
+        max_workers: Maximum number of operations run concurrently.
+        max_rate: Maximum number of operations started per second. If
+            ``None``, the rate is not limited.
+        report: Report to add the outcomes to. If ``None``, a new report is
+            created for the items.
+
+    Returns:
+        The outcome of the operation for each job. The exceptions raised by
+        the operation are reported as failures of the job.
+    """
+    ids = [job_id(item) for item in items]
+    report = report or JobOperationReport(ids)
+    if not items:
+        return report
+    rate_limiter = RateLimiter(max_rate)
+
+    def _apply(item: T) -> Any:
+        rate_limiter.acquire()
+        return operation(item)
+
+    with futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        item_futures = {executor.submit(_apply, item): item_id
+                        for item, item_id in zip(items, ids)}
+        for future in futures.as_completed(item_futures):
+            item_id = item_futures[future]
+            try:
+                report.results[item_id] = future.result()
+            except Exception as err:  # pylint: disable=broad-except
+                logger.warning('Operation failed for job %s: %s', item_id, str(err))
+                report.errors[item_id] = err
+    return report
@@ -28,6 +28,7 @@ from qiskit.providers.jobstatus import JOB_FINAL_STATES, JobStatus
 from qiskit.providers.models import BackendProperties
 from qiskit.qobj import QasmQobj, PulseQobj
 from qiskit.result import Result
+from qiskit.tools.events.pubsub import Publisher
 from qiskit.providers.ibmq import ibmqbackend  # pylint: disable=unused-import
 
 from ..apiconstants import ApiJobStatus, ApiJobKind
@@ -37,9 +38,12 @@ from ..utils.utils import RefreshQueue, validate_job_tags, api_status_to_job_sta
 from ..utils.qobj_utils import dict_to_qobj
 from ..utils.json_decoder import decode_backend_properties, decode_result
 from ..utils.converters import utc_to_local, utc_to_local_all
+from ..utils.timing import PhaseTimer
+from ..backendcache import BACKEND_INTERN_TABLE
 from .exceptions import (IBMQJobApiError, IBMQJobFailureError,
                          IBMQJobTimeoutError, IBMQJobInvalidStateError)
 from .queueinfo import QueueInfo
+from .artifactcache import job_disk_cache
 from .utils import build_error_report, api_to_job_error, get_cancel_status
 
 logger = logging.getLogger(__name__)
@@ -119,6 +123,8 @@ class IBMQJob(BaseJob):
             run_mode: Optional[str] = None,
             share_level: Optional[str] = None,
             client_info: Optional[Dict[str, str]] = None,
+            client_timer: Optional[PhaseTimer] = None,
+            partial_data: bool = False,
             **kwargs: Any
     ) -> None:
         """IBMQJob constructor.
@@ -139,6 +145,11 @@ class IBMQJob(BaseJob):
             run_mode: Scheduling mode the job runs in.
             share_level: Level the job can be shared with.
             client_info: Client version.
+            client_timer: Timer holding the client-side phases already
+                recorded for this job, such as its submission.
+            partial_data: Whether the job data only includes some of the job
+                fields. The other fields are retrieved from the server the
+                first time one of them is needed.
             kwargs: Additional job attributes.
         """
         self._backend = backend
@@ -160,6 +171,8 @@ class IBMQJob(BaseJob):
         self._use_object_storage = (self._kind == ApiJobKind.QOBJECT_STORAGE)
         self._share_level = share_level
         self.client_version = client_info
+        self._client_timer = client_timer or PhaseTimer()
+        self._partial_data = partial_data
         self._set_result(result)
 
         self._data = {}
@@ -171,6 +184,7 @@ class IBMQJob(BaseJob):
         # Properties used for caching.
         self._cancelled = False
         self._job_error_msg = None  # type: Optional[str]
+        self._properties = None  # type: Optional[BackendProperties]
 
     def qobj(self) -> Optional[Union[QasmQobj, PulseQobj]]:
         """Return the Qobj for this job.
@@ -187,16 +201,30 @@ class IBMQJob(BaseJob):
 
         # pylint: disable=access-member-before-definition,attribute-defined-outside-init
         if not self._qobj:  # type: ignore[has-type]
-            with api_to_job_error():
-                qobj = self._api_client.job_download_qobj(
-                    self.job_id(), self._use_object_storage)
-                self._qobj = dict_to_qobj(qobj)
+            disk_cache = job_disk_cache()
+            cache_key = self.job_id() + '.qobj'
+            qobj = disk_cache.get(cache_key) if disk_cache else None
+            if qobj is None:
+                with api_to_job_error():
+                    qobj = self._api_client.job_download_qobj(
+                        self.job_id(), self._use_object_storage)
+                if disk_cache and qobj:
+                    disk_cache.put(cache_key, qobj)
+            self._qobj = dict_to_qobj(qobj)
 
         return self._qobj
 
-    def properties(self) -> Optional[BackendProperties]:
+    def properties(self, refresh: bool = False) -> Optional[BackendProperties]:
         """Return the backend properties for this job.
 
+        The properties used by a job do not change once they are available,
+        so they are downloaded only once and then cached. Jobs that ran
+        against the same calibration share a single instance.
+
+        Args:
+            refresh: If ``True``, re-query the server for the properties.
+                Otherwise, return the cached value.
+
         Returns:
             The backend properties used for this job, or ``None`` if
             properties are not available.
@@ -205,15 +233,29 @@ class IBMQJob(BaseJob):
             IBMQJobApiError: If an unexpected error occurred when communicating
                 with the server.
         """
-        with api_to_job_error():
-            properties = self._api_client.job_properties(job_id=self.job_id())
+        if self._properties and not refresh:
+            return self._properties
 
-        if not properties:
-            return None
-
-        decode_backend_properties(properties)
-        properties = utc_to_local_all(properties)
-        return BackendProperties.from_dict(properties)
+        disk_cache = job_disk_cache()
+        cache_key = self.job_id() + '.properties'
+        properties = disk_cache.get(cache_key) if disk_cache and not refresh else None
+        if properties is None:
+            with api_to_job_error():
+                properties = self._api_client.job_properties(job_id=self.job_id())
+            if not properties:
+                return None
+            if disk_cache:
+                disk_cache.put(cache_key, properties)
+
+        def _decode() -> BackendProperties:
+            decode_backend_properties(properties)
+            return BackendProperties.from_dict(utc_to_local_all(properties))
+
+        # Shared with the backends and the other jobs using the same calibration.
+        self._properties = BACKEND_INTERN_TABLE.intern(
+            ('properties', properties.get('backend_name'),
+             str(properties.get('last_update_date'))), _decode)
+        return self._properties
 
     def result(
             self,
@@ -608,6 +650,7 @@ class IBMQJob(BaseJob):
         Returns:
             Job name or ``None`` if no name was assigned to this job.
         """
+        self._refresh_partial_data()
         return self._name
 
     def tags(self) -> List[str]:
@@ -616,6 +659,7 @@ class IBMQJob(BaseJob):
         Returns:
             Tags assigned to this job.
         """
+        self._refresh_partial_data()
         return self._tags.copy()
 
     def share_level(self) -> str:
@@ -659,6 +703,47 @@ class IBMQJob(BaseJob):
 
         return time_per_step_local
 
+    def client_timings(self) -> Dict[str, float]:
+        """Return the time spent in each phase of the job processing.
+
+        The output dictionary contains the duration, in seconds, of the
+        client-side phases timed by this job instance, prefixed with
+        ``submit.`` or ``result.``, followed by the time the job spent in
+        each server-side step, prefixed with ``server.``. For example::
+
+            {'submit.to_dict': 0.012,
+             'submit.json_encode': 0.031,
+             'submit.create_remote_job': 0.402,
+             'submit.upload': 0.318,
+             'submit.callback_upload': 0.377,
+             'server.CREATING': 0.75,
+             'server.CREATED': 0.06,
+             ...
+             'result.download': 0.244,
+             'result.from_dict': 0.009}
+
+        The server-side steps are taken from the cached :meth:`time_per_step()`
+        information, and the duration of the last step is not included since
+        it has no end. Submission phases are only available for jobs
+        submitted by this instance, not for retrieved jobs.
+
+        Returns:
+            Duration of each processing phase, in seconds.
+        """
+        client_durations = self._client_timer.durations()
+        timings = {name: duration for name, duration in client_durations.items()
+                   if name.startswith('submit.')}
+
+        if self._time_per_step:
+            steps = sorted((utc_to_local(time_data), step_name)
+                           for step_name, time_data in self._time_per_step.items())
+            for (step_start, step_name), (step_end, _) in zip(steps, steps[1:]):
+                timings['server.' + step_name] = (step_end - step_start).total_seconds()
+
+        timings.update({name: duration for name, duration in client_durations.items()
+                        if not name.startswith('submit.')})
+        return timings
+
     def scheduling_mode(self) -> Optional[str]:
         """Return the scheduling mode the job is in.
 
@@ -686,7 +771,7 @@ class IBMQJob(BaseJob):
             Client version in dictionary format, where the key is the name
                 of the client and the value is the version.
         """
-        if not self._client_version:
+        if self._partial_data or not self._client_version:
             self.refresh()
         return self._client_version
 
@@ -764,6 +849,12 @@ class IBMQJob(BaseJob):
 
         for key, value in api_response.items():
             self._data[key + '_'] = value
+        self._partial_data = False
+
+    def _refresh_partial_data(self) -> None:
+        """Retrieve all the job fields, if only some of them were retrieved."""
+        if self._partial_data:
+            self.refresh()
 
     def to_dict(self) -> Dict:
         """Serialize the model into a Python dict of simple types.
@@ -908,10 +999,12 @@ class IBMQJob(BaseJob):
             return
 
         if not self._result or refresh:  # type: ignore[has-type]
+            timer = PhaseTimer()
             try:
                 result_response = self._api_client.job_result(
-                    self.job_id(), self._use_object_storage)
-                self._set_result(result_response)
+                    self.job_id(), self._use_object_storage, timer=timer)
+                with timer.phase('result.from_dict'):
+                    self._set_result(result_response)
                 if self._status is JobStatus.ERROR:
                     # Look for error message in result response.
                     self._check_for_error_message(result_response)
@@ -920,6 +1013,9 @@ class IBMQJob(BaseJob):
                     raise IBMQJobApiError(
                         'Unable to retrieve result for '
                         'job {}: {}'.format(self.job_id(), str(err))) from err
+            finally:
+                self._client_timer.extend(timer)
+            Publisher().publish("ibmq.job.timings", self, self.client_timings())
 
     def _set_result(self, raw_data: Optional[Dict]) -> None:
         """Set the job result.
@@ -1066,4 +1162,12 @@ class IBMQJob(BaseJob):
         try:
             return self._data[name]
         except KeyError:
-            raise AttributeError('Attribute {} is not defined.'.format(name)) from None
+            pass
+        if self.__dict__.get('_partial_data') and name.endswith('_') \
+                and not name.startswith('__'):
+            # The attribute might be in the fields not yet retrieved. Special
+            # names, probed by copy, pickle and others, never are.
+            self.refresh()
+            if name in self._data:
+                return self._data[name]
+        raise AttributeError('Attribute {} is not defined.'.format(name))
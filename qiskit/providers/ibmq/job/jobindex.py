@@ -0,0 +1,433 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Local index of job metadata."""
+
+import os
+import re
+import json
+import sqlite3
+import logging
+from datetime import timezone
+from threading import Lock, RLock
+from typing import Dict, List, Optional, Any, Tuple
+
+import dateutil.parser
+
+from ..apiconstants import API_JOB_FINAL_STATES
+from ..utils.diskcache import default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+JOB_INDEX_VERSION = 1
+"""Format version of the job index databases."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    backend_name TEXT,
+    status TEXT,
+    name TEXT,
+    kind TEXT,
+    creation_date TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS job_tags (
+    job_id TEXT,
+    tag TEXT,
+    PRIMARY KEY (job_id, tag)
+);
+CREATE INDEX IF NOT EXISTS jobs_backend_name ON jobs (backend_name);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_creation_date ON jobs (creation_date);
+CREATE INDEX IF NOT EXISTS job_tags_tag ON job_tags (tag);
+"""
+
+_COLUMNS = {
+    'id': 'job_id',
+    'backend.name': 'backend_name',
+    'status': 'status',
+    'name': 'name',
+    'kind': 'kind',
+    'creationDate': 'creation_date'
+}
+"""Columns of the index, keyed by the name of the field in the server filters."""
+
+_OPERATORS = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<=', 'neq': '!='}
+
+_FINAL_STATUSES = [status.value for status in API_JOB_FINAL_STATES]
+
+_LOOPBACK_REGEXP_RE = re.compile(r'^/(.*)/([a-z]*)$', re.DOTALL)
+
+
+class _UnsupportedFilter(Exception):
+    """The filter uses a field or operator not supported by the index."""
+
+
+def _normalize_date(value: Any) -> str:
+    """Return a date as a sortable UTC string.
+
+    Args:
+        value: Date in ISO 8601 format. Dates without timezone are in UTC.
+
+    Returns:
+        The date, in UTC, in a fixed format.
+
+    Raises:
+        _UnsupportedFilter: If the value is not a valid date.
+    """
+    try:
+        date = dateutil.parser.isoparse(value)
+    except (TypeError, ValueError) as ex:
+        raise _UnsupportedFilter(str(ex)) from ex
+    if date.tzinfo:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date.strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    """Implement the ``REGEXP`` SQL operator using the loopback syntax."""
+    if value is None:
+        return False
+    flags = 0
+    match = _LOOPBACK_REGEXP_RE.match(pattern)
+    if match:
+        pattern = match.group(1)
+        if 'i' in match.group(2):
+            flags |= re.IGNORECASE
+    return re.search(pattern, value, flags) is not None
+
+
+def _condition(column: str, value: Any, is_date: bool = False) -> Tuple[str, List[Any]]:
+    """Translate the filter of a field to SQL.
+
+    Args:
+        column: Column of the field.
+        value: Filter of the field: a value, or a dictionary of operators.
+        is_date: Whether the column holds dates.
+
+    Returns:
+        The SQL condition and its parameters.
+
+    Raises:
+        _UnsupportedFilter: If the filter uses an unsupported operator.
+    """
+    convert = _normalize_date if is_date else (lambda operand: operand)
+    if not isinstance(value, dict):
+        return '{} = ?'.format(column), [convert(value)]
+    if not value:
+        raise _UnsupportedFilter('Empty filter for {}.'.format(column))
+
+    clauses = []
+    params = []  # type: List[Any]
+    for operator, operand in value.items():
+        if operator in _OPERATORS:
+            clauses.append('{} {} ?'.format(column, _OPERATORS[operator]))
+            params.append(convert(operand))
+        elif operator in ('inq', 'nin') and isinstance(operand, list):
+            if not operand:
+                clauses.append('0' if operator == 'inq' else '1')
+                continue
+            clauses.append('{} {} ({})'.format(column, 'IN' if operator == 'inq' else 'NOT IN',
+                                               ', '.join('?' * len(operand))))
+            params.extend(convert(item) for item in operand)
+        elif operator == 'between' and isinstance(operand, list) and len(operand) == 2:
+            clauses.append('{} BETWEEN ? AND ?'.format(column))
+            params.extend(convert(item) for item in operand)
+        elif operator == 'regexp' and isinstance(operand, str):
+            clauses.append('{} REGEXP ?'.format(column))
+            params.append(operand)
+        else:
+            raise _UnsupportedFilter('Unsupported operator {}.'.format(operator))
+    return ' AND '.join(clauses), params
+
+
+def _where_clause(api_filter: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Translate a loopback ``where`` filter to SQL.
+
+    Args:
+        api_filter: The filter.
+
+    Returns:
+        The SQL condition and its parameters.
+
+    Raises:
+        _UnsupportedFilter: If the filter uses a field or operator not
+            supported by the index.
+    """
+    clauses = []
+    params = []  # type: List[Any]
+    for key, value in api_filter.items():
+        if key in ('and', 'or'):
+            if not isinstance(value, list) or \
+                    not all(isinstance(sub_filter, dict) for sub_filter in value):
+                raise _UnsupportedFilter('Invalid {} filter.'.format(key))
+            parts = [_where_clause(sub_filter) for sub_filter in value]
+            if not parts:
+                continue
+            separator = ' AND ' if key == 'and' else ' OR '
+            clauses.append('({})'.format(separator.join(part[0] for part in parts)))
+            for part in parts:
+                params.extend(part[1])
+        elif key == 'tags':
+            clause, tag_params = _condition('tag', value)
+            clauses.append('job_id IN (SELECT job_id FROM job_tags WHERE {})'.format(clause))
+            params.extend(tag_params)
+        elif key in _COLUMNS:
+            clause, column_params = _condition(_COLUMNS[key], value,
+                                               is_date=(key == 'creationDate'))
+            clauses.append('({})'.format(clause))
+            params.extend(column_params)
+        else:
+            raise _UnsupportedFilter('Field {} is not indexed.'.format(key))
+    return ' AND '.join(clauses) or '1', params
+
+
+class JobIndex:
+    """Local index of the metadata of the jobs of a provider.
+
+    The index is an SQLite database holding the job data returned by the
+    job listing endpoint, with indexes on the backend, status, tags and
+    creation date of the jobs. Job queries whose filter only uses these
+    fields, the job name, kind and ID can then be answered locally.
+
+    The index is brought up to date incrementally: new jobs are retrieved
+    in order of creation date, starting from the most recent job already
+    indexed, and jobs that were not in a final state are retrieved again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """JobIndex constructor.
+
+        Args:
+            path: Path of the database file. Use ``':memory:'`` for an index
+                that is not stored on disk.
+        """
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.create_function('REGEXP', 2, _regexp)
+        self._lock = Lock()
+        self.sync_lock = RLock()
+        """Lock held while the index is being brought up to date."""
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def add(self, job_infos: List[Dict[str, Any]]) -> None:
+        """Add or update jobs.
+
+        Args:
+            job_infos: Job data returned by the server.
+        """
+        rows = []
+        tags = []
+        for job_info in job_infos:
+            try:
+                job_id = job_info['job_id']
+                creation_date = _normalize_date(job_info['creation_date'])
+            except (KeyError, _UnsupportedFilter):
+                logger.debug('Not indexing job with invalid data: %s', job_info)
+                continue
+            rows.append((job_id, job_info.get('_backend_info', {}).get('name'),
+                         job_info.get('status'), job_info.get('name'), job_info.get('kind'),
+                         creation_date, json.dumps(job_info)))
+            tags.extend((job_id, tag) for tag in job_info.get('tags') or [])
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+            self._connection.executemany(
+                'DELETE FROM job_tags WHERE job_id = ?', [(row[0],) for row in rows])
+            self._connection.executemany('INSERT OR IGNORE INTO job_tags VALUES (?, ?)', tags)
+
+    def remove(self, job_ids: List[str]) -> None:
+        """Remove jobs.
+
+        Args:
+            job_ids: IDs of the jobs to remove.
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'DELETE FROM jobs WHERE job_id = ?', [(job_id,) for job_id in job_ids])
+            self._connection.executemany(
+                'DELETE FROM job_tags WHERE job_id = ?', [(job_id,) for job_id in job_ids])
+
+    def clear(self) -> None:
+        """Remove all the jobs."""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM jobs')
+            self._connection.execute('DELETE FROM job_tags')
+
+    def watermark(self) -> Tuple[Optional[str], List[str]]:
+        """Return the position of the most recent jobs indexed.
+
+        Returns:
+            The creation date of the most recent job, as returned by the
+            server, and the IDs of the jobs created at that date. The date is
+            ``None`` if the index is empty.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT job_id, data FROM jobs WHERE creation_date = '
+                '(SELECT MAX(creation_date) FROM jobs)').fetchall()
+        if not rows:
+            return None, []
+        return json.loads(rows[0][1])['creation_date'], [row[0] for row in rows]
+
+    def unfinished_job_ids(self) -> List[str]:
+        """Return the IDs of the jobs that were not in a final state.
+
+        Returns:
+            The job IDs.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT job_id FROM jobs WHERE status NOT IN ({})'.format(
+                    ', '.join('?' * len(_FINAL_STATUSES))), _FINAL_STATUSES).fetchall()
+        return [row[0] for row in rows]
+
+    def supports(self, api_filter: Dict[str, Any]) -> bool:
+        """Return whether a filter can be answered by the index.
+
+        Args:
+            api_filter: A loopback ``where`` filter.
+
+        Returns:
+            Whether the filter only uses fields and operators supported by
+            the index.
+        """
+        try:
+            _where_clause(api_filter)
+            return True
+        except _UnsupportedFilter:
+            return False
+
+    def query(
+            self,
+            api_filter: Dict[str, Any],
+            limit: Optional[int] = None,
+            skip: int = 0,
+            descending: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Return the data of the jobs matching a filter.
+
+        Args:
+            api_filter: A loopback ``where`` filter, supported by the index.
+            limit: Maximum number of jobs to return, or ``None`` for all of them.
+            skip: Number of matching jobs to skip.
+            descending: Whether to return the newest jobs first.
+
+        Returns:
+            The job data, as returned by the server, sorted by creation date.
+        """
+        clause, params = _where_clause(api_filter)
+        order = 'DESC' if descending else 'ASC'
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT data FROM jobs WHERE {} ORDER BY creation_date {}, job_id {} '
+                'LIMIT ? OFFSET ?'.format(clause, order, order),
+                params + [limit if limit else -1, skip]).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+
+_job_index_directory = None  # type: Optional[str]
+_job_indexes = {}  # type: Dict[str, JobIndex]
+_job_indexes_lock = Lock()
+
+
+def enable_job_index(directory: Optional[str] = None) -> None:
+    """Answer job queries from a local index of job metadata.
+
+    Once enabled, :meth:`~qiskit.providers.ibmq.IBMQBackendService.jobs`
+    and :meth:`~qiskit.providers.ibmq.IBMQBackendService.iter_jobs` bring
+    a local index of the jobs of the provider up to date, which only
+    retrieves the jobs created or updated since the last query, and answer
+    the query from it. Queries whose `db_filter` uses fields that are not
+    indexed are sent to the server.
+
+    Job names and tags updated after a job reached a final state are not
+    picked up by the incremental update. Use
+    :meth:`~qiskit.providers.ibmq.IBMQBackendService.sync_job_index` with
+    ``full=True`` to rebuild the index.
+
+    Note:
+        The index of a provider is empty until it is first updated, so the
+        first query answered from it, whatever its `limit`, retrieves the
+        whole job history of the provider, one page at a time. For accounts
+        with many jobs, call
+        :meth:`~qiskit.providers.ibmq.IBMQBackendService.sync_job_index`
+        ahead of time, for example in a background thread, to pay this cost
+        once. Later updates only retrieve the new and unfinished jobs.
+
+    Args:
+        directory: Root directory of the index databases, one per provider.
+            If ``None``, the directory set by the ``QISKIT_IBMQ_PROVIDER_CACHE_DIR``
+            environment variable or ``$HOME/.qiskit/ibmq_cache`` is used.
+    """
+    global _job_index_directory  # pylint: disable=global-statement
+    _job_index_directory = directory or default_cache_dir()
+
+
+def disable_job_index() -> None:
+    """Send job queries to the server, and close the open job indexes.
+
+    The databases already on disk are left untouched.
+    """
+    global _job_index_directory  # pylint: disable=global-statement
+    _job_index_directory = None
+    with _job_indexes_lock:
+        for index in _job_indexes.values():
+            index.close()
+        _job_indexes.clear()
+
+
+def job_index_directory() -> Optional[str]:
+    """Return the root directory of the job index databases.
+
+    Returns:
+        The root directory, or ``None`` if the job index is not enabled.
+    """
+    return _job_index_directory
+
+
+def job_index(key: str) -> Optional[JobIndex]:
+    """Return the job index of a provider.
+
+    Args:
+        key: A value identifying the provider, such as its URL, hub, group
+            and project.
+
+    Returns:
+        The job index, or ``None`` if the job index is not enabled.
+    """
+    directory = _job_index_directory
+    if directory is None:
+        return None
+    path = os.path.join(directory, 'job_index', 'v{}'.format(JOB_INDEX_VERSION),
+                        re.sub(r'[^\w.-]', '_', key, flags=re.ASCII) + '.sqlite')
+    with _job_indexes_lock:
+        index = _job_indexes.get(path)
+        if index is None:
+            index = _job_indexes[path] = JobIndex(path)
+        return index
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Lightweight records of IBM Quantum Experience jobs."""
+
+import sys
+from typing import Dict, List, Optional, Any, Iterator, Union, Callable, overload
+from datetime import datetime
+import dateutil.parser
+
+from qiskit.providers.jobstatus import JobStatus
+
+from ..utils.utils import api_status_to_job_status
+from ..utils.converters import utc_to_local
+from .ibmqjob import IBMQJob
+
+
+class JobRecord:
+    """Lightweight, read-only view of a job returned by a job listing.
+
+    A ``JobRecord`` is a view over one row of a :class:`JobRecordBatch`. It
+    does not hold a connection to the server, and fields such as the creation
+    date are only parsed when accessed. Use :meth:`to_job()` to upgrade a
+    record to a full :class:`~qiskit.providers.ibmq.job.IBMQJob`::
+
+        records = provider.backends.jobs(limit=None, lightweight=True)
+        failed = [rec for rec in records if rec.status() is JobStatus.ERROR]
+        job = failed[0].to_job()
+    """
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: 'JobRecordBatch', index: int) -> None:
+        """JobRecord constructor.
+
+        Args:
+            batch: The batch holding the data of this record.
+            index: Position of this record in the batch.
+        """
+        self._batch = batch
+        self._index = index
+
+    def job_id(self) -> str:
+        """Return the job ID.
+
+        Returns:
+            Job ID.
+        """
+        return self._batch.column('job_id')[self._index]
+
+    def backend_name(self) -> str:
+        """Return the name of the backend the job was submitted to.
+
+        Returns:
+            Backend name.
+        """
+        return self._batch.column('backend_name')[self._index]
+
+    def status(self) -> JobStatus:
+        """Return the job status at the time the record was retrieved.
+
+        Returns:
+            The status of the job.
+        """
+        return api_status_to_job_status(self._batch.column('status')[self._index])
+
+    def name(self) -> Optional[str]:
+        """Return the name assigned to the job.
+
+        Returns:
+            Job name or ``None`` if no name was assigned to the job.
+        """
+        return self._batch.column('name')[self._index]
+
+    def tags(self) -> List[str]:
+        """Return the tags assigned to the job.
+
+        Returns:
+            Tags assigned to the job.
+        """
+        return list(self._batch.column('tags')[self._index])
+
+    def creation_date(self) -> datetime:
+        """Return job creation date, in local time.
+
+        Returns:
+            The job creation date as a datetime object, in local time.
+        """
+        return self._batch.creation_date(self._index)
+
+    def to_job(self) -> IBMQJob:
+        """Upgrade this record to a full job instance.
+
+        Returns:
+            The job represented by this record.
+
+        Raises:
+            IBMQBackendApiProtocolError: If the record contains invalid job data.
+        """
+        return self._batch.to_job(self._index)
+
+    def __repr__(self) -> str:
+        return "<{}('{}') on {}, status={}>".format(
+            self.__class__.__name__, self.job_id(), self.backend_name(), self.status().name)
+
+
+class JobRecordBatch:
+    """Columnar batch of lightweight job records.
+
+    Job attributes are stored column by column, with repeated strings such
+    as backend names and statuses interned, and each row is exposed as a
+    :class:`JobRecord` on access. Any attribute without a column is kept in a
+    per-row dictionary, which is empty for most jobs, and only used when a
+    record is upgraded to a full job. Creation dates are parsed once, on
+    first access, and kept in a column of their own.
+    """
+
+    COLUMNS = ('job_id', 'backend_name', 'status', 'creation_date', 'name', 'tags',
+               'kind', 'share_level')
+    """Names of the job attributes stored as columns."""
+
+    _INTERNED_COLUMNS = ('backend_name', 'status', 'kind', 'share_level')
+
+    def __init__(self, job_factory: Callable[[Dict[str, Any]], IBMQJob]) -> None:
+        """JobRecordBatch constructor.
+
+        Args:
+            job_factory: Function used to upgrade the job data of a record to
+                a full job instance.
+        """
+        self._job_factory = job_factory
+        self._columns = {name: [] for name in self.COLUMNS}  # type: Dict[str, List[Any]]
+        self._extra = []  # type: List[Optional[Dict[str, Any]]]
+        self._creation_dates = []  # type: List[Optional[datetime]]
+
+    def append(self, job_info: Dict[str, Any]) -> None:
+        """Add a job to the batch.
+
+        Args:
+            job_info: Job data, as returned by the job listing.
+        """
+        extra = dict(job_info)
+        columns = self._columns
+        columns['job_id'].append(extra.pop('job_id', None))
+        backend_info = dict(extra.pop('_backend_info', None) or {})
+        columns['backend_name'].append(backend_info.pop('name', 'unknown'))
+        if backend_info:
+            extra['_backend_info'] = backend_info
+        columns['status'].append(extra.pop('status', None))
+        columns['creation_date'].append(extra.pop('creation_date', None))
+        columns['name'].append(extra.pop('name', None))
+        columns['tags'].append(tuple(extra.pop('tags', None) or ()))
+        columns['kind'].append(extra.pop('kind', None))
+        columns['share_level'].append(extra.pop('share_level', None))
+        for column_name in self._INTERNED_COLUMNS:
+            value = columns[column_name][-1]
+            if isinstance(value, str):
+                columns[column_name][-1] = sys.intern(value)
+        self._extra.append(extra or None)
+        self._creation_dates.append(None)
+
+    def column(self, name: str) -> List[Any]:
+        """Return all values of a column.
+
+        Args:
+            name: Name of the column, one of :attr:`COLUMNS`.
+
+        Returns:
+            Values of the column, in record order. The list is owned by the
+            batch and should not be modified.
+        """
+        return self._columns[name]
+
+    def creation_date(self, index: int) -> datetime:
+        """Return the creation date of a record, in local time.
+
+        Args:
+            index: Position of the record.
+
+        Returns:
+            The job creation date, parsed on first access.
+        """
+        creation_date = self._creation_dates[index]
+        if creation_date is None:
+            creation_date = utc_to_local(dateutil.parser.isoparse(
+                self._columns['creation_date'][index]))
+            self._creation_dates[index] = creation_date
+        return creation_date
+
+    def to_job(self, index: int) -> IBMQJob:
+        """Upgrade a record in this batch to a full job instance.
+
+        Args:
+            index: Position of the record.
+
+        Returns:
+            The job represented by the record.
+        """
+        job_info = dict(self._extra[index] or {})
+        job_info['_backend_info'] = dict(job_info.get('_backend_info', {}),
+                                         name=self._columns['backend_name'][index])
+        for name, values in self._columns.items():
+            if name == 'backend_name':
+                continue
+            value = values[index]
+            if name == 'tags':
+                value = list(value)
+            if value is not None:
+                job_info[name] = value
+        return self._job_factory(job_info)
+
+    def to_jobs(self) -> List[IBMQJob]:
+        """Upgrade all records in this batch to full job instances.
+
+        Returns:
+            The jobs represented by the records.
+        """
+        return [self.to_job(index) for index in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self._extra)
+
+    def __iter__(self) -> Iterator[JobRecord]:
+        for index in range(len(self)):
+            yield JobRecord(self, index)
+
+    @overload
+    def __getitem__(self, index: int) -> JobRecord:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[JobRecord]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[JobRecord, List[JobRecord]]:
+        if isinstance(index, slice):
+            return [JobRecord(self, idx) for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Job record index out of range.')
+        return JobRecord(self, index)
+
+    def __repr__(self) -> str:
+        return "<{} with {} job records>".format(self.__class__.__name__, len(self))
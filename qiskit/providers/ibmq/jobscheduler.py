@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Client-side scheduling of jobs within the job limit of a backend."""
+
+import heapq
+import logging
+import itertools
+import threading
+from concurrent import futures
+from typing import List, Tuple, Optional, Union, Any
+
+from qiskit.qobj import QasmQobj, PulseQobj
+from qiskit.providers.ibmq import ibmqbackend  # pylint: disable=unused-import
+
+from .exceptions import IBMQBackendJobLimitError
+from .job import IBMQJob
+from .job.exceptions import IBMQJobTimeoutError
+
+logger = logging.getLogger(__name__)
+
+_PendingEntry = Tuple[int, int, Union[QasmQobj, PulseQobj], dict, futures.Future]
+
+
+class BackendJobScheduler:
+    """Submit jobs to a backend as slots free up under its job limit.
+
+    Qobjs handed to the scheduler wait in a local priority queue. A
+    dispatcher thread submits as many of them as
+    :meth:`~qiskit.providers.ibmq.IBMQBackend.remaining_jobs_count` allows,
+    then waits for one of the jobs it submitted to reach a final state
+    before checking the limit again. Jobs submitted by other means also count
+    towards the limit, so the limit is re-checked every `poll_interval`
+    seconds as well.
+
+    The submitted jobs are only watched while Qobjs are waiting in the
+    queue, each by a daemon thread that stops once the queue is empty, so
+    that the scheduler never keeps the interpreter from exiting. Jobs that
+    are not watched are watched again as soon as a Qobj is queued.
+    """
+
+    def __init__(self, backend: 'ibmqbackend.IBMQBackend', poll_interval: float = 60) -> None:
+        """BackendJobScheduler constructor.
+
+        Args:
+            backend: The backend to submit the jobs to.
+            poll_interval: Maximum number of seconds to wait before checking
+                the job limit again, if no job submitted by the scheduler
+                finishes in the meantime.
+        """
+        self._backend = backend
+        self._poll_interval = poll_interval
+        self._pending = []  # type: List[_PendingEntry]
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._dispatcher = None  # type: Optional[threading.Thread]
+        self._slot_released = False
+        self._unwatched = []  # type: List[IBMQJob]
+
+    def submit(
+            self,
+            qobj: Union[QasmQobj, PulseQobj],
+            priority: int = 0,
+            **run_kwargs: Any
+    ) -> futures.Future:
+        """Queue a Qobj for submission.
+
+        Args:
+            qobj: The Qobj to be executed.
+            priority: Priority of the Qobj. Qobjs with a higher priority are
+                submitted first, and Qobjs with the same priority are
+                submitted in the order they were queued.
+            **run_kwargs: Additional arguments passed to
+                :meth:`~qiskit.providers.ibmq.IBMQBackend.run`.
+
+        Returns:
+            A future that resolves to the submitted job, or to the error that
+            occurred while submitting it.
+        """
+        future = futures.Future()  # type: futures.Future
+        with self._condition:
+            heapq.heappush(self._pending,
+                           (-priority, next(self._counter), qobj, run_kwargs, future))
+            self._start_watchers()
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, daemon=True,
+                    name='ibmq_scheduler_{}'.format(self._backend.name()))
+                self._dispatcher.start()
+            self._condition.notify_all()
+        return future
+
+    def pending_count(self) -> int:
+        """Return the number of Qobjs waiting to be submitted.
+
+        Returns:
+            The number of Qobjs in the queue.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def track(self, job: IBMQJob) -> None:
+        """Check the job limit again once a job reaches a final state.
+
+        The job is watched while Qobjs are waiting in the queue. If the queue
+        is empty, it is watched once a Qobj is queued.
+
+        Args:
+            job: The job to watch.
+        """
+        with self._condition:
+            self._unwatched.append(job)
+            if self._pending:
+                self._start_watchers()
+
+    def _start_watchers(self) -> None:
+        """Start watching the jobs that are not watched.
+
+        Must be called with the condition held.
+        """
+        for job in self._unwatched:
+            threading.Thread(target=self._watch, args=(job,), daemon=True,
+                             name='ibmq_scheduler_watch_{}'.format(job.job_id())).start()
+        self._unwatched = []
+
+    def _watch(self, job: IBMQJob) -> None:
+        """Wait for a job to finish and notify the dispatcher.
+
+        The job is waited for `poll_interval` seconds at a time. Once the
+        queue is empty, it is put back with the jobs that are not watched.
+
+        Args:
+            job: The job to watch.
+        """
+        while True:
+            try:
+                job.wait_for_final_state(timeout=self._poll_interval)
+                break
+            except IBMQJobTimeoutError:
+                with self._condition:
+                    if not self._pending:
+                        self._unwatched.append(job)
+                        return
+            except Exception as err:  # pylint: disable=broad-except
+                logger.debug('An error occurred while waiting for job %s to finish: %s',
+                             job.job_id(), err)
+                break
+        with self._condition:
+            self._slot_released = True
+            self._condition.notify_all()
+
+    def _dispatch(self) -> None:
+        """Submit queued Qobjs until the queue is empty."""
+        limit_reached = False
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._dispatcher = None
+                    return
+                self._slot_released = False
+
+            free_slots = self._free_slots()
+            if free_slots != 0:
+                with self._condition:
+                    count = len(self._pending) if free_slots is None \
+                        else min(free_slots, len(self._pending))
+                    batch = [heapq.heappop(self._pending) for _ in range(count)]
+                submitted = self._submit_batch(batch)
+                if submitted == len(batch):
+                    limit_reached = False
+                    continue
+
+            with self._condition:
+                if not limit_reached:
+                    logger.warning('Job limit reached for backend %s, %d job(s) waiting '
+                                   'for a job to finish before being submitted.',
+                                   self._backend.name(), len(self._pending))
+                    limit_reached = True
+                if not self._slot_released:
+                    self._condition.wait(self._poll_interval)
+
+    def _free_slots(self) -> Optional[int]:
+        """Return the number of jobs that can be submitted.
+
+        Returns:
+            The number of remaining jobs, or ``None`` if there is no limit.
+        """
+        try:
+            remaining = self._backend.remaining_jobs_count()
+        except Exception as err:  # pylint: disable=broad-except
+            # Let the server decide.
+            logger.debug('Unable to retrieve the job limit of backend %s: %s',
+                         self._backend.name(), err)
+            return 1
+        return None if remaining is None else max(remaining, 0)
+
+    def _submit_batch(self, batch: List[_PendingEntry]) -> int:
+        """Submit a batch of Qobjs, putting back the ones over the job limit.
+
+        Args:
+            batch: Entries to submit, in priority order.
+
+        Returns:
+            Number of entries handled.
+        """
+        for index, entry in enumerate(batch):
+            future = entry[4]
+            if future.cancelled():
+                continue
+            try:
+                job = self._backend.run(entry[2], **entry[3])
+            except IBMQBackendJobLimitError:
+                with self._condition:
+                    for remaining in batch[index:]:
+                        heapq.heappush(self._pending, remaining)
+                return index
+            except Exception as err:  # pylint: disable=broad-except
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(err)
+                continue
+            self.track(job)
+            if future.set_running_or_notify_cancel():
+                future.set_result(job)
+        return len(batch)
@@ -43,7 +43,7 @@ def update_backend_info(device_list: wid.VBox,
                 # Each backend_pane is a backend widget. See ``make_backend_widget()``
                 # for more information on how the widget is constructed and its child widgets.
                 try:
-                    status = backend_pane._backend.status()
+                    status = backend_pane._backend.status(max_age=interval)
                 except Exception:  # pylint: disable=broad-except
                     pass
                 else:
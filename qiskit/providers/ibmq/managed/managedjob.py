@@ -17,19 +17,17 @@
 import warnings
 import logging
 from typing import List, Optional, Union
-from concurrent.futures import ThreadPoolExecutor
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, Future
 
 from qiskit.providers.ibmq import IBMQBackend
 from qiskit.qobj import QasmQobj, PulseQobj
 from qiskit.result import Result
 from qiskit.providers.jobstatus import JobStatus
 from qiskit.providers.exceptions import JobError
-from qiskit.providers.ibmq.apiconstants import ApiJobShareLevel, API_JOB_FINAL_STATES
+from qiskit.providers.ibmq.apiconstants import ApiJobShareLevel
 
 from ..job.ibmqjob import IBMQJob
 from ..job.exceptions import IBMQJobTimeoutError
-from ..exceptions import IBMQBackendJobLimitError
 
 logger = logging.getLogger(__name__)
 
@@ -64,83 +62,40 @@ class ManagedJob:
             job_name: str,
             backend: IBMQBackend,
             executor: ThreadPoolExecutor,
-            submit_lock: Lock,
             job_share_level: ApiJobShareLevel,
             job_tags: Optional[List[str]] = None
     ) -> None:
         """Submit the job.
 
+        The Qobj is queued by the job scheduler of the backend, which submits
+        it once the backend job limit allows it.
+
         Args:
             qobj: Qobj to run.
             job_name: Name of the job.
             backend: Backend to execute the experiments on.
-            executor: The thread pool used to submit the job.
-            submit_lock: Lock used to synchronize job submission.
+            executor: The thread pool used to wait for the job submission.
             job_share_level: Job share level.
             job_tags: Tags to be assigned to the job.
         """
-
-        # Submit the job in its own future.
-        logger.debug("Submitting job %s in future", job_name)
-        self.future = executor.submit(
-            self._async_submit, qobj=qobj, job_name=job_name, backend=backend,
-            submit_lock=submit_lock, job_share_level=job_share_level, job_tags=job_tags)
+        logger.debug("Scheduling job %s", job_name)
+        scheduled = backend.schedule(
+            qobj, job_name=job_name, job_share_level=job_share_level.value, job_tags=job_tags)
+        self.future = executor.submit(self._async_submit, scheduled=scheduled)
         logger.debug("Job %s future obtained", job_name)
 
-    def _async_submit(
-            self,
-            qobj: Union[QasmQobj, PulseQobj],
-            job_name: str,
-            backend: IBMQBackend,
-            submit_lock: Lock,
-            job_share_level: ApiJobShareLevel,
-            job_tags: Optional[List[str]] = None
-    ) -> None:
-        """Run a Qobj asynchronously and populate instance attributes.
+    def _async_submit(self, scheduled: Future) -> None:
+        """Wait for a scheduled job to be submitted and populate instance attributes.
 
         Args:
-            qobj: Qobj to run.
-            job_name: Name of the job.
-            backend: Backend to execute the experiments on.
-            submit_lock: Lock used to synchronize job submission.
-            job_share_level: Job share level.
-            job_tags: Tags to be assigned to the job.
+            scheduled: Future returned by the job scheduler.
         """
-        # pylint: disable=missing-raises-doc
-        logger.debug("Job %s waiting for submit lock.", job_name)
-        submit_lock.acquire()
-        logger.debug("Job %s got the submit lock.", job_name)
         try:
-            while self.job is None:
-                try:
-                    self.job = backend.run(
-                        qobj=qobj,
-                        job_name=job_name,
-                        job_share_level=job_share_level.value,
-                        job_tags=job_tags)
-                except IBMQBackendJobLimitError:
-                    final_states = [state.value for state in API_JOB_FINAL_STATES]
-                    oldest_running = backend.jobs(limit=1, descending=False,
-                                                  db_filter={"status": {"nin": final_states}})
-                    if oldest_running:
-                        oldest_running = oldest_running[0]
-                        logger.warning("Job limit reached, waiting for job %s to finish "
-                                       "before submitting the next one.",
-                                       oldest_running.job_id())
-                        try:
-                            oldest_running.wait_for_final_state(timeout=300)
-                        except Exception as err:  # pylint: disable=broad-except
-                            # Don't kill the submit if unable to wait for old job.
-                            logger.debug("An error occurred while waiting for "
-                                         "job %s to finish: %s", oldest_running.job_id(), err)
-
+            self.job = scheduled.result()
         except Exception as err:  # pylint: disable=broad-except
             warnings.warn("Unable to submit job for experiments {}-{}: {}".format(
                 self.start_index, self.end_index, err))
             self.submit_error = err
-        finally:
-            submit_lock.release()
-            logger.debug("Job %s released the submit lock.", job_name)
 
     def status(self) -> Optional[JobStatus]:
         """Query the server for job status.
@@ -20,7 +20,6 @@ from concurrent.futures import ThreadPoolExecutor
 import time
 import logging
 import uuid
-import threading
 
 from qiskit.circuit import QuantumCircuit
 from qiskit.pulse import Schedule
@@ -37,7 +36,8 @@ from .utils import (requires_submit, format_status_counts, format_job_details,
 from .exceptions import (IBMQJobManagerInvalidStateError, IBMQJobManagerTimeoutError,
                          IBMQJobManagerJobNotFound, IBMQJobManagerUnknownJobSet)
 from ..job import IBMQJob
-from ..job.exceptions import IBMQJobTimeoutError, IBMQJobApiError
+from ..job.bulk import run_job_operation
+from ..job.exceptions import IBMQJobTimeoutError
 from ..ibmqbackend import IBMQBackend
 
 logger = logging.getLogger(__name__)
@@ -56,6 +56,8 @@ class ManagedJobSet:
 
     _id_prefix = "ibmq_jobset_"
     _id_suffix = "_"
+    _retrieve_max_workers = 5
+    """Maximum number of concurrent requests used when retrieving jobs."""
 
     def __init__(
             self,
@@ -75,7 +77,6 @@ class ManagedJobSet:
         self._id = short_id or uuid.uuid4().hex + '-' + str(time.time()).replace('.', '')
         self._id_long = self._id_prefix + self._id + self._id_suffix
         self._tags = []  # type: List[str]
-        self._job_submit_lock = threading.Lock()  # Used to synchronize job submit.
 
         # Used for caching
         self._managed_results = None  # type: Optional[ManagedResults]
@@ -122,7 +123,7 @@ class ManagedJobSet:
             logger.debug("Submitting job %s/%s for job set %s", i+1, total_jobs, self._name)
             mjob.submit(qobj=qobj, job_name=job_name, backend=backend,
                         executor=executor, job_share_level=job_share_level,
-                        job_tags=self._tags+[self._id_long], submit_lock=self._job_submit_lock)
+                        job_tags=self._tags+[self._id_long])
             logger.debug("Job %s submitted", i+1)
             self._managed_jobs.append(mjob)
             exp_index += len(experiments)
@@ -184,13 +185,18 @@ class ManagedJobSet:
             raise IBMQJobManagerInvalidStateError(
                 'Unable to retrieve all jobs for job set {}.'.format(self.job_set_id()))
 
+        # Download the Qobjs concurrently, since they are needed to find
+        # out the number of experiments in each job.
+        sorted_jobs = [jobs_dict[job_index] for job_index in sorted_indexes]
+        with ThreadPoolExecutor(max_workers=self._retrieve_max_workers) as executor:
+            qobjs = list(executor.map(lambda job: job.qobj(), sorted_jobs))
+
         self._managed_jobs = []
         experiment_index = 0
-        for job_index in sorted_indexes:
-            job = jobs_dict[job_index]
+        for job, qobj in zip(sorted_jobs, qobjs):
             mjob = ManagedJob(
                 start_index=experiment_index,
-                experiments_count=len(job.qobj().experiments),
+                experiments_count=len(qobj.experiments),
                 job=job
             )
             self._managed_jobs.append(mjob)
@@ -341,10 +347,29 @@ class ManagedJobSet:
         return '\n'.join(report)
 
     @requires_submit
-    def cancel(self) -> None:
-        """Cancel all jobs in this job set."""
-        for mjob in self._managed_jobs:
-            mjob.cancel()
+    def cancel(self, max_workers: int = 8, max_rate: Optional[float] = 50) -> None:
+        """Cancel all jobs in this job set.
+
+        The jobs are cancelled concurrently, see
+        :meth:`IBMQBackendService.cancel_jobs()
+        <qiskit.providers.ibmq.IBMQBackendService.cancel_jobs>`.
+
+        Args:
+            max_workers: Maximum number of requests run concurrently.
+            max_rate: Maximum number of requests started per second. If
+                ``None``, the rate is not limited.
+        """
+        mjobs = [mjob for mjob in self._managed_jobs if mjob.job is not None]
+        if not mjobs:
+            return
+        report = self._backend.provider().backends.cancel_jobs(
+            [mjob.job for mjob in mjobs], max_workers=max_workers, max_rate=max_rate)
+        for mjob in mjobs:
+            job_id = mjob.job.job_id()
+            if not report.results.get(job_id, False):
+                logger.warning("Unable to cancel job %s for experiments %d-%d: %s",
+                               job_id, mjob.start_index, mjob.end_index,
+                               report.errors.get(job_id, "Unknown error"))
 
     @requires_submit
     def jobs(self) -> List[Union[IBMQJob, None]]:
@@ -420,27 +445,36 @@ class ManagedJobSet:
         return self._name
 
     @requires_submit
-    def update_name(self, name: str) -> str:
+    def update_name(
+            self,
+            name: str,
+            max_workers: int = 8,
+            max_rate: Optional[float] = 50
+    ) -> str:
         """Update the name of this job set.
 
         Args:
             name: The new `name` for this job set.
+            max_workers: Maximum number of requests run concurrently.
+            max_rate: Maximum number of requests started per second. If
+                ``None``, the rate is not limited.
 
         Returns:
             The new name associated with this job set.
         """
-        for job in self.jobs():
-            if job:
-                _, job_index = self._parse_job_name(job)
-                try:
-                    # Use the index found in the job name to update the name in order
-                    # to preserve the job set order.
-                    _ = job.update_name(JOB_SET_NAME_FORMATTER.format(name, job_index))
-                except IBMQJobApiError as ex:
-                    # Log a warning with the job that failed to update.
-                    logger.warning('There was an error updating the name for job %s, '
-                                   'belonging to job set %s: %s',
-                                   job.job_id(), self.job_set_id(), str(ex))
+        def _update_name(job: IBMQJob) -> str:
+            # Use the index found in the job name to update the name in order
+            # to preserve the job set order.
+            _, job_index = self._parse_job_name(job)
+            return job.update_name(JOB_SET_NAME_FORMATTER.format(name, job_index))
+
+        report = run_job_operation([job for job in self.jobs() if job], IBMQJob.job_id,
+                                   _update_name, max_workers=max_workers, max_rate=max_rate)
+        for job_id, error in report.errors.items():
+            # Log a warning with the job that failed to update.
+            logger.warning('There was an error updating the name for job %s, '
+                           'belonging to job set %s: %s',
+                           job_id, self.job_set_id(), str(error))
 
         # Cache the updated job set name.
         self._name = name
@@ -477,7 +511,9 @@ class ManagedJobSet:
             self,
             replacement_tags: List[str] = None,
             additional_tags: List[str] = None,
-            removal_tags: List[str] = None
+            removal_tags: List[str] = None,
+            max_workers: int = 8,
+            max_rate: Optional[float] = 50
     ) -> List[str]:
         """Update the tags assigned to this job set.
 
@@ -505,6 +541,9 @@ class ManagedJobSet:
                 associated with this job set.
             removal_tags: The tags that should be removed from the current tags
                 associated with this job set.
+            max_workers: Maximum number of requests run concurrently.
+            max_rate: Maximum number of requests started per second. If
+                ``None``, the rate is not limited.
 
         Returns:
             The new tags associated with this job set.
@@ -516,22 +555,20 @@ class ManagedJobSet:
             raise IBMQJobManagerInvalidStateError(
                 'The tags cannot be updated since none of the parameters are specified.')
 
-        updated_tags = []  # type: List[str]
-        for job in self.jobs():
-            if job:
-                try:
-                    updated_tags = job.update_tags(replacement_tags=replacement_tags,
-                                                   additional_tags=additional_tags,
-                                                   removal_tags=removal_tags)
-                except IBMQJobApiError as ex:
-                    # Log a warning with the job that failed to update.
-                    logger.warning('There was an error updating the tags for job %s, '
-                                   'belonging to job set %s: %s',
-                                   job.job_id(), self.job_set_id(), str(ex))
+        jobs = [job for job in self.jobs() if job]
+        report = self._backend.provider().backends.update_jobs_tags(
+            jobs, replacement_tags=replacement_tags, additional_tags=additional_tags,
+            removal_tags=removal_tags, max_workers=max_workers, max_rate=max_rate)
+        for job_id, error in report.errors.items():
+            # Log a warning with the job that failed to update.
+            logger.warning('There was an error updating the tags for job %s, '
+                           'belonging to job set %s: %s',
+                           job_id, self.job_set_id(), str(error))
 
         # Cache the updated job set tags and remove the long id.
-        self._tags = updated_tags
-        self._tags.remove(self._id_long)
+        succeeded = report.succeeded()
+        updated_tags = report.results[succeeded[-1]] if succeeded else []  # type: List[str]
+        self._tags = [tag for tag in updated_tags if tag != self._id_long]
 
         return self._tags
 
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Local time series of backend properties snapshots."""
+
+import time
+import atexit
+import bisect
+import logging
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Dict, List, Optional, Any, Tuple, Callable, Union, Set
+
+import dateutil.parser
+from qiskit.providers.models import BackendProperties
+
+from .utils.diskcache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+PROPERTIES_HISTORY_CACHE_VERSION = 1
+"""Format version of the properties history disk cache entries."""
+
+_Decoder = Callable[[Dict[str, Any]], BackendProperties]
+
+
+def _to_utc(value: Union[datetime, str]) -> datetime:
+    """Return a date as a ``datetime`` in UTC. Dates without timezone are in UTC."""
+    if isinstance(value, str):
+        value = dateutil.parser.isoparse(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class _Snapshot:
+    """A properties snapshot, decoded the first time it is used."""
+
+    __slots__ = ('last_update_date', 'api_properties', 'properties')
+
+    def __init__(
+            self,
+            last_update_date: str,
+            api_properties: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.last_update_date = last_update_date
+        self.api_properties = api_properties
+        self.properties = None  # type: Optional[BackendProperties]
+
+
+class _PropertiesSeries:
+    """Properties snapshots of a backend, sorted by last update date.
+
+    ``valid_until[i]`` is the latest date queried for which the server
+    returned snapshot ``i``: there is no other snapshot between ``dates[i]``
+    and that date. ``empty_until`` is the latest date queried for which the
+    server returned no snapshot.
+    """
+
+    __slots__ = ('dates', 'snapshots', 'valid_until', 'empty_until')
+
+    def __init__(self) -> None:
+        self.dates = []  # type: List[datetime]
+        self.snapshots = []  # type: List[_Snapshot]
+        self.valid_until = []  # type: List[Optional[datetime]]
+        self.empty_until = None  # type: Optional[datetime]
+
+    def add(self, last_update_date: str, snapshot: Optional[_Snapshot] = None) -> int:
+        """Add a snapshot, if not already known, and return its position."""
+        date = _to_utc(last_update_date)
+        index = bisect.bisect_left(self.dates, date)
+        if index == len(self.dates) or self.dates[index] != date:
+            self.dates.insert(index, date)
+            self.snapshots.insert(index, snapshot or _Snapshot(last_update_date))
+            self.valid_until.insert(index, None)
+        elif snapshot and self.snapshots[index].api_properties is None \
+                and self.snapshots[index].properties is None:
+            self.snapshots[index] = snapshot
+        return index
+
+    def extend_validity(self, index: int, until: Optional[datetime]) -> None:
+        """Record that snapshot `index` is the most recent one before `until`."""
+        if until is None or until <= self.dates[index]:
+            return
+        if self.valid_until[index] is None or self.valid_until[index] < until:
+            self.valid_until[index] = until
+
+    def extend_empty(self, until: Optional[datetime]) -> None:
+        """Record that there is no snapshot before `until`."""
+        if until is not None and (self.empty_until is None or self.empty_until < until):
+            self.empty_until = until
+
+
+class PropertiesHistory:
+    """Time series of the properties snapshots of backends.
+
+    The server returns the properties of a backend in effect at a given
+    date, that is, the most recent snapshot whose ``last_update_date`` is
+    older than that date. Each snapshot received is recorded together with
+    the dates it was returned for, so later queries for dates between the
+    snapshot and the most recent of these dates are answered locally, using
+    a binary search over the snapshots of the backend.
+
+    Snapshots are decoded the first time they are used, and the decoded
+    :class:`~qiskit.providers.models.BackendProperties` are kept. If the disk
+    cache is enabled with :func:`enable_properties_history_cache`, the raw
+    snapshots are also stored on disk and shared by all processes using the
+    same cache directory.
+    """
+
+    _save_interval = 60
+    """Minimum number of seconds between two deferred writes of the dates
+    known for a backend."""
+
+    def __init__(self) -> None:
+        """PropertiesHistory constructor."""
+        self._series = {}  # type: Dict[str, _PropertiesSeries]
+        self._lock = Lock()
+        self._unsaved = set()  # type: Set[str]
+        self._saved_at = {}  # type: Dict[str, float]
+        self._flush_registered = False
+
+    def get(
+            self,
+            backend_name: str,
+            date: datetime,
+            decode: _Decoder
+    ) -> Tuple[bool, Optional[BackendProperties]]:
+        """Return the properties of a backend in effect at a date, if known.
+
+        Args:
+            backend_name: Name of the backend.
+            date: The date. Dates without timezone are in UTC.
+            decode: Function decoding the raw properties returned by the server.
+                The raw properties are not used afterwards.
+
+        Returns:
+            Whether the properties in effect at `date` are known, and if so,
+            the most recent snapshot older than `date`, or ``None`` if there
+            is none.
+        """
+        known, snapshot = self._lookup(backend_name, date)
+        if snapshot is None:
+            return known, None
+        return known, self._decode(backend_name, snapshot, decode)
+
+    def is_known(self, backend_name: str, date: datetime) -> bool:
+        """Return whether the properties of a backend in effect at a date are known.
+
+        Args:
+            backend_name: Name of the backend.
+            date: The date. Dates without timezone are in UTC.
+
+        Returns:
+            Whether :meth:`get` can answer without querying the server.
+        """
+        return self._lookup(backend_name, date)[0]
+
+    def _lookup(self, backend_name: str, date: datetime) -> Tuple[bool, Optional[_Snapshot]]:
+        """Return the snapshot in effect at a date, if known."""
+        date = _to_utc(date)
+        with self._lock:
+            series = self._get_series(backend_name)
+            index = bisect.bisect_left(series.dates, date) - 1
+            if index < 0:
+                return series.empty_until is not None and date <= series.empty_until, None
+            valid_until = series.valid_until[index]
+            if valid_until is None or date > valid_until:
+                return False, None
+            return True, series.snapshots[index]
+
+    def add(
+            self,
+            backend_name: str,
+            date: Optional[datetime],
+            api_properties: Optional[Dict[str, Any]]
+    ) -> None:
+        """Record the properties returned by the server for a date.
+
+        Args:
+            backend_name: Name of the backend.
+            date: Date of the query, or ``None`` for the latest properties.
+                Dates without timezone are in UTC.
+            api_properties: The raw properties returned by the server, or
+                ``None`` if no properties were returned.
+        """
+        date = _to_utc(date) if date else None
+        last_update_date = api_properties.get('last_update_date') if api_properties else None
+        if last_update_date and not isinstance(last_update_date, str):
+            last_update_date = last_update_date.isoformat()
+
+        with self._lock:
+            series = self._get_series(backend_name)
+            if not last_update_date:
+                series.extend_empty(date)
+                return
+            is_new = _to_utc(last_update_date) not in series.dates
+
+        # Store new snapshots before they can be decoded in place.
+        disk_cache = properties_history_cache()
+        if disk_cache and is_new:
+            disk_cache.put(self._snapshot_key(backend_name, last_update_date), api_properties)
+
+        with self._lock:
+            series = self._get_series(backend_name)
+            index = series.add(last_update_date, _Snapshot(last_update_date, api_properties))
+            series.extend_validity(index, date)
+
+    def snapshots(
+            self,
+            backend_name: str,
+            start: datetime,
+            end: datetime,
+            decode: _Decoder
+    ) -> List[BackendProperties]:
+        """Return the known snapshots of a backend in effect during a period.
+
+        Args:
+            backend_name: Name of the backend.
+            start: Start of the period. Dates without timezone are in UTC.
+            end: End of the period.
+            decode: Function decoding the raw properties returned by the server.
+
+        Returns:
+            The snapshot in effect at `start`, if known, followed by the
+            snapshots updated before `end`, in chronological order.
+        """
+        start, end = _to_utc(start), _to_utc(end)
+        with self._lock:
+            series = self._get_series(backend_name)
+            first = max(bisect.bisect_left(series.dates, start) - 1, 0)
+            last = bisect.bisect_left(series.dates, end)
+            snapshots = series.snapshots[first:last]
+        return [self._decode(backend_name, snapshot, decode) for snapshot in snapshots]
+
+    def missing_dates(
+            self,
+            backend_name: str,
+            start: datetime,
+            end: datetime
+    ) -> List[datetime]:
+        """Return the dates to query for the properties in effect during a period to be known.
+
+        Args:
+            backend_name: Name of the backend.
+            start: Start of the period. Dates without timezone are in UTC.
+            end: End of the period.
+
+        Returns:
+            The end of each part of the period for which the properties in
+            effect are not known, in UTC. Querying the server for these dates
+            either fills the corresponding part, or reveals a snapshot within
+            it, whose date is returned the next time.
+        """
+        start, end = _to_utc(start), _to_utc(end)
+        missing = []
+        with self._lock:
+            series = self._get_series(backend_name)
+            lower_bounds = [None] + series.dates  # type: List[Optional[datetime]]
+            upper_bounds = series.dates + [None]  # type: List[Optional[datetime]]
+            valid_until = [series.empty_until] + series.valid_until
+            for lower, upper, valid in zip(lower_bounds, upper_bounds, valid_until):
+                # Dates in (lower, upper] are answered by the snapshot at `lower`.
+                part_end = end if upper is None else min(upper, end)
+                if part_end < start or (lower is not None and part_end <= lower):
+                    continue
+                if valid is None or valid < part_end:
+                    missing.append(part_end)
+        return missing
+
+    def save(self, backend_name: str, deferred: bool = False) -> None:
+        """Store the dates known for a backend in the disk cache, if enabled.
+
+        The dates already stored, for example by other processes, are merged
+        with the ones known in memory before writing, so that they are kept.
+
+        Args:
+            backend_name: Name of the backend.
+            deferred: If ``True``, the dates are only written if they were
+                last written more than ``_save_interval`` seconds ago, and
+                otherwise the next time they are saved, or at exit.
+        """
+        disk_cache = properties_history_cache()
+        if not disk_cache:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if deferred and now - self._saved_at.get(backend_name, -self._save_interval) \
+                    < self._save_interval:
+                self._unsaved.add(backend_name)
+                if not self._flush_registered:
+                    atexit.register(self.flush)
+                    self._flush_registered = True
+                return
+            self._unsaved.discard(backend_name)
+            self._saved_at[backend_name] = now
+            series = self._get_series(backend_name)
+            self._merge_index(backend_name, series,
+                              disk_cache.get(self._index_key(backend_name)))
+            index = {
+                'snapshots': [[snapshot.last_update_date, valid and valid.isoformat()]
+                              for snapshot, valid in zip(series.snapshots, series.valid_until)],
+                'empty_until': series.empty_until and series.empty_until.isoformat()
+            }
+        disk_cache.put(self._index_key(backend_name), index)
+
+    def flush(self) -> None:
+        """Store the dates whose write was deferred by :meth:`save`."""
+        with self._lock:
+            unsaved = list(self._unsaved)
+        for backend_name in unsaved:
+            self.save(backend_name)
+
+    def clear(self) -> None:
+        """Remove all the snapshots held in memory."""
+        with self._lock:
+            self._series.clear()
+
+    def _get_series(self, backend_name: str) -> _PropertiesSeries:
+        """Return the series of a backend, loading it from disk if needed.
+
+        Must be called with the lock held.
+        """
+        series = self._series.get(backend_name)
+        if series is None:
+            series = self._series[backend_name] = _PropertiesSeries()
+            disk_cache = properties_history_cache()
+            if disk_cache:
+                self._merge_index(backend_name, series,
+                                  disk_cache.get(self._index_key(backend_name)))
+        return series
+
+    @staticmethod
+    def _merge_index(
+            backend_name: str,
+            series: _PropertiesSeries,
+            index: Optional[Dict[str, Any]]
+    ) -> None:
+        """Add the dates stored in the disk cache to a series.
+
+        Args:
+            backend_name: Name of the backend.
+            series: The series of the backend.
+            index: The dates stored in the disk cache, if any.
+        """
+        if not index:
+            return
+        try:
+            for last_update_date, valid_until in index.get('snapshots', []):
+                series.extend_validity(series.add(last_update_date),
+                                       valid_until and _to_utc(valid_until))
+            if index.get('empty_until'):
+                series.extend_empty(_to_utc(index['empty_until']))
+        except (TypeError, ValueError) as ex:
+            logger.debug('Ignoring invalid properties history of %s: %s', backend_name, ex)
+
+    def _decode(
+            self,
+            backend_name: str,
+            snapshot: _Snapshot,
+            decode: _Decoder
+    ) -> Optional[BackendProperties]:
+        """Return the decoded properties of a snapshot, loading them from disk if needed."""
+        if snapshot.properties is not None:
+            return snapshot.properties
+        api_properties = snapshot.api_properties
+        if api_properties is None:
+            disk_cache = properties_history_cache()
+            if disk_cache:
+                api_properties = disk_cache.get(
+                    self._snapshot_key(backend_name, snapshot.last_update_date))
+            if api_properties is None:
+                return None
+        properties = decode(api_properties)
+        with self._lock:
+            snapshot.properties = properties
+            snapshot.api_properties = None
+        return properties
+
+    @staticmethod
+    def _index_key(backend_name: str) -> str:
+        """Return the disk cache key of the dates known for a backend."""
+        return '{}_index'.format(backend_name)
+
+    @staticmethod
+    def _snapshot_key(backend_name: str, last_update_date: str) -> str:
+        """Return the disk cache key of a snapshot."""
+        return '{}_{}'.format(backend_name, last_update_date)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(series.dates) for series in self._series.values())
+
+
+PROPERTIES_HISTORY = PropertiesHistory()
+"""Properties snapshots of all the backends used in this process."""
+
+_properties_history_cache = None  # type: Optional[DiskCache]
+
+
+def enable_properties_history_cache(directory: Optional[str] = None) -> None:
+    """Cache the historical backend properties on disk.
+
+    Once enabled, the backend properties retrieved with
+    :meth:`~qiskit.providers.ibmq.IBMQBackend.properties` using `datetime`,
+    or with :meth:`~qiskit.providers.ibmq.IBMQBackend.properties_history`,
+    are stored on disk and reused by any process that has the cache enabled.
+    Past properties never change, so entries never expire.
+
+    Args:
+        directory: Root directory of the cache. If ``None``, the directory
+            set by the ``QISKIT_IBMQ_PROVIDER_CACHE_DIR`` environment variable
+            or ``$HOME/.qiskit/ibmq_cache`` is used.
+    """
+    global _properties_history_cache  # pylint: disable=global-statement
+    _properties_history_cache = DiskCache('properties_history', directory,
+                                          version=PROPERTIES_HISTORY_CACHE_VERSION)
+    PROPERTIES_HISTORY.clear()
+
+
+def disable_properties_history_cache() -> None:
+    """Stop caching the historical backend properties on disk.
+
+    Entries already on disk are left untouched.
+    """
+    global _properties_history_cache  # pylint: disable=global-statement
+    _properties_history_cache = None
+
+
+def properties_history_cache() -> Optional[DiskCache]:
+    """Return the disk cache for historical backend properties.
+
+    Returns:
+        The disk cache, or ``None`` if it is not enabled.
+    """
+    return _properties_history_cache
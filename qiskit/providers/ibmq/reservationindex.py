@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Index of the upcoming reservations of the backends of a provider."""
+
+import time
+import logging
+from bisect import bisect_left
+from concurrent import futures
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from qiskit.providers.ibmq import accountprovider  # pylint: disable=unused-import
+from .ibmqbackend import IBMQBackend
+from .backendreservation import BackendReservation
+from .utils.converters import local_to_utc
+from .utils.refresher import BackgroundRefresher
+
+logger = logging.getLogger(__name__)
+
+
+class IntervalIndex:
+    """Reservations of a backend, indexed by time interval.
+
+    The reservations are sorted by start time, along with the running maximum
+    of their end times, so that the reservations overlapping a time window are
+    found with a binary search followed by a scan of the overlapping ones.
+    """
+
+    def __init__(self, reservations: List[BackendReservation]) -> None:
+        """IntervalIndex constructor.
+
+        Args:
+            reservations: The reservations of a backend.
+        """
+        intervals = sorted(((reservation.start_datetime.timestamp(),
+                             reservation.end_datetime.timestamp(), reservation)
+                            for reservation in reservations), key=lambda interval: interval[0])
+        self._starts = [start for start, _, _ in intervals]
+        self._ends = [end for _, end, _ in intervals]
+        self._reservations = [reservation for _, _, reservation in intervals]
+        self._max_ends = []  # type: List[float]
+        max_end = float('-inf')
+        for end in self._ends:
+            max_end = max(max_end, end)
+            self._max_ends.append(max_end)
+
+    def overlapping(self, start: float, end: float) -> List[BackendReservation]:
+        """Return the reservations overlapping a time window.
+
+        Args:
+            start: Start of the window, as a timestamp.
+            end: End of the window, as a timestamp.
+
+        Returns:
+            The reservations overlapping the window, sorted by start time.
+        """
+        overlapping = []
+        index = bisect_left(self._starts, end)
+        while index > 0 and self._max_ends[index - 1] > start:
+            index -= 1
+            if self._ends[index] > start:
+                overlapping.append(self._reservations[index])
+        overlapping.reverse()
+        return overlapping
+
+    def __len__(self) -> int:
+        return len(self._reservations)
+
+
+class ReservationIndex(BackgroundRefresher):
+    """Upcoming reservations of all the backends of a provider, refreshed in the background.
+
+    While the index is running, the reservations of every backend starting
+    within the next `horizon` minutes are retrieved concurrently every
+    ``interval`` seconds, and :meth:`IBMQBackend.reservations()` answers the
+    queries within that period from the index instead of querying the server.
+    The number of reservation queries is then set by the refresh interval,
+    regardless of the number of callers.
+
+    Use :meth:`IBMQBackendService.start_reservation_refresh()
+    <qiskit.providers.ibmq.IBMQBackendService.start_reservation_refresh>`
+    to start the index of a provider.
+    """
+
+    _thread_name = 'reservation_index'
+
+    _default_interval = 600
+    """Default number of seconds between refreshes, every 10 minutes."""
+
+    def __init__(
+            self,
+            provider: 'accountprovider.AccountProvider',
+            horizon: float = 2880,
+            max_workers: int = 8
+    ) -> None:
+        """ReservationIndex constructor.
+
+        Args:
+            provider: The provider whose backends are indexed.
+            horizon: Number of minutes after each refresh covered by the index.
+            max_workers: Maximum number of concurrent queries.
+        """
+        super().__init__()
+        self._provider = provider
+        self._max_workers = max_workers
+        self.horizon = horizon
+        self._snapshot = None  # type: Optional[Tuple[float, float, Dict[str, IntervalIndex]]]
+
+    def refresh(self) -> Dict[str, IntervalIndex]:
+        """Retrieve the reservations of all the backends of the provider, concurrently.
+
+        Simulators have no reservations and are not queried.
+
+        Returns:
+            The reservations of each backend, keyed by backend name. Backends
+            whose reservations could not be retrieved are left out.
+        """
+        start = datetime.now(timezone.utc)
+        end = start + timedelta(minutes=self.horizon)
+        backends = list(self._provider._backends.values())
+
+        def _fetch(backend: IBMQBackend) -> Optional[List[BackendReservation]]:
+            if backend.configuration().simulator:
+                return []
+            try:
+                return backend._fetch_reservations(start, end)
+            except Exception as err:  # pylint: disable=broad-except
+                logger.warning('Unable to refresh the reservations of backend %s: %s',
+                               backend.name(), str(err))
+                return None
+
+        with futures.ThreadPoolExecutor(
+                max_workers=max(1, min(self._max_workers, len(backends)))) as executor:
+            reservations = list(executor.map(_fetch, backends))
+        indexes = {backend.name(): IntervalIndex(backend_reservations)
+                   for backend, backend_reservations in zip(backends, reservations)
+                   if backend_reservations is not None}
+        self._snapshot = (start.timestamp(), end.timestamp(), indexes)
+        self.last_refresh = time.monotonic()
+        return indexes
+
+    def reservations(
+            self,
+            backend_name: str,
+            start_datetime: Optional[datetime],
+            end_datetime: Optional[datetime]
+    ) -> Optional[List[BackendReservation]]:
+        """Return the reservations of a backend overlapping a time window, from the index.
+
+        Args:
+            backend_name: Name of the backend.
+            start_datetime: Start of the window, in local timezone.
+            end_datetime: End of the window, in local timezone.
+
+        Returns:
+            The reservations overlapping the window, sorted by start time, or
+            ``None`` if the index is not running, is out of date, or does not
+            cover the backend or the window.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or start_datetime is None or end_datetime is None \
+                or not self.is_fresh():
+            return None
+        index_start, index_end, indexes = snapshot
+        index = indexes.get(backend_name)
+        start = local_to_utc(start_datetime).timestamp()
+        end = local_to_utc(end_datetime).timestamp()
+        if index is None or start < index_start or end > index_end:
+            return None
+        return index.overlapping(start, end)
+
+    def is_reserved(
+            self,
+            backend_name: str,
+            start_datetime: datetime,
+            end_datetime: datetime
+    ) -> Optional[bool]:
+        """Return whether a backend is reserved during a time window, from the index.
+
+        Args:
+            backend_name: Name of the backend.
+            start_datetime: Start of the window, in local timezone.
+            end_datetime: End of the window, in local timezone.
+
+        Returns:
+            Whether a reservation overlaps the window, or ``None`` if the
+            index cannot answer, see :meth:`reservations`.
+        """
+        reservations = self.reservations(backend_name, start_datetime, end_datetime)
+        return None if reservations is None else bool(reservations)
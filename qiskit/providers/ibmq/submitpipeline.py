@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Pipelined submission of several Qobjs to a backend."""
+
+import json
+import time
+import logging
+from queue import Queue
+from concurrent import futures
+from typing import List, Dict, Optional, Tuple, Callable, Union, Any
+
+from qiskit.qobj import QasmQobj, PulseQobj
+from qiskit.providers.ibmq import ibmqbackend  # pylint: disable=unused-import
+
+from .apiconstants import ApiJobShareLevel
+from .api.exceptions import ApiError
+from .exceptions import IBMQBackendError
+from .job import IBMQJob
+from .utils.json_encoder import IQXJsonEncoder
+from .utils.timing import PhaseTimer
+from .utils.qobj_encoder import ProcessQobjEncoder, qobj_encoder
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingJob:
+    """A Qobj going through the submission pipeline."""
+
+    __slots__ = ('index', 'qobj', 'timer', 'encoding', 'qobj_data', 'job_id', 'upload_url',
+                 'job')
+
+    def __init__(self, index: int, qobj: Union[QasmQobj, PulseQobj]) -> None:
+        self.index = index
+        self.qobj = qobj
+        self.timer = PhaseTimer()
+        self.encoding = None  # type: Optional[futures.Future]
+        self.qobj_data = None  # type: Optional[Union[str, bytes]]
+        self.job_id = None  # type: Optional[str]
+        self.upload_url = None  # type: Optional[str]
+        self.job = None  # type: Optional[IBMQJob]
+
+
+class SubmitPipeline:
+    """Submit several Qobjs to a backend, overlapping their submission steps.
+
+    Each submission step runs as a separate stage: the Qobjs are serialized
+    by the calling thread, and the remote jobs are created, uploaded and
+    confirmed by separate pools of threads. The stages are connected by
+    bounded queues, so the Qobj of a job is serialized while the previous
+    jobs are still being uploaded, without serializing all of them upfront.
+    When Qobjs are encoded in a pool of processes, the next Qobjs, up to the
+    size of a queue, are encoded in parallel.
+    """
+
+    def __init__(
+            self,
+            backend: 'ibmqbackend.IBMQBackend',
+            max_workers: int = 4,
+            queue_size: Optional[int] = None
+    ) -> None:
+        """SubmitPipeline constructor.
+
+        Args:
+            backend: The backend to submit the Qobjs to.
+            max_workers: Number of threads used by each network stage.
+            queue_size: Maximum number of Qobjs waiting between two stages.
+                Defaults to twice `max_workers`.
+        """
+        self._backend = backend
+        self._api_client = backend._api_client
+        self._max_workers = max_workers
+        self._queue_size = queue_size or 2 * max_workers
+        self._job_name = None  # type: Optional[str]
+        self._job_share_level = None  # type: Optional[ApiJobShareLevel]
+        self._job_tags = None  # type: Optional[List[str]]
+        self._errors = {}  # type: Dict[int, IBMQBackendError]
+
+    def submit(
+            self,
+            qobjs: List[Union[QasmQobj, PulseQobj]],
+            job_name: Optional[str] = None,
+            job_share_level: Optional[ApiJobShareLevel] = None,
+            job_tags: Optional[List[str]] = None
+    ) -> Tuple[List[Optional[IBMQJob]], Dict[int, IBMQBackendError]]:
+        """Submit the Qobjs.
+
+        Args:
+            qobjs: The Qobjs to be executed.
+            job_name: Custom name to be assigned to the jobs.
+            job_share_level: Level the jobs should be shared at.
+            job_tags: Tags to be assigned to the jobs.
+
+        Returns:
+            The submitted jobs, in the same order as `qobjs`, with ``None``
+            for the Qobjs that could not be submitted, and a dictionary
+            mapping the position of these Qobjs to the error that occurred.
+        """
+        self._job_name = job_name
+        self._job_share_level = job_share_level
+        self._job_tags = job_tags
+        self._errors = {}
+
+        start_time = time.monotonic()
+        pending_jobs = [_PendingJob(index, qobj) for index, qobj in enumerate(qobjs)]
+        queues = [Queue(maxsize=self._queue_size)
+                  for _ in range(3)]  # type: List[Queue]
+        stages = [(self._create, queues[0], queues[1]),
+                  (self._upload, queues[1], queues[2]),
+                  (self._callback, queues[2], None)]
+
+        with futures.ThreadPoolExecutor(max_workers=len(stages) * self._max_workers) as executor:
+            stage_workers = [[executor.submit(self._run_stage, step, in_queue, out_queue)
+                              for _ in range(self._max_workers)]
+                             for step, in_queue, out_queue in stages]
+
+            encoder = qobj_encoder()
+            lookahead = self._queue_size if isinstance(encoder, ProcessQobjEncoder) else 0
+            for position, pending in enumerate(pending_jobs):
+                for upcoming in pending_jobs[position:position + lookahead]:
+                    self._start_encoding(encoder, upcoming)
+                if self._run_step(self._serialize, pending):
+                    queues[0].put(pending)
+
+            # Stop each stage once the previous one has finished.
+            for (_, in_queue, _), workers in zip(stages, stage_workers):
+                for _ in workers:
+                    in_queue.put(None)
+                futures.wait(workers)
+
+        elapsed = time.monotonic() - start_time
+        jobs = [pending.job for pending in pending_jobs]
+        logger.debug('Submitted %d of %d jobs to %s in %.2f seconds (%.2f jobs/second).',
+                     len(qobjs) - len(self._errors), len(qobjs), self._backend.name(),
+                     elapsed, len(qobjs) / elapsed if elapsed else 0)
+        return jobs, dict(self._errors)
+
+    def _run_stage(
+            self,
+            step: Callable[[_PendingJob], None],
+            in_queue: Queue,
+            out_queue: Optional[Queue]
+    ) -> None:
+        """Run a stage until it receives ``None``.
+
+        Args:
+            step: Step performed by the stage.
+            in_queue: Queue of Qobjs waiting for this stage.
+            out_queue: Queue of Qobjs waiting for the next stage, or ``None``
+                if this is the last stage.
+        """
+        while True:
+            pending = in_queue.get()
+            if pending is None:
+                return
+            if self._run_step(step, pending) and out_queue is not None:
+                out_queue.put(pending)
+
+    def _run_step(self, step: Callable[[_PendingJob], None], pending: _PendingJob) -> bool:
+        """Run a step for a Qobj, recording any error.
+
+        Args:
+            step: Step to run.
+            pending: The Qobj.
+
+        Returns:
+            Whether the step was successful.
+        """
+        try:
+            step(pending)
+            return True
+        except ApiError as ex:
+            error = self._backend._submit_error(ex)
+            error.__cause__ = ex
+        except IBMQBackendError as ex:
+            error = ex
+        except Exception as ex:  # pylint: disable=broad-except
+            error = IBMQBackendError('Error submitting job: {}'.format(str(ex)))
+            error.__cause__ = ex
+        logger.debug('Unable to submit Qobj %d: %s', pending.index, error)
+        self._errors[pending.index] = error
+        return False
+
+    @staticmethod
+    def _start_encoding(encoder: ProcessQobjEncoder, pending: _PendingJob) -> None:
+        """Start encoding a Qobj in the pool of processes, unless already started."""
+        if pending.encoding is not None:
+            return
+        try:
+            pending.encoding = encoder.submit(pending.qobj)
+        except Exception as ex:  # pylint: disable=broad-except
+            # The Qobj is encoded again, and the error reported, by _serialize.
+            logger.debug('Unable to start encoding Qobj %d: %s', pending.index, ex)
+
+    def _serialize(self, pending: _PendingJob) -> None:
+        """Encode the Qobj as JSON."""
+        encoding, pending.encoding = pending.encoding, None
+        if encoding is not None:
+            with pending.timer.phase('submit.encode'):
+                pending.qobj_data = encoding.result()
+            return
+        encoder = qobj_encoder()
+        if encoder:
+            with pending.timer.phase('submit.encode'):
+                pending.qobj_data = encoder.encode(pending.qobj)
+            return
+        with pending.timer.phase('submit.to_dict'):
+            qobj_dict = pending.qobj.to_dict()  # type: Dict[str, Any]
+        with pending.timer.phase('submit.json_encode'):
+            pending.qobj_data = json.dumps(qobj_dict, cls=IQXJsonEncoder)
+
+    def _create(self, pending: _PendingJob) -> None:
+        """Create the remote job."""
+        with pending.timer.phase('submit.create_remote_job'):
+            pending.job_id, pending.upload_url = self._api_client.job_create(
+                self._backend.name(),
+                job_name=self._job_name,
+                job_share_level=self._job_share_level,
+                job_tags=self._job_tags)
+
+    def _upload(self, pending: _PendingJob) -> None:
+        """Upload the Qobj."""
+        with pending.timer.phase('submit.upload'):
+            self._api_client.job_upload_qobj(pending.job_id, pending.upload_url,
+                                             pending.qobj_data)
+        pending.qobj_data = None
+
+    def _callback(self, pending: _PendingJob) -> None:
+        """Confirm the upload and create the job instance."""
+        with pending.timer.phase('submit.callback_upload'):
+            submit_info = self._api_client.job_callback_upload(pending.job_id)
+        pending.job = self._backend._job_from_submit_info(
+            pending.qobj, submit_info, pending.timer)
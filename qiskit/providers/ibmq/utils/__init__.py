@@ -36,6 +36,26 @@ Qobj Utils
 
     update_qobj_config
 
+Qobj Encoding
+=============
+.. autosummary::
+    :toctree: ../stubs/
+
+    ProcessQobjEncoder
+    FragmentCacheQobjEncoder
+    enable_process_encoding
+    disable_process_encoding
+    enable_fragment_cache
+    disable_fragment_cache
+
+Backend Properties
+==================
+.. autosummary::
+    :toctree: ../stubs/
+
+    PropertiesArrays
+    properties_arrays
+
 Misc Functions
 ==============
 .. autosummary::
@@ -49,4 +69,8 @@ Misc Functions
 from .converters import (utc_to_local, local_to_utc, seconds_to_duration,
                          duration_difference)
 from .qobj_utils import update_qobj_config
+from .qobj_encoder import (ProcessQobjEncoder, FragmentCacheQobjEncoder,
+                           enable_process_encoding, disable_process_encoding,
+                           enable_fragment_cache, disable_fragment_cache)
+from .properties import PropertiesArrays, properties_arrays
 from .utils import to_python_identifier, validate_job_tags
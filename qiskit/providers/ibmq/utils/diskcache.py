@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""On-disk JSON cache shared across processes."""
+
+import os
+import re
+import json
+import logging
+import tempfile
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = 'QISKIT_IBMQ_PROVIDER_CACHE_DIR'
+"""The environment variable name that is used to set the root directory of the disk caches."""
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), '.qiskit', 'ibmq_cache')
+"""Default root directory of the disk caches."""
+
+_UNSAFE_CHARS_RE = re.compile(r'[^\w.-]', re.ASCII)
+
+
+def default_cache_dir() -> str:
+    """Return the root directory of the disk caches.
+
+    Returns:
+        The value of the ``QISKIT_IBMQ_PROVIDER_CACHE_DIR`` environment variable
+        if set, otherwise ``$HOME/.qiskit/ibmq_cache``.
+    """
+    return os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+
+
+class DiskCache:
+    """A cache of JSON documents stored as files, one file per key.
+
+    Entries are written atomically, so a cache directory can be shared by
+    several processes. Each cache lives in its own namespace directory,
+    and the format version is part of the path so that entries written by
+    incompatible versions are never read back.
+    """
+
+    def __init__(
+            self,
+            namespace: str,
+            directory: Optional[str] = None,
+            version: int = 1
+    ) -> None:
+        """DiskCache constructor.
+
+        Args:
+            namespace: Name of the cache, used as a subdirectory.
+            directory: Root directory of the caches. If ``None``, the
+                directory returned by :func:`default_cache_dir` is used.
+            version: Format version of the cache entries.
+        """
+        self.directory = directory or default_cache_dir()
+        self.path = os.path.join(self.directory, namespace, 'v{}'.format(version))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The cached value, or ``None`` if the entry is not found or
+            cannot be read.
+        """
+        file_path = self._file_path(key)
+        try:
+            with open(file_path, 'r') as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            logger.debug('Unable to read cache entry %s: %s', file_path, ex)
+            self.remove(key)
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value.
+
+        Errors writing to the disk are logged and otherwise ignored.
+
+        Args:
+            key: Key of the entry.
+            value: JSON serializable value to store.
+        """
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            file_desc, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            try:
+                with os.fdopen(file_desc, 'w') as tmp_file:
+                    json.dump(value, tmp_file)
+                os.replace(tmp_path, self._file_path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as ex:
+            logger.warning('Unable to write cache entry for %s in %s: %s', key, self.path, ex)
+
+    def remove(self, key: str) -> None:
+        """Remove an entry, if it exists.
+
+        Args:
+            key: Key of the entry.
+        """
+        try:
+            os.remove(self._file_path(key))
+        except OSError:
+            pass
+
+    def mtime(self, key: str) -> Optional[float]:
+        """Return the time an entry was last written.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The modification time of the entry, in seconds since the epoch, or
+            ``None`` if the entry is not found.
+        """
+        try:
+            return os.path.getmtime(self._file_path(key))
+        except OSError:
+            return None
+
+    def _file_path(self, key: str) -> str:
+        """Return the path of the file for a key."""
+        return os.path.join(self.path, _UNSAFE_CHARS_RE.sub('_', key) + '.json')
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar view of backend properties."""
+
+import weakref
+from threading import Lock
+from typing import Dict, List, Tuple, Iterable
+
+import numpy as np
+
+from qiskit.providers.exceptions import BackendPropertyError
+from qiskit.providers.models import BackendProperties
+
+
+class PropertiesArrays:
+    """Columnar view of backend properties.
+
+    The qubit properties, such as ``T1``, ``T2`` and ``readout_error``, are
+    held in one array per property, indexed by qubit. The gate parameters,
+    such as ``gate_error`` and ``gate_length``, are held in one array per
+    parameter, with one row per gate, and an index mapping each gate name and
+    qubits to its row. Lookups are constant time, and statistics can be
+    computed on the arrays directly::
+
+        arrays = properties_arrays(backend.properties())
+        mean_t1 = arrays.qubit_property('T1').mean()
+        cx_error = arrays.gate_property('cx', [0, 1])
+
+    Values are in the units reported by the backend, available in
+    :attr:`qubit_units` and :attr:`gate_units`. Missing values are ``NaN``.
+    The arrays are read-only, as they are shared by all the users of the
+    same properties. Use :func:`properties_arrays` to build the view once
+    per properties snapshot.
+    """
+
+    def __init__(self, properties: BackendProperties) -> None:
+        """PropertiesArrays constructor.
+
+        Args:
+            properties: The backend properties.
+        """
+        self.backend_name = properties.backend_name
+        self.last_update_date = properties.last_update_date
+        self.n_qubits = len(properties.qubits)
+
+        self.qubit_units = {}  # type: Dict[str, str]
+        self._qubit_values = {}  # type: Dict[str, np.ndarray]
+        for qubit, nduvs in enumerate(properties.qubits):
+            for nduv in nduvs:
+                values = self._qubit_values.get(nduv.name)
+                if values is None:
+                    values = self._qubit_values[nduv.name] = np.full(self.n_qubits, np.nan)
+                    self.qubit_units[nduv.name] = nduv.unit
+                values[qubit] = nduv.value
+
+        self.gate_names = [gate.gate for gate in properties.gates]  # type: List[str]
+        self.gate_qubits = [tuple(gate.qubits)
+                            for gate in properties.gates]  # type: List[Tuple[int, ...]]
+        self.gate_units = {}  # type: Dict[str, str]
+        self._gate_values = {}  # type: Dict[str, np.ndarray]
+        self._gate_index = {}  # type: Dict[Tuple[str, Tuple[int, ...]], int]
+        self._qubits_index = {}  # type: Dict[Tuple[int, ...], int]
+        self._gate_rows = {}  # type: Dict[str, List[int]]
+        for row, gate in enumerate(properties.gates):
+            self._gate_index.setdefault((gate.gate, self.gate_qubits[row]), row)
+            self._qubits_index.setdefault(self.gate_qubits[row], row)
+            self._gate_rows.setdefault(gate.gate, []).append(row)
+            for nduv in gate.parameters:
+                values = self._gate_values.get(nduv.name)
+                if values is None:
+                    values = self._gate_values[nduv.name] = np.full(len(properties.gates),
+                                                                    np.nan)
+                    self.gate_units[nduv.name] = nduv.unit
+                values[row] = nduv.value
+
+        for values in list(self._qubit_values.values()) + list(self._gate_values.values()):
+            values.flags.writeable = False
+
+    def qubit_property(self, name: str) -> np.ndarray:
+        """Return the values of a qubit property for all the qubits.
+
+        Args:
+            name: Name of the property, such as ``T1`` or ``readout_error``.
+
+        Returns:
+            The values, indexed by qubit.
+
+        Raises:
+            BackendPropertyError: If no qubit has the property.
+        """
+        try:
+            return self._qubit_values[name]
+        except KeyError:
+            raise BackendPropertyError(
+                'Couldn\'t find the qubit property "{}".'.format(name)) from None
+
+    def gate_property(
+            self,
+            gate: str,
+            qubits: Iterable[int],
+            name: str = 'gate_error'
+    ) -> float:
+        """Return a parameter of a gate.
+
+        Args:
+            gate: Name of the gate.
+            qubits: Qubits the gate acts on.
+            name: Name of the parameter.
+
+        Returns:
+            The value of the parameter, or ``NaN`` if the gate does not have it.
+
+        Raises:
+            BackendPropertyError: If the gate is not found.
+        """
+        qubits = tuple(qubits)
+        try:
+            row = self._gate_index[(gate, qubits)]
+        except KeyError:
+            raise BackendPropertyError(
+                'Couldn\'t find the gate "{}" on qubits {}.'.format(gate, list(qubits))) from None
+        return float(self.gate_parameter(name)[row])
+
+    def qubits_gate_property(self, qubits: Iterable[int], name: str = 'gate_error') -> float:
+        """Return a parameter of the first gate acting on some qubits, whatever its name.
+
+        Args:
+            qubits: Qubits the gate acts on.
+            name: Name of the parameter.
+
+        Returns:
+            The value of the parameter, or ``NaN`` if the gate does not have it.
+
+        Raises:
+            BackendPropertyError: If no gate acts on the qubits.
+        """
+        qubits = tuple(qubits)
+        try:
+            row = self._qubits_index[qubits]
+        except KeyError:
+            raise BackendPropertyError(
+                'Couldn\'t find a gate on qubits {}.'.format(list(qubits))) from None
+        return float(self.gate_parameter(name)[row])
+
+    def gate_parameter(self, name: str = 'gate_error') -> np.ndarray:
+        """Return the values of a gate parameter for all the gates.
+
+        Args:
+            name: Name of the parameter, such as ``gate_error`` or ``gate_length``.
+
+        Returns:
+            The values, with one row per gate, in the same order as
+            :attr:`gate_names` and :attr:`gate_qubits`.
+
+        Raises:
+            BackendPropertyError: If no gate has the parameter.
+        """
+        try:
+            return self._gate_values[name]
+        except KeyError:
+            raise BackendPropertyError(
+                'Couldn\'t find the gate parameter "{}".'.format(name)) from None
+
+    def gate_rows(self, gate: str) -> List[int]:
+        """Return the rows of all the instances of a gate.
+
+        Args:
+            gate: Name of the gate.
+
+        Returns:
+            The rows of the gate in the gate parameter arrays, which can be
+            used to select the values of the gate, for example
+            ``arrays.gate_parameter()[arrays.gate_rows('cx')]``.
+        """
+        return list(self._gate_rows.get(gate, []))
+
+    def single_qubit_gate_parameter(self, gate: str, name: str = 'gate_error') -> np.ndarray:
+        """Return a parameter of a single qubit gate for all the qubits.
+
+        Args:
+            gate: Name of the gate.
+            name: Name of the parameter.
+
+        Returns:
+            The values, indexed by qubit, with ``NaN`` for the qubits without
+            the gate.
+
+        Raises:
+            BackendPropertyError: If no gate has the parameter.
+        """
+        gate_values = self.gate_parameter(name)
+        values = np.full(self.n_qubits, np.nan)
+        for row in self._gate_rows.get(gate, []):
+            qubits = self.gate_qubits[row]
+            if len(qubits) == 1 and np.isnan(values[qubits[0]]):
+                values[qubits[0]] = gate_values[row]
+        return values
+
+
+_arrays_cache = {}  # type: Dict[int, PropertiesArrays]
+_arrays_cache_lock = Lock()
+
+
+def properties_arrays(properties: BackendProperties) -> PropertiesArrays:
+    """Return the columnar view of backend properties.
+
+    The view is built the first time it is requested for a properties
+    instance, and reused for as long as the instance is alive.
+
+    Args:
+        properties: The backend properties.
+
+    Returns:
+        The columnar view of the properties.
+    """
+    key = id(properties)
+    with _arrays_cache_lock:
+        arrays = _arrays_cache.get(key)
+    if arrays is not None:
+        return arrays
+
+    arrays = PropertiesArrays(properties)
+    with _arrays_cache_lock:
+        if key not in _arrays_cache:
+            _arrays_cache[key] = arrays
+            weakref.finalize(properties, _arrays_cache.pop, key, None)
+        return _arrays_cache[key]
@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Encoding of Qobjs as JSON for job submission."""
+
+import copy
+import json
+import pickle
+import hashlib
+import logging
+import multiprocessing
+from threading import Lock
+from collections import OrderedDict
+from concurrent import futures
+from typing import Dict, List, Optional, Union, Tuple, NamedTuple
+
+from qiskit.qobj import QasmQobj, PulseQobj, QasmQobjExperiment, PulseQobjExperiment
+
+from .json_encoder import IQXJsonEncoder
+
+logger = logging.getLogger(__name__)
+
+
+def encode_qobj(qobj: Union[QasmQobj, PulseQobj]) -> bytes:
+    """Encode a Qobj as JSON.
+
+    Args:
+        qobj: The Qobj to encode.
+
+    Returns:
+        The UTF-8 encoded JSON representation of the Qobj.
+    """
+    return json.dumps(qobj.to_dict(), cls=IQXJsonEncoder).encode('utf-8')
+
+
+def encode_experiments(
+        experiments: List[Union[QasmQobjExperiment, PulseQobjExperiment]]
+) -> List[Tuple[bytes, bytes]]:
+    """Encode experiments as canonical JSON.
+
+    The keys of the JSON objects are sorted, so that equal experiments
+    always have the same encoding.
+
+    Args:
+        experiments: The experiments to encode.
+
+    Returns:
+        The SHA-1 digest and the UTF-8 encoded canonical JSON representation
+        of each experiment.
+    """
+    encodings = []
+    for experiment in experiments:
+        fragment = json.dumps(experiment.to_dict(), cls=IQXJsonEncoder,
+                              sort_keys=True).encode('utf-8')
+        encodings.append((hashlib.sha1(fragment).digest(), fragment))
+    return encodings
+
+
+def qobj_size(qobj: Union[QasmQobj, PulseQobj]) -> int:
+    """Return an estimate of the cost of encoding a Qobj.
+
+    Args:
+        qobj: The Qobj.
+
+    Returns:
+        The number of instructions in all experiments, plus the number of
+        pulse library entries.
+    """
+    size = sum(len(experiment.instructions) for experiment in qobj.experiments)
+    size += len(getattr(qobj.config, 'pulse_library', None) or [])
+    return size
+
+
+class ProcessQobjEncoder:
+    """Encode Qobjs as JSON in a pool of processes.
+
+    Converting a large Qobj to a dictionary and encoding it as JSON is CPU
+    bound and holds the GIL, stalling every other thread of the process,
+    such as the ones waiting for job status updates. This encoder runs both
+    steps in worker processes instead. The encoded bytes are sent back
+    through the pool, which only copies them.
+
+    Sending a Qobj to a worker process requires pickling it, which is cheaper
+    than encoding it but not free, so only Qobjs whose :func:`qobj_size` is
+    at least `min_size` are encoded in the pool.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_size: int = 5000) -> None:
+        """ProcessQobjEncoder constructor.
+
+        Args:
+            max_workers: Maximum number of worker processes. Defaults to the
+                number of processors on the machine.
+            min_size: Minimum size, as returned by :func:`qobj_size`, of the
+                Qobjs that are encoded in the pool. Smaller Qobjs are encoded
+                in the calling thread.
+        """
+        self.max_workers = max_workers
+        self.min_size = min_size
+        try:
+            # Forking a process that runs other threads is unsafe.
+            self._pool = futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        except TypeError:  # Python < 3.7
+            self._pool = futures.ProcessPoolExecutor(max_workers=max_workers)
+
+    def encode(self, qobj: Union[QasmQobj, PulseQobj]) -> bytes:
+        """Encode a Qobj as JSON.
+
+        Args:
+            qobj: The Qobj to encode.
+
+        Returns:
+            The UTF-8 encoded JSON representation of the Qobj.
+        """
+        return self.submit(qobj).result()
+
+    def submit(self, qobj: Union[QasmQobj, PulseQobj]) -> futures.Future:
+        """Start encoding a Qobj as JSON, without waiting for the result.
+
+        Submitting several Qobjs before waiting for the first one encodes
+        them in parallel, in up to `max_workers` processes.
+
+        Args:
+            qobj: The Qobj to encode.
+
+        Returns:
+            A future holding the UTF-8 encoded JSON representation of the
+            Qobj. Small Qobjs are encoded in the calling thread, and their
+            future is already done.
+        """
+        if qobj_size(qobj) >= self.min_size:
+            return self._pool.submit(encode_qobj, qobj)
+        future = futures.Future()  # type: futures.Future
+        try:
+            future.set_result(encode_qobj(qobj))
+        except Exception as ex:  # pylint: disable=broad-except
+            future.set_exception(ex)
+        return future
+
+    def submit_experiments(
+            self,
+            experiments: List[Union[QasmQobjExperiment, PulseQobjExperiment]]
+    ) -> futures.Future:
+        """Start encoding experiments as canonical JSON, without waiting for the result.
+
+        Args:
+            experiments: The experiments to encode.
+
+        Returns:
+            A future holding the result of :func:`encode_experiments`.
+        """
+        return self._pool.submit(encode_experiments, experiments)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown()
+
+
+class FragmentCacheInfo(NamedTuple):
+    """Statistics of a :class:`FragmentCacheQobjEncoder`."""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class FragmentCacheQobjEncoder:
+    """Encode Qobjs as JSON, reusing the encoding of repeated experiments.
+
+    Workflows such as calibrations and benchmarks submit the same
+    experiments many times, with different shots or headers. This encoder
+    keeps the canonical JSON encoding of each experiment, keyed by its
+    digest, and splices the cached fragments into the encoded Qobj. Only
+    the Qobj header and configuration are encoded for every submission.
+
+    Experiments are first looked up by a digest of their pickle, which is
+    much cheaper to compute than their encoding. Equal experiments can
+    pickle differently, for example if their attributes were set in a
+    different order, so an experiment that is not found is encoded, and
+    looked up again by the digest of its encoding.
+
+    The cache holds at most `max_bytes` of encoded experiments, evicting the
+    least recently used ones first. If `process_encoder` is set, the
+    experiments that are not found are encoded in its pool of processes
+    when their total :func:`qobj_size` is at least its ``min_size``.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int = 64 * 1024 * 1024,
+            process_encoder: Optional[ProcessQobjEncoder] = None
+    ) -> None:
+        """FragmentCacheQobjEncoder constructor.
+
+        Args:
+            max_bytes: Maximum size of the cached fragments, in bytes.
+            process_encoder: Encoder used to encode large experiments that
+                are not in the cache, or ``None`` to encode them in the
+                calling thread.
+        """
+        self.max_bytes = max_bytes
+        self.process_encoder = process_encoder
+        self._fragments = OrderedDict()  # type: OrderedDict[bytes, bytes]
+        self._aliases = {}  # type: Dict[bytes, bytes]
+        self._alias_keys = {}  # type: Dict[bytes, List[bytes]]
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def encode(self, qobj: Union[QasmQobj, PulseQobj]) -> bytes:
+        """Encode a Qobj as JSON.
+
+        Args:
+            qobj: The Qobj to encode.
+
+        Returns:
+            The UTF-8 encoded JSON representation of the Qobj.
+        """
+        qobj_head = copy.copy(qobj)
+        qobj_head.experiments = []
+        head_dict = qobj_head.to_dict()
+        head_dict.pop('experiments', None)
+        head = json.dumps(head_dict, cls=IQXJsonEncoder).encode('utf-8')
+        fragments = b', '.join(self._encode_experiments(qobj.experiments))
+        separator = b', ' if head_dict else b''
+        return head[:-1] + separator + b'"experiments": [' + fragments + b']}'
+
+    def cache_info(self) -> FragmentCacheInfo:
+        """Return the cache statistics.
+
+        Returns:
+            The number of cache hits, misses and evictions, and the number
+            and total size in bytes of the cached fragments.
+        """
+        with self._lock:
+            return FragmentCacheInfo(self._hits, self._misses, self._evictions,
+                                     len(self._fragments), self._size)
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._fragments.clear()
+            self._aliases.clear()
+            self._alias_keys.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+
+    def _encode_experiments(
+            self,
+            experiments: List[Union[QasmQobjExperiment, PulseQobjExperiment]]
+    ) -> List[bytes]:
+        """Return the JSON encoding of experiments, from the cache if possible.
+
+        Args:
+            experiments: The experiments to encode.
+
+        Returns:
+            The UTF-8 encoded JSON representation of each experiment.
+        """
+        pickle_digests = [_pickle_digest(experiment) for experiment in experiments]
+        fragments = [None] * len(experiments)  # type: List[Optional[bytes]]
+        with self._lock:
+            for index, pickle_digest in enumerate(pickle_digests):
+                key = self._aliases.get(pickle_digest) if pickle_digest else None
+                fragment = self._fragments.get(key) if key else None
+                if fragment is not None:
+                    self._fragments.move_to_end(key)
+                    self._hits += 1
+                    fragments[index] = fragment
+
+        missing = [index for index, fragment in enumerate(fragments) if fragment is None]
+        if not missing:
+            return fragments  # type: ignore[return-value]
+        encodings = self._encode_missing([experiments[index] for index in missing])
+
+        with self._lock:
+            for index, (key, fragment) in zip(missing, encodings):
+                cached = self._fragments.get(key)
+                if cached is not None:
+                    self._fragments.move_to_end(key)
+                    self._hits += 1
+                    fragment = cached
+                else:
+                    self._misses += 1
+                    if len(fragment) > self.max_bytes:
+                        fragments[index] = fragment
+                        continue
+                    self._fragments[key] = fragment
+                    self._size += len(fragment)
+                    self._evict()
+                fragments[index] = fragment
+                pickle_digest = pickle_digests[index]
+                if pickle_digest and key in self._fragments \
+                        and pickle_digest not in self._aliases:
+                    self._aliases[pickle_digest] = key
+                    self._alias_keys.setdefault(key, []).append(pickle_digest)
+        return fragments  # type: ignore[return-value]
+
+    def _encode_missing(
+            self,
+            experiments: List[Union[QasmQobjExperiment, PulseQobjExperiment]]
+    ) -> List[Tuple[bytes, bytes]]:
+        """Encode the experiments not found in the cache.
+
+        Args:
+            experiments: The experiments to encode.
+
+        Returns:
+            The result of :func:`encode_experiments`.
+        """
+        process_encoder = self.process_encoder
+        if process_encoder is not None:
+            size = sum(len(experiment.instructions) for experiment in experiments)
+            if size >= process_encoder.min_size:
+                try:
+                    return process_encoder.submit_experiments(experiments).result()
+                except RuntimeError as ex:
+                    # The pool was shut down by disable_process_encoding().
+                    logger.debug('Unable to encode experiments in the pool: %s', ex)
+        return encode_experiments(experiments)
+
+    def _evict(self) -> None:
+        """Evict the least recently used fragments until the cache fits.
+
+        Must be called with the lock held.
+        """
+        while self._size > self.max_bytes:
+            key, evicted = self._fragments.popitem(last=False)
+            self._size -= len(evicted)
+            self._evictions += 1
+            for pickle_digest in self._alias_keys.pop(key, []):
+                self._aliases.pop(pickle_digest, None)
+
+
+def _pickle_digest(
+        experiment: Union[QasmQobjExperiment, PulseQobjExperiment]
+) -> Optional[bytes]:
+    """Return the SHA-1 digest of the pickle of an experiment.
+
+    Args:
+        experiment: The experiment.
+
+    Returns:
+        The digest, or ``None`` if the experiment cannot be pickled.
+    """
+    try:
+        return hashlib.sha1(pickle.dumps(experiment, protocol=pickle.HIGHEST_PROTOCOL)).digest()
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+QobjEncoder = Union[ProcessQobjEncoder, FragmentCacheQobjEncoder]
+
+_process_encoder = None  # type: Optional[ProcessQobjEncoder]
+_fragment_cache = None  # type: Optional[FragmentCacheQobjEncoder]
+_encoders_lock = Lock()
+
+
+def enable_process_encoding(max_workers: Optional[int] = None, min_size: int = 5000) -> None:
+    """Encode large Qobjs in a pool of processes when submitting jobs.
+
+    If the fragment cache enabled by :func:`enable_fragment_cache` is enabled
+    too, the experiments that are not in the cache are encoded in the pool.
+
+    Args:
+        max_workers: Maximum number of worker processes. Defaults to the
+            number of processors on the machine.
+        min_size: Minimum number of instructions in a Qobj for it to be
+            encoded in the pool. See :class:`ProcessQobjEncoder`.
+    """
+    _set_process_encoder(ProcessQobjEncoder(max_workers, min_size))
+
+
+def disable_process_encoding() -> None:
+    """Encode Qobjs in the submitting thread, and stop the worker processes."""
+    _set_process_encoder(None)
+
+
+def _set_process_encoder(encoder: Optional[ProcessQobjEncoder]) -> None:
+    """Set the process encoder, shutting down the previous one.
+
+    Args:
+        encoder: The new process encoder, or ``None`` to disable it.
+    """
+    global _process_encoder  # pylint: disable=global-statement
+    with _encoders_lock:
+        previous, _process_encoder = _process_encoder, encoder
+        if _fragment_cache is not None:
+            _fragment_cache.process_encoder = encoder
+    if previous is not None:
+        previous.shutdown()
+
+
+def enable_fragment_cache(max_bytes: int = 64 * 1024 * 1024) -> FragmentCacheQobjEncoder:
+    """Reuse the encoding of repeated experiments when submitting jobs.
+
+    If the process encoding enabled by :func:`enable_process_encoding` is
+    enabled too, the experiments that are not in the cache are encoded in
+    its pool of processes.
+
+    Args:
+        max_bytes: Maximum size of the cached experiments, in bytes.
+
+    Returns:
+        The encoder holding the cache, whose
+        :meth:`~FragmentCacheQobjEncoder.cache_info` returns the cache
+        statistics.
+    """
+    global _fragment_cache  # pylint: disable=global-statement
+    with _encoders_lock:
+        _fragment_cache = FragmentCacheQobjEncoder(max_bytes, _process_encoder)
+        return _fragment_cache
+
+
+def disable_fragment_cache() -> None:
+    """Stop caching the encoding of experiments, and clear the cache."""
+    global _fragment_cache  # pylint: disable=global-statement
+    with _encoders_lock:
+        _fragment_cache = None
+
+
+def qobj_encoder() -> Optional[QobjEncoder]:
+    """Return the encoder used to submit jobs.
+
+    Returns:
+        The fragment cache, if enabled, otherwise the process encoder, or
+        ``None`` if Qobjs are encoded in the submitting thread.
+    """
+    return _fragment_cache or _process_encoder
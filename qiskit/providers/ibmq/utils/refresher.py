@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Periodic refresh of data in a background thread."""
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from threading import Event, Lock, Thread
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher(ABC):
+    """Base class for data refreshed periodically in a background thread.
+
+    Subclasses implement :meth:`refresh`, which is called once when the
+    refresher is started, then every ``interval`` seconds until it is stopped.
+    """
+
+    _thread_name = 'ibmq_refresher'
+    """Name of the refresh thread."""
+
+    _default_interval = 60  # type: float
+    """Number of seconds between refreshes if :meth:`start` is not given an interval."""
+
+    def __init__(self) -> None:
+        """BackgroundRefresher constructor."""
+        self._interval = None  # type: Optional[float]
+        self._thread = None  # type: Optional[Thread]
+        self._stop_event = Event()
+        self._lock = Lock()
+        self.last_refresh = None  # type: Optional[float]
+        """Time of the end of the last refresh, as returned by ``time.monotonic()``."""
+
+    @property
+    def interval(self) -> Optional[float]:
+        """Return the refresh interval.
+
+        Returns:
+            The refresh interval, in seconds, or ``None`` if the refresher is
+            not running.
+        """
+        return self._interval
+
+    @property
+    def max_age(self) -> Optional[float]:
+        """Return the maximum age of the refreshed data to be used.
+
+        Returns:
+            Twice the refresh interval, in seconds, or ``None`` if the
+            refresher is not running.
+        """
+        interval = self._interval
+        return None if interval is None else 2 * interval
+
+    def is_fresh(self) -> bool:
+        """Return whether the refreshed data can be used.
+
+        Returns:
+            Whether the refresher is running and the last refresh is not older
+            than :attr:`max_age`.
+        """
+        max_age = self.max_age
+        last_refresh = self.last_refresh
+        return max_age is not None and last_refresh is not None and \
+            time.monotonic() - last_refresh <= max_age
+
+    def start(self, interval: Optional[float] = None) -> None:
+        """Start refreshing the data in the background.
+
+        The data is refreshed once before returning. If the refresher is
+        already running, only its refresh interval is changed.
+
+        Args:
+            interval: Number of seconds between refreshes. If ``None``, the
+                default interval of the refresher is used: 60 seconds, unless
+                the subclass sets a different ``_default_interval``.
+        """
+        if interval is None:
+            interval = self._default_interval
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                self._interval = interval
+                return
+            self.refresh()
+            self._interval = interval
+            self._stop_event = Event()
+            self._thread = Thread(target=self._run, args=(self._stop_event,),
+                                  name=self._thread_name, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing the data."""
+        with self._lock:
+            self._stop_event.set()
+            self._interval = None
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    @abstractmethod
+    def refresh(self) -> Any:
+        """Refresh the data.
+
+        Returns:
+            The refreshed data.
+        """
+        pass
+
+    def _run(self, stop_event: Event) -> None:
+        """Refresh the data until the refresher is stopped."""
+        while not stop_event.wait(self._interval or 0):
+            try:
+                self.refresh()
+            except Exception as err:  # pylint: disable=broad-except
+                logger.warning('Unable to refresh %s: %s', self.__class__.__name__, str(err))
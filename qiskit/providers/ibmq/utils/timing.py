@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Timing of client-side processing phases."""
+
+import time
+from threading import Lock
+from contextlib import contextmanager
+from typing import List, Tuple, Dict, Iterator
+
+
+class PhaseTimer:
+    """Record the start and end of named processing phases.
+
+    Timestamps are taken from :func:`time.monotonic`, so durations are not
+    affected by changes to the system clock. Phases are kept in the order
+    they ended, and a phase recorded more than once keeps all of its
+    occurrences.
+    """
+
+    def __init__(self) -> None:
+        """PhaseTimer constructor."""
+        self._phases = []  # type: List[Tuple[str, float, float]]
+        self._lock = Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase `name`.
+
+        The phase is recorded even if the block raises an exception.
+
+        Args:
+            name: Name of the phase.
+
+        Yields:
+            ``None``.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.monotonic())
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Record a phase.
+
+        Args:
+            name: Name of the phase.
+            start: Monotonic time the phase started.
+            end: Monotonic time the phase ended.
+        """
+        with self._lock:
+            self._phases.append((name, start, end))
+
+    def extend(self, other: 'PhaseTimer') -> None:
+        """Add all phases recorded by another timer.
+
+        Args:
+            other: Timer whose phases are added.
+        """
+        phases = other.phases()
+        with self._lock:
+            self._phases.extend(phases)
+
+    def phases(self) -> List[Tuple[str, float, float]]:
+        """Return the recorded phases.
+
+        Returns:
+            A list of ``(name, start, end)`` tuples, in the order the phases
+            were recorded.
+        """
+        with self._lock:
+            return list(self._phases)
+
+    def durations(self) -> Dict[str, float]:
+        """Return the time spent in each phase.
+
+        Returns:
+            A dictionary mapping the phase names to the total time spent in
+            them, in seconds.
+        """
+        durations = {}  # type: Dict[str, float]
+        for name, start, end in self.phases():
+            durations[name] = durations.get(name, 0.0) + (end - start)
+        return durations
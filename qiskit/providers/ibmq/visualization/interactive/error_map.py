@@ -22,7 +22,9 @@ import numpy as np
 import matplotlib as mpl
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from qiskit.providers.exceptions import BackendPropertyError
 from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+from qiskit.providers.ibmq.utils.properties import PropertiesArrays, properties_arrays
 
 from .plotly_wrapper import PlotlyWidget, PlotlyFigure
 from ..device_layouts import DEVICE_LAYOUTS
@@ -31,6 +33,14 @@ from ..colormaps import (HELIX_LIGHT, HELIX_LIGHT_CMAP,
 from ..exceptions import VisualizationValueError, VisualizationTypeError
 
 
+def _qubit_property(props: PropertiesArrays, name: str) -> np.ndarray:
+    """Return the values of a qubit property, ``NaN`` if the backend does not report it."""
+    try:
+        return props.qubit_property(name)
+    except BackendPropertyError:
+        return np.full(props.n_qubits, np.nan)
+
+
 def iplot_error_map(
         backend: IBMQBackend,
         figsize: Tuple[int] = (800, 500),
@@ -111,28 +121,14 @@ def iplot_error_map(
         out = PlotlyWidget(fig)
         return out
 
-    props = backend.properties().to_dict()
-
-    t1s = []
-    t2s = []
-    for qubit_props in props['qubits']:
-        count = 0
-        for item in qubit_props:
-            if item['name'] == 'T1':
-                t1s.append(item['value'])
-                count += 1
-            elif item['name'] == 'T2':
-                t2s.append(item['value'])
-                count += 1
-            if count == 2:
-                break
+    props = properties_arrays(backend.properties())
+
+    t1s = _qubit_property(props, 'T1')
+    t2s = _qubit_property(props, 'T2')
 
     # U2 error rates
-    single_gate_errors = [0]*n_qubits
-    for gate in props['gates']:
-        if gate['gate'] == 'u2':
-            _qubit = gate['qubits'][0]
-            single_gate_errors[_qubit] = gate['parameters'][0]['value']
+    single_gate_errors = props.single_qubit_gate_parameter('u2')
+    single_gate_errors[np.isnan(single_gate_errors)] = 0
 
     # Convert to percent
     single_gate_errors = 100 * np.asarray(single_gate_errors)
@@ -149,11 +145,9 @@ def iplot_error_map(
     if n_qubits > 1 and cmap:
         cx_errors = []
         for cmap_qubits in cmap:
-            for gate in props['gates']:
-                if gate['qubits'] == cmap_qubits:
-                    cx_errors.append(gate['parameters'][0]['value'])
-                    break
-            else:
+            try:
+                cx_errors.append(props.qubits_gate_property(cmap_qubits))
+            except BackendPropertyError:
                 continue
 
         # Convert to percent
@@ -165,7 +159,7 @@ def iplot_error_map(
         else:
             cx_idx = np.arange(len(cx_errors))
 
-        avg_cx_err = np.mean(cx_errors[cx_idx])
+        avg_cx_err = np.nanmean(cx_errors[cx_idx])
 
         for err in cx_errors:
             if err != 100.0 or not remove_badcal_edges:
@@ -176,16 +170,9 @@ def iplot_error_map(
                 line_colors.append("#ff0000")
 
     # Measurement errors
-    read_err = []
-
-    for qubit in range(n_qubits):
-        for item in props['qubits'][qubit]:
-            if item['name'] == 'readout_error':
-                read_err.append(item['value'])
-
-    read_err = 100 * np.asarray(read_err)
-    avg_read_err = np.mean(read_err)
-    max_read_err = np.max(read_err)
+    read_err = 100 * _qubit_property(props, 'readout_error')
+    avg_read_err = np.nanmean(read_err)
+    max_read_err = np.nanmax(read_err)
 
     if n_qubits < 10:
         num_left = n_qubits
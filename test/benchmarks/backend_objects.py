@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for sharing backend objects across providers."""
+
+import os
+import gc
+import copy
+import json
+import tracemalloc
+from unittest import mock
+
+from qiskit.test.mock.backends import almaden
+
+from qiskit.providers.ibmq.backendcache import BACKEND_INTERN_TABLE
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqfactory import IBMQFactory
+
+
+def _load_raw(file_name):
+    with open(os.path.join(os.path.dirname(almaden.__file__), file_name)) as raw_file:
+        return json.load(raw_file)
+
+
+class SharedBackendObjectsBench:
+    """Memory held by ``n_providers`` providers with access to the same backend.
+
+    ``interned=False`` gives every provider its own configuration, properties
+    and pulse defaults, as done before the backend intern table.
+    """
+
+    params = [[1, 20], [False, True]]
+    param_names = ['n_providers', 'interned']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, n_providers, interned):
+        raw_config = _load_raw('conf_almaden.json')
+        raw_properties = _load_raw('props_almaden.json')
+        raw_defaults = _load_raw('defs_almaden.json')
+
+        auth_client = mock.MagicMock()
+        auth_client.current_service_urls.return_value = {'http': 'https://localhost/api'}
+        auth_client.user_hubs.return_value = [
+            {'hub': 'hub{}'.format(i), 'group': 'group', 'project': 'project'}
+            for i in range(n_providers)]
+        auth_client.current_access_token.return_value = 'token'
+
+        account_client = 'qiskit.providers.ibmq.api.clients.account.AccountClient.'
+        self.patchers = [
+            mock.patch('qiskit.providers.ibmq.ibmqfactory.AuthClient',
+                       return_value=auth_client),
+            mock.patch(account_client + 'list_backends',
+                       side_effect=lambda **_: [copy.deepcopy(raw_config)]),
+            mock.patch(account_client + 'backend_properties',
+                       side_effect=lambda *_, **__: copy.deepcopy(raw_properties)),
+            mock.patch(account_client + 'backend_pulse_defaults',
+                       side_effect=lambda *_: copy.deepcopy(raw_defaults))]
+        if not interned:
+            self.patchers.append(mock.patch.object(BACKEND_INTERN_TABLE, 'intern',
+                                                   side_effect=lambda _, build: build()))
+        for patcher in self.patchers:
+            patcher.start()
+        self.credentials = Credentials('token', 'https://localhost/api')
+        self.n_qubits = raw_config['n_qubits']
+
+    def teardown(self, *_):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def track_bytes_per_provider(self, n_providers, _):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            factory = IBMQFactory()
+            factory._initialize_providers(self.credentials)
+            for provider in factory.providers():
+                for backend in provider.backends(n_qubits=self.n_qubits):
+                    backend.configuration()
+                    backend.properties()
+                    backend.defaults()
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return allocated / n_providers
+
+    track_bytes_per_provider.unit = 'bytes'
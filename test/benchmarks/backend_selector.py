@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for the throughput-aware backend selector."""
+
+import tempfile
+from datetime import datetime, timezone
+from unittest import mock
+
+from qiskit.providers.jobstatus import JobStatus
+
+from qiskit.providers.ibmq import ThroughputSelector
+from qiskit.providers.ibmq.job.queueinfo import QueueInfo
+
+
+def _utc_str(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class ThroughputSelectorBench:
+    """Observe jobs on ``n_backends`` backends and predict their completion time."""
+
+    params = [[5, 50]]
+    param_names = ['n_backends']
+    number = 1
+
+    def setup(self, n_backends):
+        self.directory = tempfile.TemporaryDirectory()
+        self.selector = ThroughputSelector(self.directory.name)
+        self.jobs = []
+        for index in range(4 * n_backends):
+            job = mock.MagicMock()
+            job.job_id.return_value = str(index)
+            job.backend.return_value.name.return_value = 'backend_{}'.format(index % n_backends)
+            job._qobj = mock.MagicMock(experiments=[None], config=mock.MagicMock(shots=1024))
+            job._status = JobStatus.QUEUED
+            job._queue_info = QueueInfo(position=1 + index % 7, job_id=str(index))
+            job._time_per_step = {'RUNNING': _utc_str(2e9 + index),
+                                  'COMPLETED': _utc_str(2e9 + index + 30)}
+            self.jobs.append(job)
+        self.names = ['backend_{}'.format(index) for index in range(n_backends)]
+
+    def teardown(self, _):
+        self.directory.cleanup()
+
+    def time_observe(self, _):
+        for job in self.jobs:
+            self.selector.observe(job)
+            job._status = JobStatus.DONE
+            self.selector.observe(job)
+
+    def time_predict(self, _):
+        for name in self.names:
+            self.selector.predict(name, 10, 4096)
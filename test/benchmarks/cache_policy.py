@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for reading backend properties with a cache policy."""
+
+import time
+from unittest import mock
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq import CachePolicy
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+
+LATENCY = 0.05
+"""Simulated duration of a properties query, in seconds."""
+
+
+class PropertiesReadBench:
+    """Read the properties of a backend 100 times, over 10 seconds of TTL.
+
+    ``refresh`` passes ``refresh=True`` on every read, as done by services
+    that cannot serve stale calibrations without a time to live.
+    """
+
+    params = [['refresh', 'ttl', 'refresh_ahead']]
+    param_names = ['policy']
+    number = 1
+
+    def setup(self, policy):
+        properties = FakeAlmaden().properties()
+        self.query_count = 0
+        credentials = Credentials('token', 'https://localhost/api')
+        self.backend = IBMQBackend(FakeAlmaden().configuration(), None,
+                                   credentials, mock.MagicMock())
+        self.backend._properties_cache._fetch = lambda: self._fetch_properties(properties)
+        if policy == 'ttl':
+            self.backend.set_cache_policy(CachePolicy(ttl=0.1))
+        elif policy == 'refresh_ahead':
+            self.backend.set_cache_policy(CachePolicy(ttl=0.1, refresh_ahead=0.05))
+        self.refresh = policy == 'refresh'
+
+    def _fetch_properties(self, properties):
+        time.sleep(LATENCY)
+        self.query_count += 1
+        return properties
+
+    def time_read(self, _):
+        for _ in range(100):
+            self.backend.properties(refresh=self.refresh)
+            time.sleep(0.01)
+
+    def track_queries(self, _):
+        self.time_read(_)
+        return self.query_count
+
+    track_queries.unit = 'queries'
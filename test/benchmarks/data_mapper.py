@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for mapping job listing responses."""
+
+import copy
+
+from qiskit.providers.ibmq.api.rest.utils.data_mapper import (map_job_response,
+                                                               dict_to_identifier)
+
+
+def raw_job_records(n_jobs):
+    """Return ``n_jobs`` job records as returned by the job listing endpoint."""
+    records = []
+    for idx in range(n_jobs):
+        records.append({
+            'id': '5d5b3a3f2e4b4c0019a4{:04x}'.format(idx),
+            'kind': 'q-object-external-storage',
+            'name': 'job_{}'.format(idx),
+            'creationDate': '2020-08-19T23:28:31.561Z',
+            'status': 'COMPLETED',
+            'backend': {'name': 'ibmq_qasm_simulator'},
+            'hubInfo': {'hub': {'name': 'ibm-q'}, 'group': {'name': 'open'},
+                        'project': {'name': 'main'}},
+            'timePerStep': {'CREATING': '2020-08-19T23:28:31.561Z',
+                            'COMPLETED': '2020-08-19T23:29:31.561Z'},
+            'infoQueue': {'status': 'PENDING_IN_QUEUE', 'position': idx,
+                          'hubPriority': 0.5, 'groupPriority': 0.5,
+                          'projectPriority': 0.5},
+            'tags': ['tag_a', 'tag_b'],
+            'shareLevel': 'none',
+            'runMode': 'fairshare',
+            'allowObjectStorage': True,
+            'endDate': '2020-08-19T23:29:31.561Z',
+            'deleted': False
+        })
+    return records
+
+
+class JobResponseMappingBench:
+    """Map a full job listing of ``n_jobs`` records."""
+
+    params = [1000, 10000]
+    param_names = ['n_jobs']
+    number = 1
+    timeout = 120
+
+    def setup(self, n_jobs):
+        self.records = raw_job_records(n_jobs)
+
+    def time_map_job_response(self, _):
+        for record in copy.copy(self.records):
+            map_job_response(dict(record))
+
+    def time_dict_to_identifier(self, _):
+        for record in copy.copy(self.records):
+            record = dict(record)
+            record.pop('infoQueue')
+            dict_to_identifier(record, {'id': 'job_id', 'backend': '_backend_info'})
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init,invalid-name
+
+"""Benchmarks for retrieving job fields from a local stand-in server."""
+
+import json
+import threading
+from urllib.parse import urlparse, parse_qs
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.credentials import Credentials
+
+N_JOBS = 200
+"""Number of jobs retrieved by each benchmark."""
+
+STEPS = ['CREATING', 'CREATED', 'VALIDATING', 'VALIDATED', 'QUEUED', 'RUNNING', 'COMPLETED']
+
+
+def _job_document(index):
+    """Return a job as stored by the server, with all its fields."""
+    date = '2020-08-19T23:{:02d}:{:02d}.561Z'.format(59 - index // 60 % 60, 59 - index % 60)
+    return {
+        'id': 'job_{:06d}'.format(index),
+        'kind': 'q-object-external-storage',
+        'creationDate': date,
+        'status': 'COMPLETED',
+        'backend': {'name': 'ibmq_qasm_simulator', 'id': '5ae875670f020500393162ad'},
+        'name': 'job {}'.format(index),
+        'tags': ['experiment', 'run_{}'.format(index % 10)],
+        'shareLevel': 'none',
+        'runMode': 'fairshare',
+        'timePerStep': {step: date for step in STEPS},
+        'endDate': date,
+        'hubInfo': {'hub': {'name': 'ibm-q'}, 'group': {'name': 'open'},
+                    'project': {'name': 'main'}},
+        'clientInfo': {'name': 'qiskit-terra,qiskit-ibmq-provider', 'version': '0.16.0,0.11.0'},
+        'summaryData': {'size': {'input': 12754, 'output': 5311}, 'success': True,
+                        'resultTime': 1.23, 'qobjConfig': {'shots': 1024, 'memory': False}},
+        'userId': '5c8a0bc59e5bfd0053ae7c3e',
+        'cost': 0,
+        'deleted': False,
+        'allowObjectStorage': True,
+        'liveDataEnabled': False
+    }
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """Stand-in server handling each request in its own thread."""
+
+    daemon_threads = True
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answer job listing requests, honoring the loopback ``fields`` clause."""
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def do_GET(self):
+        if '/Jobs/status' not in self.path:
+            # No backends are available, so jobs use retired backends.
+            self._respond([])
+            return
+
+        query = json.loads(parse_qs(urlparse(self.path).query)['filter'][0])
+        where = query.get('where', {})
+        excluded = set(where.get('id', {}).get('nin', []))
+        before = where.get('creationDate', {}).get('lte')
+        jobs = [job for job in self.server.jobs
+                if job['id'] not in excluded and (before is None or job['creationDate'] <= before)]
+        jobs = jobs[query.get('skip', 0):query.get('skip', 0) + min(query['limit'], 20)]
+        fields = query.get('fields')
+        if fields:
+            jobs = [{key: value for key, value in job.items() if fields.get(key)}
+                    for job in jobs]
+
+        self.server.page_sizes.append(self._respond(jobs))
+
+
+class JobFieldsBench:
+    """List ``N_JOBS`` jobs, retrieving all their fields or a preset."""
+
+    params = [['all', 'summary', 'status_only']]
+    param_names = ['fields']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, _):
+        self.server = StandInServer(('127.0.0.1', 0), StandInHandler)
+        self.server.jobs = [_job_document(index) for index in range(N_JOBS)]
+        self.server.page_sizes = []
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        url = 'http://{}:{}'.format(*self.server.server_address)
+        credentials = Credentials('token', url, hub='hub', group='group', project='project')
+        self.provider = AccountProvider(credentials, 'token')
+
+    def teardown(self, _):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _list_jobs(self, fields):
+        return self.provider.backends.jobs(limit=N_JOBS,
+                                           fields=None if fields == 'all' else fields)
+
+    def time_list_jobs(self, fields):
+        self._list_jobs(fields)
+
+    def track_bytes_per_page(self, fields):
+        self.server.page_sizes = []
+        self._list_jobs(fields)
+        return sum(self.server.page_sizes) / len(self.server.page_sizes)
+
+    track_bytes_per_page.unit = 'bytes'
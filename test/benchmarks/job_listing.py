@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for listing jobs with a stubbed API."""
+
+import os
+import json
+import tracemalloc
+from unittest import mock
+
+from qiskit.test.mock.backends import almaden
+
+from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.api.clients import AccountClient
+from qiskit.providers.ibmq.credentials import Credentials
+
+N_BACKENDS = 20
+"""Number of backends available to the provider."""
+N_RETIRED_BACKENDS = 200
+"""Number of backends the jobs ran on that are no longer available."""
+PAGE_SIZE = 20
+"""Number of jobs returned per request, as done by the server."""
+
+
+def _raw_configs():
+    with open(os.path.join(os.path.dirname(almaden.__file__), 'conf_almaden.json')) as conf:
+        raw_config = json.load(conf)
+    configs = []
+    for i in range(N_BACKENDS):
+        configs.append(dict(raw_config, backend_name='backend_{}'.format(i)))
+    return configs
+
+
+def _job_data(index):
+    backend_index = index % (N_BACKENDS + N_RETIRED_BACKENDS)
+    backend_name = 'backend_{}'.format(backend_index) if backend_index < N_BACKENDS \
+        else 'retired_{}'.format(backend_index)
+    return {'job_id': 'job_{}'.format(index),
+            'creation_date': '2020-08-19T23:28:31.561Z',
+            'status': 'COMPLETED',
+            'kind': 'q-object-external-storage',
+            '_backend_info': {'name': backend_name}}
+
+
+class JobListingBench:
+    """List ``n_jobs`` jobs ran on live and retired backends."""
+
+    params = [[1000, 10000]]
+    param_names = ['n_jobs']
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup(self, n_jobs):
+        jobs = [_job_data(index) for index in range(n_jobs)]
+        self.pages = [jobs[start:start + PAGE_SIZE] for start in range(0, n_jobs, PAGE_SIZE)]
+        self.patchers = [
+            mock.patch.object(AccountClient, 'list_backends', return_value=_raw_configs()),
+            mock.patch.object(AccountClient, 'list_jobs_statuses',
+                              side_effect=self._list_jobs_statuses)]
+        for patcher in self.patchers:
+            patcher.start()
+        self.provider = AccountProvider(Credentials('token', 'https://localhost/api'), 'token')
+        self.provider.backends()
+        self.page_iter = iter(self.pages)
+
+    def teardown(self, _):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def _list_jobs_statuses(self, *_args, **_kwargs):
+        return [dict(job_data) for job_data in next(self.page_iter, [])]
+
+    def time_list_jobs(self, _):
+        self.page_iter = iter(self.pages)
+        self.provider.backends.jobs(limit=None)
+
+    def track_distinct_backends(self, _):
+        self.page_iter = iter(self.pages)
+        jobs = self.provider.backends.jobs(limit=None)
+        return len({id(job.backend()) for job in jobs})
+
+    track_distinct_backends.unit = 'backends'
+
+
+class JobIterationBench:
+    """Iterate over ``n_jobs`` jobs as they are retrieved."""
+
+    params = [[1000, 10000]]
+    param_names = ['n_jobs']
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    setup = JobListingBench.setup
+    teardown = JobListingBench.teardown
+    _list_jobs_statuses = JobListingBench._list_jobs_statuses
+
+    def time_first_job(self, _):
+        self.page_iter = iter(self.pages)
+        jobs_iter = self.provider.backends.iter_jobs()
+        next(jobs_iter)
+        jobs_iter.close()
+
+    def time_iter_jobs(self, _):
+        self.page_iter = iter(self.pages)
+        for _job in self.provider.backends.iter_jobs():
+            pass
+
+    def track_peak_bytes(self, _):
+        self.page_iter = iter(self.pages)
+        tracemalloc.start()
+        try:
+            for _job in self.provider.backends.iter_jobs():
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    track_peak_bytes.unit = 'bytes'
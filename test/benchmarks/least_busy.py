@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for selecting the least busy backend."""
+
+import time
+import threading
+from unittest import mock
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq import least_busy
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+
+LATENCY = 0.1
+"""Simulated duration of a status or reservations query, in seconds."""
+
+
+class LeastBusyBench:
+    """Select the least busy of ``n_backends`` backends.
+
+    ``max_workers=1`` queries the backends one at a time, as done before
+    the concurrent status snapshot.
+    """
+
+    params = [[30], [1, 8, 30]]
+    param_names = ['n_backends', 'max_workers']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, n_backends, _):
+        self.query_count = 0
+        self.lock = threading.Lock()
+        api_client = mock.MagicMock()
+        api_client.backend_status.side_effect = self._backend_status
+        api_client.backend_reservations.side_effect = self._backend_reservations
+        credentials = Credentials('token', 'https://localhost/api')
+        configuration = FakeAlmaden().configuration()
+        self.backends = [IBMQBackend(configuration, None, credentials, api_client)
+                         for _ in range(n_backends)]
+
+    def _query(self):
+        time.sleep(LATENCY)
+        with self.lock:
+            self.query_count += 1
+            return self.query_count
+
+    def _backend_status(self, backend_name):
+        return {'backend_name': backend_name, 'backend_version': '1.0.0',
+                'operational': True, 'pending_jobs': self._query() % 7,
+                'status_msg': 'active'}
+
+    def _backend_reservations(self, *_):
+        self._query()
+        return []
+
+    def time_least_busy(self, _, max_workers):
+        least_busy(self.backends, max_workers=max_workers)
+
+    def track_queries(self, _, max_workers):
+        least_busy(self.backends, max_workers=max_workers)
+        return self.query_count
+
+    track_queries.unit = 'queries'
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for looking up backend properties."""
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq.utils.properties import properties_arrays
+
+
+class PropertiesLookupBench:
+    """Look up the T1, readout error and CX errors of every qubit of a device.
+
+    ``nested`` walks ``properties.to_dict()``, as done by the error map
+    before the columnar view.
+    """
+
+    params = [['nested', 'arrays']]
+    param_names = ['method']
+
+    def setup(self, _):
+        self.properties = FakeAlmaden().properties()
+        self.coupling_map = FakeAlmaden().configuration().coupling_map
+        properties_arrays(self.properties)
+
+    def _nested(self):
+        props = self.properties.to_dict()
+        t1s = [next(item['value'] for item in qubit if item['name'] == 'T1')
+               for qubit in props['qubits']]
+        read_err = [next(item['value'] for item in qubit if item['name'] == 'readout_error')
+                    for qubit in props['qubits']]
+        cx_errors = [next(gate['parameters'][0]['value'] for gate in props['gates']
+                          if gate['qubits'] == edge) for edge in self.coupling_map]
+        return sum(t1s) / len(t1s), sum(read_err) / len(read_err), max(cx_errors)
+
+    def _arrays(self):
+        arrays = properties_arrays(self.properties)
+        cx_errors = [arrays.gate_property('cx', edge) for edge in self.coupling_map]
+        return (arrays.qubit_property('T1').mean(),
+                arrays.qubit_property('readout_error').mean(), max(cx_errors))
+
+    def time_lookup(self, method):
+        if method == 'nested':
+            self._nested()
+        else:
+            self._arrays()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for retrieving historical backend properties."""
+
+import os
+import copy
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from qiskit.test.mock.backends import almaden
+
+from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.propertieshistory import PROPERTIES_HISTORY
+
+LATENCY = 0.05
+"""Simulated duration of a properties query, in seconds."""
+
+END = datetime(2020, 7, 1, tzinfo=timezone.utc)
+
+
+def _load_raw(file_name):
+    with open(os.path.join(os.path.dirname(almaden.__file__), file_name)) as raw_file:
+        return json.load(raw_file)
+
+
+class PropertiesHistoryBench:
+    """Properties of a backend every 6 hours over ``days`` days of daily calibrations.
+
+    ``serial`` calls ``properties(datetime=...)`` for each date, as done
+    before the properties history. ``history`` retrieves the period with
+    ``properties_history()`` first.
+    """
+
+    params = [[30, 180], ['serial', 'history']]
+    param_names = ['days', 'method']
+    number = 1
+    repeat = 1
+    timeout = 600
+
+    def setup(self, days, _):
+        raw_config = _load_raw('conf_almaden.json')
+        raw_properties = _load_raw('props_almaden.json')
+        self.query_count = 0
+
+        def _backend_properties(_backend_name, datetime=None):
+            # pylint: disable=redefined-outer-name
+            self.query_count += 1
+            time.sleep(LATENCY)
+            # Calibrations every day at 1am.
+            date = (datetime or END) - timedelta(hours=1, microseconds=1)
+            properties = copy.deepcopy(raw_properties)
+            properties['last_update_date'] = date.replace(
+                hour=1, minute=0, second=0, microsecond=0).strftime('%Y-%m-%dT%H:%M:%SZ')
+            return properties
+
+        account_client = 'qiskit.providers.ibmq.api.clients.account.AccountClient.'
+        self.patchers = [
+            mock.patch(account_client + 'list_backends', return_value=[raw_config]),
+            mock.patch(account_client + 'backend_properties', side_effect=_backend_properties)]
+        for patcher in self.patchers:
+            patcher.start()
+        provider = AccountProvider(Credentials('token', 'https://localhost/api'), 'token')
+        self.backend = provider.get_backend(raw_config['backend_name'])
+        self.start = END - timedelta(days=days)
+        self.dates = [self.start + timedelta(hours=6 * step) for step in range(4 * days)]
+        PROPERTIES_HISTORY.clear()
+
+    def teardown(self, *_):
+        for patcher in self.patchers:
+            patcher.stop()
+        PROPERTIES_HISTORY.clear()
+
+    def _get_all(self, method):
+        if method == 'history':
+            self.backend.properties_history(self.start, END)
+        for date in self.dates:
+            self.backend.properties(datetime=date)
+
+    def time_properties(self, _, method):
+        self._get_all(method)
+
+    def track_queries(self, _, method):
+        self._get_all(method)
+        return self.query_count
+
+    track_queries.unit = 'queries'
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for initializing the providers of an account."""
+
+import time
+from unittest import mock
+
+from qiskit.test.mock import FakeQasmSimulator, FakeAlmaden
+
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqfactory import IBMQFactory
+
+LATENCY = 0.2
+"""Seconds the stubbed API takes to list the backends of a hub."""
+
+
+class ProviderInitBench:
+    """Initialize an account with ``n_hubs`` providers, ``max_workers`` at a time."""
+
+    params = [[1, 10, 30], [1, 8]]
+    param_names = ['n_hubs', 'max_workers']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, n_hubs, max_workers):
+        configs = [FakeQasmSimulator().configuration().to_dict(),
+                   FakeAlmaden().configuration().to_dict()]
+
+        def _list_backends(*_args, **_kwargs):
+            time.sleep(LATENCY)
+            return [dict(config) for config in configs]
+
+        auth_client = mock.MagicMock()
+        auth_client.current_service_urls.return_value = {'http': 'https://localhost/api'}
+        auth_client.user_hubs.return_value = [
+            {'hub': 'hub{}'.format(i), 'group': 'group', 'project': 'project'}
+            for i in range(n_hubs)]
+        auth_client.current_access_token.return_value = 'token'
+
+        self.patchers = [
+            mock.patch('qiskit.providers.ibmq.ibmqfactory.AuthClient',
+                       return_value=auth_client),
+            mock.patch('qiskit.providers.ibmq.accountprovider.AccountClient.list_backends',
+                       side_effect=_list_backends)]
+        for patcher in self.patchers:
+            patcher.start()
+        self.credentials = Credentials('token', 'https://localhost/api')
+        self.max_workers = max_workers
+
+    def teardown(self, *_):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def time_initialize_providers(self, *_):
+        factory = IBMQFactory()
+        factory._init_max_workers = self.max_workers
+        factory._initialize_providers(self.credentials)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init
+
+"""Benchmarks for encoding large Qobjs in worker processes."""
+
+import time
+from concurrent import futures
+
+from qiskit import assemble
+from qiskit.circuit.random import random_circuit
+
+from qiskit.providers.ibmq.utils.qobj_encoder import ProcessQobjEncoder, encode_qobj
+
+
+class ProcessEncodingBench:
+    """Encode ``n_qobjs`` large Qobjs from as many submitting threads.
+
+    ``n_processes=0`` encodes in the submitting threads, as done by default.
+    """
+
+    params = [[0, 1, 2, 4, 8]]
+    param_names = ['n_processes']
+    number = 1
+    repeat = 3
+    timeout = 600
+    n_qobjs = 16
+
+    def setup(self, n_processes):
+        circuits = [random_circuit(10, 200, measure=True, seed=seed) for seed in range(20)]
+        self.qobjs = [assemble(circuits, shots=shots) for shots in range(1, self.n_qobjs + 1)]
+        self.encoder = ProcessQobjEncoder(n_processes, min_size=0) if n_processes else None
+        self.threads = futures.ThreadPoolExecutor(max_workers=self.n_qobjs)
+        if self.encoder:
+            # Start the worker processes.
+            list(self.threads.map(self.encoder.encode, self.qobjs[:n_processes]))
+
+    def teardown(self, _):
+        self.threads.shutdown()
+        if self.encoder:
+            self.encoder.shutdown()
+
+    def _encode_all(self):
+        encode = self.encoder.encode if self.encoder else encode_qobj
+        list(self.threads.map(encode, self.qobjs))
+
+    def time_encode(self, _):
+        self._encode_all()
+
+    def track_qobjs_per_second(self, _):
+        start = time.monotonic()
+        self._encode_all()
+        return self.n_qobjs / (time.monotonic() - start)
+
+    track_qobjs_per_second.unit = 'qobjs/s'
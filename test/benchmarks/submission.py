@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,attribute-defined-outside-init,invalid-name
+
+"""Benchmarks for submitting jobs to a local stand-in server."""
+
+import json
+import time
+import uuid
+import threading
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from qiskit import assemble, transpile
+from qiskit.test.mock import FakeQasmSimulator
+from qiskit.test.reference_circuits import ReferenceCircuits
+
+from qiskit.providers.ibmq.api.clients import AccountClient
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+
+LATENCY = 0.05
+"""Seconds the stand-in server takes to answer each request."""
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    """Stand-in server handling each request in its own thread."""
+
+    daemon_threads = True
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answer the job submission requests with a fixed latency."""
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, data=None):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(LATENCY)
+        body = json.dumps(data).encode('utf-8') if data is not None else b''
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path.endswith('/Jobs'):
+            job_id = uuid.uuid4().hex
+            upload_url = 'http://{}:{}/upload/{}'.format(*self.server.server_address, job_id)
+            self._respond({'id': job_id, 'objectStorageInfo': {'uploadUrl': upload_url}})
+        else:
+            job_id = self.path.split('/')[-2]
+            self._respond({'job': {'id': job_id,
+                                   'kind': 'q-object-external-storage',
+                                   'status': 'QUEUED',
+                                   'creationDate': '2020-08-19T23:28:31.561Z',
+                                   'backend': {'name': 'qasm_simulator'}}})
+
+    def do_PUT(self):
+        self._respond()
+
+
+class PipelinedSubmissionBench:
+    """Submit ``n_jobs`` Qobjs one by one (``max_workers=0``) or pipelined."""
+
+    params = [[0, 1, 4, 8]]
+    param_names = ['max_workers']
+    number = 1
+    repeat = 3
+    timeout = 300
+    n_jobs = 40
+
+    def setup(self, _):
+        self.server = StandInServer(('127.0.0.1', 0), StandInHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        url = 'http://{}:{}'.format(*self.server.server_address)
+        credentials = Credentials('token', url, hub='hub', group='group', project='project')
+        self.backend = IBMQBackend(FakeQasmSimulator().configuration(), None,
+                                   credentials, AccountClient('token', credentials))
+        circuit = transpile(ReferenceCircuits.bell(), backend=FakeQasmSimulator())
+        self.qobjs = [assemble([circuit] * 50, shots=shots)
+                      for shots in range(100, 100 + self.n_jobs)]
+
+    def teardown(self, _):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _submit(self, max_workers):
+        if max_workers:
+            _, errors = self.backend.run_many(self.qobjs, max_workers=max_workers)
+            assert not errors, errors
+        else:
+            for qobj in self.qobjs:
+                self.backend.run(qobj)
+
+    def time_submit(self, max_workers):
+        self._submit(max_workers)
+
+    def track_jobs_per_second(self, max_workers):
+        start = time.monotonic()
+        self._submit(max_workers)
+        return self.n_jobs / (time.monotonic() - start)
+
+    track_jobs_per_second.unit = 'jobs/s'
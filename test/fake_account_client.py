@@ -17,6 +17,7 @@
 # TODO This can probably be merged with the one in test_ibmq_job_states
 import time
 import copy
+import json
 from random import randrange
 import uuid
 from concurrent.futures import ThreadPoolExecutor, wait
@@ -24,6 +25,7 @@ from concurrent.futures import ThreadPoolExecutor, wait
 from qiskit.test.mock.backends.poughkeepsie.fake_poughkeepsie import FakePoughkeepsie
 from qiskit.providers.ibmq.apiconstants import ApiJobStatus, API_JOB_FINAL_STATES, ApiJobShareLevel
 from qiskit.providers.ibmq.api.exceptions import RequestsApiError, UserTimeoutExceededError
+from qiskit.providers.ibmq.api.rest.utils.data_mapper import job_api_field_name
 
 
 VALID_RESULT_RESPONSE = {
@@ -190,6 +192,7 @@ class BaseFakeAccountClient:
     def __init__(self, job_limit=-1, job_class=BaseFakeJob):
         """Initialize a fake account client."""
         self._jobs = {}
+        self._pending_jobs = {}
         self._results_retrieved = set()
         self._job_limit = job_limit
         self._executor = ThreadPoolExecutor()
@@ -197,12 +200,17 @@ class BaseFakeAccountClient:
         if isinstance(self._job_class, list):
             self._job_class.reverse()
 
-    def list_jobs_statuses(self, limit, skip, descending=True, extra_filter=None):
+    def list_jobs_statuses(self, limit, skip, descending=True, extra_filter=None, fields=None):
         """Return a list of statuses of jobs."""
         # pylint: disable=unused-argument
         job_data = []
         for job in list(self._jobs.values())[skip:skip+limit]:
-            job_data.append(job.data())
+            data = job.data()
+            if fields:
+                data = {key: value for key, value in data.items()
+                        if job_api_field_name(
+                            'backend' if key == '_backend_info' else key) in fields}
+            job_data.append(data)
         if not descending:
             job_data.reverse()
         return job_data
@@ -210,12 +218,43 @@ class BaseFakeAccountClient:
     def job_submit(self, backend_name, qobj_dict, job_name, job_share_level,
                    job_tags, *_args, **_kwargs):
         """Submit a Qobj to a device."""
+        self._check_job_limit()
+        if isinstance(qobj_dict, (str, bytes)):
+            qobj_dict = json.loads(qobj_dict)
+
+        return self._new_job(uuid.uuid4().hex, backend_name, qobj_dict, job_name,
+                             job_share_level, job_tags)
+
+    def job_create(self, backend_name, job_name=None, job_share_level=None, job_tags=None):
+        """Create a job without its Qobj."""
+        self._check_job_limit()
+
+        new_job_id = uuid.uuid4().hex
+        self._pending_jobs[new_job_id] = {
+            'backend_name': backend_name, 'qobj_dict': None, 'job_name': job_name,
+            'job_share_level': job_share_level, 'job_tags': job_tags}
+        return new_job_id, 'https://fake.upload.url/{}'.format(new_job_id)
+
+    def job_upload_qobj(self, job_id, _upload_url, qobj_data):
+        """Upload the Qobj of a created job."""
+        if isinstance(qobj_data, (str, bytes)):
+            qobj_data = json.loads(qobj_data)
+        self._pending_jobs[job_id]['qobj_dict'] = qobj_data
+
+    def job_callback_upload(self, job_id):
+        """Start a created job."""
+        return self._new_job(job_id, **self._pending_jobs.pop(job_id))
+
+    def _check_job_limit(self):
+        """Raise an error if the job limit is reached."""
         if self._job_limit != -1 and self._unfinished_jobs() >= self._job_limit:
             raise RequestsApiError(
                 '400 Client Error: Bad Request for url: <url>.  Reached '
                 'maximum number of concurrent jobs, Error code: 3458.')
 
-        new_job_id = uuid.uuid4().hex
+    def _new_job(self, new_job_id, backend_name, qobj_dict, job_name, job_share_level,
+                 job_tags):
+        """Create a new fake job and return its data."""
         job_share_level = job_share_level or ApiJobShareLevel.NONE
         job_class = self._job_class.pop() \
             if isinstance(self._job_class, list) else self._job_class
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the throughput-aware backend selector."""
+
+import time
+import tempfile
+import threading
+from datetime import datetime, timezone
+from unittest import mock
+
+from qiskit.providers.jobstatus import JobStatus
+from qiskit.providers.models import BackendStatus
+
+from qiskit.providers.ibmq import ThroughputSelector
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+from qiskit.providers.ibmq.job import IBMQJob
+from qiskit.providers.ibmq.job.exceptions import IBMQJobTimeoutError
+from qiskit.providers.ibmq.job.queueinfo import QueueInfo
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+def _utc_str(timestamp):
+    """Return a time step as returned by the server."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _backend(name, pending_jobs):
+    """Return a mock backend."""
+    backend = mock.create_autospec(IBMQBackend, instance=True)
+    backend.name.return_value = name
+    backend.status.return_value = BackendStatus(
+        backend_name=name, backend_version='1.0.0', operational=True,
+        pending_jobs=pending_jobs, status_msg='active')
+    backend.reservations.return_value = []
+    return backend
+
+
+def _job(job_id, backend_name, shots=1000, experiments=1):
+    """Return a mock job."""
+    job = mock.create_autospec(IBMQJob, instance=True)
+    job.job_id.return_value = job_id
+    job.backend.return_value.name.return_value = backend_name
+    job._qobj = mock.MagicMock(experiments=[None] * experiments,
+                               config=mock.MagicMock(shots=shots))
+    job._time_per_step = None
+    job._queue_info = None
+    return job
+
+
+class TestThroughputSelector(IBMQTestCase):
+    """Tests for ThroughputSelector."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.selector = ThroughputSelector(self.directory.name, smoothing=0.5)
+
+    def _run_job(self, job_id, backend_name, position, queued_for, ran_for, shots=1000):
+        """Observe a job queued at a position, then finished."""
+        job = _job(job_id, backend_name, shots=shots)
+        job._status = JobStatus.QUEUED
+        job._queue_info = QueueInfo(position=position, job_id=job_id)
+        with mock.patch('time.time', return_value=1000.0):
+            self.selector.observe(job)
+
+        job._status = JobStatus.DONE
+        job._time_per_step = {'RUNNING': _utc_str(1000 + queued_for),
+                              'COMPLETED': _utc_str(1000 + queued_for + ran_for)}
+        self.selector.observe(job)
+        return job
+
+    def test_observe(self):
+        """Test the estimates are updated from observed jobs."""
+        job = self._run_job('1', 'slow', position=10, queued_for=100, ran_for=20)
+        self.assertEqual(self.selector.estimates('slow'),
+                         {'drain_rate': 0.1, 'drain_samples': 1,
+                          'seconds_per_shot': 0.02, 'runtime_samples': 1})
+
+        self.selector.observe(job)
+        self.assertEqual(self.selector.estimates('slow')['drain_samples'], 1)
+
+        self._run_job('2', 'slow', position=10, queued_for=50, ran_for=40)
+        estimates = self.selector.estimates('slow')
+        self.assertAlmostEqual(estimates['drain_rate'], 0.15)
+        self.assertAlmostEqual(estimates['seconds_per_shot'], 0.03)
+        self.assertEqual(estimates['runtime_samples'], 2)
+
+    def test_persistence(self):
+        """Test the model is kept on disk."""
+        queued = _job('2', 'slow')
+        queued._status = JobStatus.QUEUED
+        queued._queue_info = QueueInfo(position=4, job_id='2')
+        with mock.patch('time.time', return_value=1000.0):
+            self.selector.observe(queued)
+        self.assertIsNone(ThroughputSelector(self.directory.name)._cache.get('model'))
+        self._run_job('1', 'slow', position=10, queued_for=100, ran_for=20)
+
+        selector = ThroughputSelector(self.directory.name)
+        self.assertEqual(selector.estimates('slow'), self.selector.estimates('slow'))
+
+        queued._status = JobStatus.DONE
+        queued._time_per_step = {'RUNNING': _utc_str(1040), 'COMPLETED': _utc_str(1060)}
+        selector.observe(queued)
+        self.assertEqual(selector.estimates('slow')['drain_samples'], 2)
+
+    def test_select(self):
+        """Test the backend with the lowest predicted completion time is selected."""
+        self._run_job('1', 'slow', position=10, queued_for=100, ran_for=20)
+        self._run_job('2', 'fast', position=10, queued_for=10, ran_for=20)
+        backends = [_backend('slow', 2), _backend('fast', 5)]
+
+        self.assertEqual(self.selector.select(backends, workload=1000).name(), 'fast')
+        self.assertEqual(self.selector.predict('slow', 2, 1000), 40)
+        self.assertEqual(self.selector.predict('unknown', 0, 1000), 20)
+
+    def test_select_without_estimates(self):
+        """Test the least busy backend is selected without estimates."""
+        backends = [_backend('first', 2), _backend('second', 1)]
+        self.assertIsNone(self.selector.predict('first', 2, 1000))
+        self.assertEqual(self.selector.select(backends).name(), 'second')
+
+    def test_track(self):
+        """Test tracking a job updates the estimates from the status callbacks."""
+        job = _job('1', 'slow')
+        job._status = JobStatus.INITIALIZING
+
+        def _wait_for_final_state(timeout=None, callback=None):
+            """Report the job queued, then finished."""
+            callback('1', JobStatus.QUEUED, job, queue_info=QueueInfo(position=10, job_id='1'))
+            callback('1', JobStatus.DONE, job, queue_info=None)
+            job._status = JobStatus.DONE
+            job._time_per_step = {'RUNNING': _utc_str(1100), 'COMPLETED': _utc_str(1120)}
+
+        job.wait_for_final_state.side_effect = _wait_for_final_state
+        with mock.patch('time.time', return_value=1000.0):
+            self.selector.track(job).result(timeout=10)
+
+        self.assertEqual(self.selector.estimates('slow'),
+                         {'drain_rate': 0.1, 'drain_samples': 1,
+                          'seconds_per_shot': 0.02, 'runtime_samples': 1})
+
+    def test_track_timeout(self):
+        """Test a job is no longer tracked after the timeout."""
+        job = _job('1', 'slow')
+        job.wait_for_final_state.side_effect = IBMQJobTimeoutError('Timeout')
+        self.selector.track(job, timeout=1).result(timeout=10)
+
+        self.assertLessEqual(job.wait_for_final_state.call_args[1]['timeout'], 1)
+        self.assertEqual(self.selector.estimates('slow')['drain_samples'], 0)
+
+    def test_track_queued(self):
+        """Test jobs waiting to be tracked are bounded by the timeout given to track()."""
+        selector = ThroughputSelector(self.directory.name, max_tracked=1)
+        finished = threading.Event()
+        first, second = _job('1', 'slow'), _job('2', 'slow')
+        first.wait_for_final_state.side_effect = lambda **_: finished.wait(10)
+        scheduled = [selector.track(first), selector.track(second, timeout=0.05)]
+
+        time.sleep(0.1)
+        self.assertEqual(len(selector._trackers), 1)
+        finished.set()
+        for future in scheduled:
+            future.result(timeout=10)
+        second.wait_for_final_state.assert_not_called()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend status snapshot."""
+
+import time
+from concurrent import futures
+from unittest import mock
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+from qiskit.providers.ibmq.ibmqbackendservice import IBMQBackendService
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestBackendStatusSnapshot(IBMQTestCase):
+    """Tests for the backend status snapshot, without a server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.api_client = mock.MagicMock()
+        self.api_client.backend_status.side_effect = self._backend_status
+        credentials = Credentials('token', 'https://localhost/api')
+        self.provider = mock.MagicMock()
+        self.provider._backends = {}
+        for name in ('first', 'second'):
+            configuration = FakeAlmaden().configuration()
+            configuration.backend_name = name
+            self.provider._backends[name] = IBMQBackend(
+                configuration, self.provider, credentials, self.api_client)
+        self.provider.backends = IBMQBackendService(self.provider)
+        self.addCleanup(self.provider.backends.stop_status_refresh)
+
+    @staticmethod
+    def _backend_status(backend_name):
+        """Return a backend status as returned by the server."""
+        time.sleep(0.01)
+        return {'backend_name': backend_name, 'backend_version': '1.0.0',
+                'operational': True, 'pending_jobs': 0, 'status_msg': 'active'}
+
+    def test_status_max_age(self):
+        """Test concurrent calls with a maximum age make a single query."""
+        backend = self.provider._backends['first']
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(lambda _: backend.status(max_age=60), range(8)))
+        self.assertEqual(self.api_client.backend_status.call_count, 1)
+        self.assertTrue(all(status is statuses[0] for status in statuses))
+
+        backend.status()
+        self.assertEqual(self.api_client.backend_status.call_count, 2)
+
+    def test_status_refresh(self):
+        """Test statuses are read from the snapshot while it refreshes."""
+        service = self.provider.backends
+        service.start_status_refresh(interval=60)
+        self.assertEqual(self.api_client.backend_status.call_count, 2)
+
+        for backend in self.provider._backends.values():
+            self.assertEqual(backend.status().backend_name, backend.name())
+        self.assertEqual(set(service.statuses()), {'first', 'second'})
+        self.assertEqual(self.api_client.backend_status.call_count, 2)
+
+        service.stop_status_refresh()
+        self.provider._backends['first'].status()
+        self.assertEqual(self.api_client.backend_status.call_count, 3)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the operations applied to many jobs."""
+
+import time
+from unittest import mock
+
+from qiskit.providers.ibmq.api.exceptions import ApiError
+from qiskit.providers.ibmq.exceptions import IBMQBackendError, IBMQBackendValueError
+from qiskit.providers.ibmq.ibmqbackendservice import IBMQBackendService
+from qiskit.providers.ibmq.job import IBMQJob
+from qiskit.providers.ibmq.job.bulk import RateLimiter, run_job_operation
+from qiskit.providers.ibmq.job.exceptions import IBMQJobApiError
+from qiskit.providers.ibmq.managed.managedjob import ManagedJob
+from qiskit.providers.ibmq.managed.managedjobset import ManagedJobSet
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+def _job(job_id, tags=None):
+    """Return a mock job."""
+    job = mock.create_autospec(IBMQJob, instance=True)
+    job.job_id.return_value = job_id
+    job.update_tags.return_value = tags or []
+    return job
+
+
+class TestBulkJobOperations(IBMQTestCase):
+    """Tests for the bulk job operations, without a server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.provider = mock.MagicMock()
+        self.service = IBMQBackendService(self.provider)
+
+    def test_rate_limiter(self):
+        """Test operations are spaced out to the maximum rate."""
+        rate_limiter = RateLimiter(max_rate=50)
+        start = time.monotonic()
+        for _ in range(6):
+            rate_limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+    def test_run_job_operation(self):
+        """Test the outcome of each operation is reported."""
+        def _operation(job_id):
+            if job_id == 'bad':
+                raise IBMQJobApiError('bad job')
+            return job_id.upper()
+
+        report = run_job_operation(['a', 'bad', 'b'], str, _operation, max_workers=2)
+        self.assertEqual(report.succeeded(), ['a', 'b'])
+        self.assertEqual(report.failed(), ['bad'])
+        self.assertEqual(report.results, {'a': 'A', 'b': 'B'})
+        self.assertIsInstance(report.errors['bad'], IBMQJobApiError)
+
+    def test_cancel_jobs(self):
+        """Test cancelling jobs given by job or by ID."""
+        def _job_cancel(job_id):
+            if job_id == 'error':
+                raise ApiError('server error')
+            return {'cancelled': job_id != 'done'}
+
+        self.provider._api_client.job_cancel.side_effect = _job_cancel
+        job = _job('job')
+        job.cancel.return_value = True
+
+        report = self.service.cancel_jobs([job, 'queued', 'done', 'error'], max_rate=None)
+        self.assertEqual(report.results, {'job': True, 'queued': True, 'done': False})
+        self.assertEqual(report.failed(), ['error'])
+        self.assertIsInstance(report.errors['error'], IBMQJobApiError)
+        job.cancel.assert_called_once_with()
+
+    def test_update_jobs_tags(self):
+        """Test updating the tags of jobs given by job or by ID."""
+        job, retrieved = _job('job', ['new']), _job('retrieved', ['new'])
+        missing_error = IBMQBackendError('not found')
+        with mock.patch.object(self.service, 'retrieve_jobs', autospec=True,
+                               return_value=([retrieved, None],
+                                             {'missing': missing_error})) as retrieve_jobs:
+            report = self.service.update_jobs_tags([job, 'retrieved', 'missing'],
+                                                   additional_tags=['new'], max_rate=None)
+
+        retrieve_jobs.assert_called_once_with(['retrieved', 'missing'], max_workers=8)
+        self.assertEqual(report.results, {'job': ['new'], 'retrieved': ['new']})
+        self.assertEqual(report.errors, {'missing': missing_error})
+        for updated in (job, retrieved):
+            updated.update_tags.assert_called_once_with(
+                replacement_tags=None, additional_tags=['new'], removal_tags=None)
+
+        with self.assertRaises(IBMQBackendValueError):
+            self.service.update_jobs_tags([job])
+
+    def test_job_set_cancel_rate(self):
+        """Test a job set forwards its concurrency settings when cancelling."""
+        job_set = ManagedJobSet()
+        job_set._managed_jobs = [ManagedJob(0, 1, _job('job'))]
+        job_set._backend = mock.MagicMock()
+        cancel_jobs = job_set._backend.provider().backends.cancel_jobs
+
+        job_set.cancel(max_workers=2, max_rate=None)
+        cancel_jobs.assert_called_once_with(
+            [job_set._managed_jobs[0].job], max_workers=2, max_rate=None)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the cache policy of the backend properties and pulse defaults."""
+
+import time
+from threading import Event
+from unittest import mock
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq import CachePolicy, IBMQBackendValueError
+from qiskit.providers.ibmq.cachepolicy import RefreshingCache
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+def _age(cache, seconds):
+    """Make the cached value of a cache older."""
+    retrieved_at, value = cache._entry
+    cache._entry = (retrieved_at - seconds, value)
+
+
+class TestRefreshingCache(IBMQTestCase):
+    """Tests for RefreshingCache."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.values = iter(range(100))
+        self.fetch = mock.Mock(side_effect=lambda: next(self.values))
+        self.cache = RefreshingCache(self.fetch)
+
+    def test_default_policy(self):
+        """Test values are cached until explicitly refreshed."""
+        policy = CachePolicy()
+        self.assertEqual(self.cache.get(policy), 0)
+        _age(self.cache, 10 ** 6)
+        self.assertEqual(self.cache.get(policy), 0)
+        self.assertEqual(self.cache.get(policy, refresh=True), 1)
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_ttl(self):
+        """Test expired values are retrieved again."""
+        policy = CachePolicy(ttl=60)
+        self.assertEqual(self.cache.get(policy), 0)
+        _age(self.cache, 30)
+        self.assertEqual(self.cache.get(policy), 0)
+        _age(self.cache, 30)
+        self.assertEqual(self.cache.get(policy), 1)
+
+    def test_refresh_ahead(self):
+        """Test values are refreshed in the background before they expire."""
+        policy = CachePolicy(ttl=60, refresh_ahead=10)
+        self.assertEqual(self.cache.get(policy), 0)
+        _age(self.cache, 55)
+
+        release = Event()
+        self.fetch.side_effect = lambda: release.wait(5) and next(self.values)
+        for _ in range(3):
+            self.assertEqual(self.cache.get(policy), 0)
+        release.set()
+        deadline = time.monotonic() + 5
+        while self.cache.get(policy) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.cache.get(policy), 1)
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_invalid_policy(self):
+        """Test invalid policies are rejected."""
+        for kwargs in ({'ttl': 0}, {'refresh_ahead': 10}, {'ttl': 10, 'refresh_ahead': 10}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(IBMQBackendValueError):
+                    CachePolicy(**kwargs)
+
+
+class TestBackendCachePolicy(IBMQTestCase):
+    """Tests for the cache policy of a backend."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        credentials = Credentials('token', 'https://localhost/api')
+        self.backend = IBMQBackend(FakeAlmaden().configuration(), None,
+                                   credentials, mock.MagicMock())
+
+    def test_refresh_on_update(self):
+        """Test the pulse defaults are refreshed when the properties are updated."""
+        properties = [mock.Mock(last_update_date=date) for date in ('1', '1', '2', '3')]
+        self.backend._properties_cache = RefreshingCache(
+            mock.Mock(side_effect=properties), self.backend._properties_refreshed)
+        self.backend._defaults_cache = mock.create_autospec(RefreshingCache, instance=True)
+        self.backend._defaults_cache.is_cached.return_value = True
+
+        self.backend.properties()
+        self.backend.properties(refresh=True)
+        self.backend._defaults_cache.refresh_in_background.assert_not_called()
+        self.backend.properties(refresh=True)
+        self.backend._defaults_cache.refresh_in_background.assert_called_once_with()
+
+        self.backend.set_cache_policy(CachePolicy(refresh_on_update=False))
+        self.backend.properties(refresh=True)
+        self.backend._defaults_cache.refresh_in_background.assert_called_once_with()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the response data mappers."""
+
+import copy
+
+from qiskit.providers.ibmq.api.rest.utils.data_mapper import (
+    map_job_response, map_job_status_response, dict_to_identifier, ResponseMapper)
+
+from ..ibmqtestcase import IBMQTestCase
+
+RAW_JOB_RESPONSE = {
+    'id': '5d5b3a3f2e4b4c0019a4e0b6',
+    'kind': 'q-object-external-storage',
+    'creationDate': '2019-08-19T23:28:31.561Z',
+    'status': 'QUEUED',
+    'backend': {'name': 'ibmq_qasm_simulator', 'id': '5ae875670f020500393162b3'},
+    'hubInfo': {'hub': {'name': 'ibm-q'}},
+    'timePerStep': {'CREATING': '2019-08-19T23:28:31.561Z'},
+    'infoQueue': {'status': 'PENDING_IN_QUEUE', 'position': 2,
+                  'estimatedStartTime': '2019-08-19T23:30:00.000Z',
+                  'hubPriority': 0.5},
+    'shots': 1024,
+    'runMode': 'fairshare',
+    'class': 'standard',
+    'allowObjectStorage': True
+}
+
+
+class TestDataMapper(IBMQTestCase):
+    """Tests for the response data mappers."""
+
+    def test_map_job_response(self):
+        """Test mapping a job response."""
+        mapped = map_job_response(copy.deepcopy(RAW_JOB_RESPONSE))
+        self.assertEqual(mapped['job_id'], RAW_JOB_RESPONSE['id'])
+        self.assertEqual(mapped['creation_date'], RAW_JOB_RESPONSE['creationDate'])
+        self.assertEqual(mapped['_backend_info'], RAW_JOB_RESPONSE['backend'])
+        self.assertEqual(mapped['_api_shots'], 1024)
+        self.assertEqual(mapped['run_mode'], 'fairshare')
+        self.assertEqual(mapped['hub_info'], RAW_JOB_RESPONSE['hubInfo'])
+        self.assertEqual(mapped['allow_object_storage'], True)
+        self.assertEqual(mapped['class_'], 'standard')
+        self.assertEqual(mapped['info_queue'],
+                         {'status': 'PENDING_IN_QUEUE', 'position': 2,
+                          'estimated_start_time': '2019-08-19T23:30:00.000Z',
+                          'hub_priority': 0.5})
+        self.assertNotIn('infoQueue', mapped)
+
+    def test_same_as_generic_mapping(self):
+        """Test the compiled mapper matches the generic key conversion."""
+        raw_status = {'status': 'RUNNING', 'someNewField': 1, 'infoQueue': {}}
+        expected = copy.deepcopy(raw_status)
+        del expected['infoQueue']
+        dict_to_identifier(expected)
+        self.assertEqual(map_job_status_response(raw_status), expected)
+
+    def test_mapper_reused(self):
+        """Test a mapper can be reused on many objects."""
+        mapper = ResponseMapper({'id': 'job_id'})
+        for idx in range(3):
+            self.assertEqual(mapper.map({'id': idx, 'creationDate': 'now'}),
+                             {'job_id': idx, 'creation_date': 'now'})
+
+    def test_mapper_table_bounded(self):
+        """Test a mapper stops memoising new field names past its limit."""
+        mapper = ResponseMapper({'id': 'job_id'})
+        mapper._max_table_size = 3
+        data = {'id': 0}
+        data.update(('field{}'.format(idx), idx) for idx in range(5))
+        expected = {'job_id': 0}
+        expected.update(('field{}'.format(idx), idx) for idx in range(5))
+        self.assertEqual(mapper.map(data), expected)
+        self.assertEqual(len(mapper._table), 3)
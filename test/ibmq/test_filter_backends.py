@@ -15,10 +15,13 @@
 """Backends Filtering Test."""
 
 from datetime import datetime
+from unittest import mock
 from dateutil import tz
 
+from qiskit.providers.models import BackendStatus
 from qiskit.providers.ibmq import least_busy
 from qiskit.providers.ibmq import IBMQError
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
 
 from ..ibmqtestcase import IBMQTestCase
 from ..decorators import requires_provider, requires_device
@@ -107,3 +110,38 @@ class TestBackendFilters(IBMQTestCase):
                 backs.append(back)
                 break
         self.assertTrue(least_busy(backs, window))
+
+
+class TestLeastBusy(IBMQTestCase):
+    """Tests for least_busy, without a server."""
+
+    def _backend(self, name, pending_jobs, operational=True, reservations=None):
+        """Return a mock backend."""
+        backend = mock.create_autospec(IBMQBackend, instance=True)
+        backend.name.return_value = name
+        backend.status.return_value = BackendStatus(
+            backend_name=name, backend_version='1.0.0', operational=operational,
+            pending_jobs=pending_jobs, status_msg='active')
+        backend.reservations.return_value = reservations or []
+        return backend
+
+    def test_least_busy_single_query(self):
+        """Test the status and reservations of each backend are retrieved once."""
+        backends = [self._backend('busy', 10),
+                    self._backend('down', 0, operational=False),
+                    self._backend('reserved', 1, reservations=[mock.MagicMock()]),
+                    self._backend('free', 2)]
+        self.assertEqual(least_busy(backends, max_workers=4).name(), 'free')
+
+        for backend in backends:
+            backend.status.assert_called_once_with(max_age=None)
+        backends[1].reservations.assert_not_called()
+        for backend in (backends[0], backends[2], backends[3]):
+            self.assertEqual(backend.reservations.call_count, 1)
+
+    def test_least_busy_max_status_age(self):
+        """Test the maximum status age is passed to the backends."""
+        backends = [self._backend('first', 5), self._backend('second', 3)]
+        self.assertEqual(least_busy(backends, None, max_status_age=30).name(), 'second')
+        for backend in backends:
+            backend.status.assert_called_once_with(max_age=30)
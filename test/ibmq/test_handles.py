@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the provider, backend and job handles."""
+
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from qiskit.providers.ibmq import accountprovider
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.handles import (ProviderHandle, BackendHandle, JobHandle,
+                                           _ProviderRegistry)
+from qiskit.providers.ibmq.job.artifactcache import (job_disk_cache, enable_job_disk_cache,
+                                                     disable_job_disk_cache)
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestHandles(IBMQTestCase):
+    """Tests for the provider, backend and job handles, without a server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.provider = mock.MagicMock()
+        self.provider.credentials = Credentials('token', 'https://localhost/api',
+                                                hub='hub', group='group', project='project')
+        self.provider._api_client._session.access_token = 'access_token'
+        registry_patcher = mock.patch('qiskit.providers.ibmq.handles._PROVIDER_REGISTRY',
+                                      _ProviderRegistry())
+        registry_patcher.start()
+        self.addCleanup(registry_patcher.stop)
+
+    def _in_new_process(self, handle):
+        """Return a copy of a handle, as unpickled in a new process."""
+        registry_patcher = mock.patch('qiskit.providers.ibmq.handles._PROVIDER_REGISTRY',
+                                      _ProviderRegistry())
+        registry_patcher.start()
+        self.addCleanup(registry_patcher.stop)
+        return pickle.loads(pickle.dumps(handle))
+
+    def test_provider_handle(self):
+        """Test a provider handle reconnects once per process."""
+        handle = ProviderHandle.from_provider(self.provider)
+        self.assertIs(handle.provider(), self.provider)
+
+        unpickled = self._in_new_process(handle)
+        self.assertEqual(unpickled.credentials, self.provider.credentials)
+        with mock.patch.object(accountprovider, 'AccountProvider') as provider_cls:
+            self.assertIs(unpickled.provider(), ProviderHandle(
+                unpickled.credentials, 'access_token').provider())
+        provider_cls.assert_called_once_with(unpickled.credentials, 'access_token')
+        self.assertFalse(provider_cls.return_value._revalidate_configs)
+
+    def test_provider_handle_caches(self):
+        """Test the disk caches enabled for a handle are enabled when reconnecting."""
+        with TemporaryDirectory() as directory:
+            enable_job_disk_cache(directory)
+            self.addCleanup(disable_job_disk_cache)
+            handle = ProviderHandle.from_provider(self.provider)
+            disable_job_disk_cache()
+
+            unpickled = self._in_new_process(handle)
+            with mock.patch.object(accountprovider, 'AccountProvider'):
+                unpickled.provider()
+            self.assertEqual(job_disk_cache().directory, directory)
+
+    def test_backend_handle(self):
+        """Test a backend handle carries the configuration of its backend."""
+        backend = mock.MagicMock()
+        backend.name.return_value = 'ibmq_qasm_simulator'
+        backend.provider.return_value = self.provider
+        raw_config = {'backend_name': 'ibmq_qasm_simulator'}
+        self.provider._raw_configs = {'ibmq_qasm_simulator': raw_config}
+        handle = BackendHandle.from_backend(backend)
+        self.assertEqual(handle.raw_config, raw_config)
+
+        unpickled = self._in_new_process(handle)
+        with mock.patch.object(accountprovider, 'AccountProvider') as provider_cls:
+            provider = provider_cls.return_value
+            self.assertIs(unpickled.backend(), provider._add_remote_backend.return_value)
+        provider._add_remote_backend.assert_called_once_with(raw_config)
+        provider.backends._get_job_backend.assert_not_called()
+
+    def test_job_handle(self):
+        """Test a job handle does not pickle the job."""
+        backend_handle = BackendHandle(ProviderHandle(self.provider.credentials, 'access_token'),
+                                       'ibmq_qasm_simulator')
+        handle = JobHandle(backend_handle, 'job_id', '2020-01-01T00:00:00+00:00', 'COMPLETED')
+        handle._job = mock.MagicMock()
+
+        unpickled = pickle.loads(pickle.dumps(handle))
+        self.assertIsNone(unpickled._job)
+        self.assertEqual(unpickled.job_id, 'job_id')
+        self.assertEqual(unpickled.backend_handle.backend_name, 'ibmq_qasm_simulator')
@@ -15,7 +15,8 @@
 """Tests for the IBMQFactory class."""
 
 import os
-from unittest import skipIf
+import time
+from unittest import skipIf, mock
 from configparser import ConfigParser
 
 from qiskit.providers.ibmq.accountprovider import AccountProvider
@@ -24,6 +25,7 @@ from qiskit.providers.ibmq.exceptions import (IBMQAccountError, IBMQAccountValue
                                               IBMQAccountCredentialsInvalidUrl,
                                               IBMQAccountCredentialsInvalidToken)
 from qiskit.providers.ibmq.ibmqfactory import IBMQFactory, QX_AUTH_URL
+from qiskit.providers.ibmq.credentials import Credentials
 from qiskit.providers.ibmq.credentials.hubgroupproject import HubGroupProject
 
 from ..ibmqtestcase import IBMQTestCase
@@ -319,3 +321,35 @@ class TestIBMQFactoryProvider(IBMQTestCase):
         """Test providers() without a filter."""
         providers = self.factory.providers()
         self.assertIn(self.provider, providers)
+
+
+class TestIBMQFactoryInitializeProviders(IBMQTestCase):
+    """Tests for IBMQFactory provider initialization."""
+
+    def test_initialize_providers_concurrently(self):
+        """Test providers are initialized concurrently, in the order of the hubs."""
+        hubs = [{'hub': 'hub{}'.format(i), 'group': 'group', 'project': 'project'}
+                for i in range(10)]
+
+        def _new_provider(credentials, _):
+            if credentials.hub == 'hub3':
+                raise ValueError('Unable to discover backends.')
+            # Finish the last hubs first.
+            time.sleep(0.01 * (10 - int(credentials.hub[3:])))
+            provider = mock.MagicMock()
+            provider.credentials = credentials
+            return provider
+
+        factory = IBMQFactory()
+        auth_client = mock.MagicMock()
+        auth_client.current_service_urls.return_value = {'http': API_URL}
+        auth_client.user_hubs.return_value = hubs
+        with mock.patch('qiskit.providers.ibmq.ibmqfactory.AuthClient',
+                        return_value=auth_client), \
+                mock.patch('qiskit.providers.ibmq.ibmqfactory.AccountProvider',
+                           side_effect=_new_provider), \
+                self.assertLogs('qiskit.providers.ibmq.ibmqfactory', 'WARNING'):
+            factory._initialize_providers(Credentials('token', AUTH_URL))
+
+        self.assertEqual([provider.credentials.hub for provider in factory.providers()],
+                         ['hub{}'.format(i) for i in range(10) if i != 3])
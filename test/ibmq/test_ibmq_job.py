@@ -16,6 +16,7 @@
 
 import time
 import copy
+import uuid
 from datetime import datetime, timedelta
 from unittest import SkipTest, mock
 from threading import Thread, Event
@@ -158,6 +159,30 @@ class TestIBMQJob(JobTestCase):
         job_ids = [job.job_id() for job in job_array]
         self.assertEqual(sorted(job_ids), sorted(list(set(job_ids))))
 
+    def test_run_many_simulator(self):
+        """Test pipelined submission of multiple jobs to a simulator."""
+        qobjs = [bell_in_qobj(backend=self.sim_backend, shots=shots)
+                 for shots in (100, 200, 300, 400, 500)]
+        job_tags = [uuid.uuid4().hex]
+        jobs, errors = self.sim_backend.run_many(qobjs, job_tags=job_tags, max_workers=2)
+
+        self.assertFalse(errors)
+        self.assertEqual(len(jobs), len(qobjs))
+        for job, qobj in zip(jobs, qobjs):
+            self.assertEqual(job.tags(), job_tags)
+            self.assertEqual(job.qobj().config.shots, qobj.config.shots)
+            self.assertTrue(job.result().success)
+            self.assertIn('submit.upload', job.client_timings())
+
+    def test_schedule_simulator(self):
+        """Test scheduling jobs on a simulator."""
+        qobj = bell_in_qobj(backend=self.sim_backend)
+        scheduled = [self.sim_backend.schedule(qobj, priority=priority)
+                     for priority in range(3)]
+        jobs = [future.result(timeout=300) for future in scheduled]
+        for job in jobs:
+            self.assertTrue(job.result().success)
+
     @slow_test
     @requires_device
     def test_run_multiple_device(self, backend):
@@ -221,6 +246,34 @@ class TestIBMQJob(JobTestCase):
         for job in job_list:
             self.assertTrue(isinstance(job.job_id(), str))
 
+    def test_retrieve_jobs_lightweight(self):
+        """Test retrieving lightweight job records."""
+        records = self.provider.backends.jobs(
+            backend_name=self.sim_backend.name(), limit=5, lightweight=True)
+        jobs = self.provider.backends.jobs(backend_name=self.sim_backend.name(), limit=5)
+        self.assertEqual([rec.job_id() for rec in records], [job.job_id() for job in jobs])
+        for record, job in zip(records, jobs):
+            with self.subTest(job_id=job.job_id()):
+                self.assertEqual(record.backend_name(), self.sim_backend.name())
+                self.assertEqual(record.creation_date(), job.creation_date())
+                self.assertEqual(record.tags(), job.tags())
+                upgraded = record.to_job()
+                self.assertEqual(upgraded.job_id(), job.job_id())
+                self.assertEqual(upgraded.status(), job.status())
+
+    def test_iter_jobs(self):
+        """Test iterating over jobs retrieved page by page."""
+        job_ids = [job.job_id() for job in self.provider.backends.jobs(
+            backend_name=self.sim_backend.name(), limit=25)]
+        iter_ids = [job.job_id() for job in self.provider.backends.iter_jobs(
+            backend_name=self.sim_backend.name(), limit=25)]
+        self.assertEqual(iter_ids, job_ids)
+
+        with mock.patch.object(self.provider.backends, '_job_page_size', 2):
+            jobs_iter = self.provider.backends.iter_jobs(backend_name=self.sim_backend.name())
+            self.assertEqual([next(jobs_iter).job_id() for _ in range(3)], job_ids[:3])
+            jobs_iter.close()
+
     def test_retrieve_job(self):
         """Test retrieving a single job."""
         retrieved_job = self.provider.backends.retrieve_job(self.sim_job.job_id())
@@ -268,6 +321,19 @@ class TestIBMQJob(JobTestCase):
         for job in [job_1, job_2]:
             cancel_job(job)
 
+    def test_retrieve_multiple_jobs(self):
+        """Test retrieving multiple jobs at once."""
+        job_ids = [job.job_id() for job in self.sim_backend.jobs(limit=5)]
+        job_ids.insert(2, 'BAD_JOB_ID')
+        jobs, errors = self.provider.backends.retrieve_jobs(job_ids, chunk_size=2)
+        self.assertEqual(len(jobs), len(job_ids))
+        self.assertIsNone(jobs[2])
+        self.assertEqual(list(errors), ['BAD_JOB_ID'])
+        self.assertIsInstance(errors['BAD_JOB_ID'], IBMQBackendError)
+        for job_id, job in zip(job_ids, jobs):
+            if job:
+                self.assertEqual(job.job_id(), job_id)
+
     def test_retrieve_job_error(self):
         """Test retrieving an invalid job."""
         self.assertRaises(IBMQBackendError,
@@ -545,6 +611,7 @@ class TestIBMQJob(JobTestCase):
             new_job2 = self.provider.backends.jobs(db_filter={'id': self.sim_job.job_id()})[0]
             self.assertTrue(isinstance(new_job2.backend(), IBMQRetiredBackend))
             self.assertNotEqual(new_job2.backend().name(), 'unknown')
+            self.assertIs(new_job2.backend(), new_job.backend())
         finally:
             self.provider._backends = saved_backends
 
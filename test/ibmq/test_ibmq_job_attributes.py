@@ -19,13 +19,16 @@ from unittest import mock
 from datetime import datetime, timedelta
 import re
 import uuid
+import tempfile
 
 from dateutil import tz
 
 from qiskit.test import slow_test
+from qiskit.tools.events.pubsub import Subscriber
 from qiskit.test.reference_circuits import ReferenceCircuits
 from qiskit.providers.jobstatus import JobStatus, JOB_FINAL_STATES
 from qiskit.providers.ibmq.job.exceptions import IBMQJobFailureError
+from qiskit.providers.ibmq.job import enable_job_disk_cache, disable_job_disk_cache
 from qiskit.providers.ibmq.api.clients.account import AccountClient
 from qiskit.providers.ibmq.exceptions import IBMQBackendValueError, IBMQBackendApiProtocolError
 from qiskit.compiler import assemble, transpile
@@ -241,6 +244,28 @@ class TestIBMQJobAttributes(JobTestCase):
         rjob = self.provider.backends.jobs(db_filter={'id': job.job_id()})[0]
         self.assertTrue(rjob.time_per_step())
 
+    def test_client_timings(self):
+        """Test the timing breakdown of the job processing phases."""
+        published = []
+        subscriber = Subscriber()
+        subscriber.subscribe('ibmq.job.timings',
+                             lambda job, timings: published.append(timings))
+        try:
+            job = self.sim_backend.run(self.qobj, validate_qobj=True)
+            job.result()
+        finally:
+            subscriber.clear()
+
+        timings = job.client_timings()
+        for phase in ['submit.to_dict', 'submit.json_encode', 'submit.create_remote_job',
+                      'submit.upload', 'submit.callback_upload', 'result.download',
+                      'result.from_dict']:
+            self.assertIn(phase, timings)
+        self.assertTrue(any(name.startswith('server.') for name in timings))
+        self.assertTrue(all(duration >= 0 for duration in timings.values()))
+        self.assertEqual(len(published), 2)
+        self.assertEqual(published[-1], timings)
+
     def test_new_job_attributes(self):
         """Test job with new attributes."""
         def _mocked__api_job_submit(*args, **kwargs):
@@ -466,3 +491,98 @@ class TestIBMQJobAttributes(JobTestCase):
         """Test job client version information."""
         self.assertIsNotNone(self.sim_job.result().client_version)
         self.assertIsNotNone(self.sim_job.client_version)
+
+    def test_cached_artifacts(self):
+        """Test the job Qobj and properties are downloaded only once."""
+        saved_api = self.sim_backend._api_client
+        try:
+            self.sim_backend._api_client = BaseFakeAccountClient()
+            job = self.sim_backend.run(self.qobj)
+            job._qobj = None
+            with mock.patch.object(BaseFakeAccountClient, 'job_properties',
+                                   wraps=self.sim_backend._api_client.job_properties) \
+                    as properties_mock, \
+                    mock.patch.object(BaseFakeAccountClient, 'job_download_qobj',
+                                      wraps=self.sim_backend._api_client.job_download_qobj) \
+                    as qobj_mock:
+                properties = job.properties()
+                self.assertIs(job.properties(), properties)
+                self.assertEqual(job.qobj().to_dict(), job.qobj().to_dict())
+                self.assertEqual(properties_mock.call_count, 1)
+                self.assertEqual(qobj_mock.call_count, 1)
+
+                # A second job with the same calibration shares the snapshot.
+                job2 = self.sim_backend.run(self.qobj)
+                self.assertIs(job2.properties(), properties)
+        finally:
+            self.sim_backend._api_client = saved_api
+
+    def test_job_fields_projection(self):
+        """Test jobs retrieved with some fields fetch the others when needed."""
+        saved_api = self.sim_backend._api_client, self.provider._api_client
+        try:
+            client = BaseFakeAccountClient()
+            self.sim_backend._api_client = self.provider._api_client = client
+            self.sim_backend.run(self.qobj, job_name='projected', job_tags=['projected'])
+
+            job = self.provider.backends.jobs(limit=1, fields='status_only')[0]
+            self.assertIsNone(job._name)
+            with mock.patch.object(client, 'job_get', wraps=client.job_get) as job_get_mock:
+                self.assertEqual(job.name(), 'projected')
+                self.assertEqual(job.tags(), ['projected'])
+                job_get_mock.assert_called_once()
+
+            job = next(self.provider.backends.iter_jobs(limit=1, fields=['name']))
+            self.assertEqual(job._name, 'projected')
+            self.assertFalse(job._tags)
+
+            with self.assertRaises(IBMQBackendValueError):
+                self.provider.backends.jobs(fields='unknown')
+        finally:
+            self.sim_backend._api_client, self.provider._api_client = saved_api
+
+    def test_partial_job_special_names(self):
+        """Test probing special names on a partial job does not refresh it."""
+        saved_api = self.sim_backend._api_client, self.provider._api_client
+        try:
+            client = BaseFakeAccountClient()
+            self.sim_backend._api_client = self.provider._api_client = client
+            self.sim_backend.run(self.qobj)
+
+            job = self.provider.backends.jobs(limit=1, fields='status_only')[0]
+            with mock.patch.object(client, 'job_get', wraps=client.job_get) as job_get_mock:
+                self.assertFalse(hasattr(job, '__array__'))
+                self.assertFalse(hasattr(job, '__length_hint__'))
+                job_get_mock.assert_not_called()
+                _ = job.client_version
+                job_get_mock.assert_called_once()
+                self.assertFalse(job._partial_data)
+        finally:
+            self.sim_backend._api_client, self.provider._api_client = saved_api
+
+    def test_job_disk_cache(self):
+        """Test the job Qobj and properties are reused from the disk cache."""
+        saved_api = self.sim_backend._api_client
+        try:
+            self.sim_backend._api_client = BaseFakeAccountClient()
+            job = self.sim_backend.run(self.qobj)
+            with tempfile.TemporaryDirectory() as cache_dir:
+                enable_job_disk_cache(cache_dir)
+                try:
+                    properties = job.properties()
+                    job._properties = None
+                    job._qobj = None
+                    qobj = job.qobj()
+                    job._qobj = None
+                    with mock.patch.object(BaseFakeAccountClient, 'job_properties') \
+                            as properties_mock, \
+                            mock.patch.object(BaseFakeAccountClient, 'job_download_qobj') \
+                            as qobj_mock:
+                        self.assertEqual(job.properties().to_dict(), properties.to_dict())
+                        self.assertEqual(job.qobj().to_dict(), qobj.to_dict())
+                        properties_mock.assert_not_called()
+                        qobj_mock.assert_not_called()
+                finally:
+                    disable_job_disk_cache()
+        finally:
+            self.sim_backend._api_client = saved_api
@@ -25,7 +25,7 @@ from qiskit.result import Result
 
 from qiskit.providers.ibmq.managed.ibmqjobmanager import IBMQJobManager
 from qiskit.providers.ibmq.managed.managedresults import ManagedResults
-from qiskit.providers.ibmq.managed import managedjob
+from qiskit.providers.ibmq import jobscheduler
 from qiskit.providers.ibmq.managed.exceptions import (
     IBMQJobManagerJobNotFound, IBMQManagedResultDataNotAvailable, IBMQJobManagerInvalidStateError)
 from qiskit.providers.jobstatus import JobStatus
@@ -71,6 +71,7 @@ class TestIBMQJobManager(IBMQTestCase):
         """Setup a backend instance with fake API client."""
         if not self._fake_api_backend:
             self._fake_api_backend = copy.copy(self.sim_backend)
+            self._fake_api_backend._job_scheduler = None
             self._fake_api_provider = copy.copy(self.provider)
             self._fake_api_provider._api_client = self._fake_api_backend._api_client \
                 = BaseFakeAccountClient()
@@ -277,20 +278,16 @@ class TestIBMQJobManager(IBMQTestCase):
 
         job_set = None
         try:
-            with self.assertLogs(managedjob.logger, 'WARNING'):
+            with self.assertLogs(jobscheduler.logger, 'WARNING'):
                 job_set = self._jm.run([self._qc]*(job_limit+2),
                                        backend=self.fake_api_backend, max_experiments_per_job=1)
                 time.sleep(1)
 
-            # There should be 5 done and 2 running futures.
-            running_futures = [mjob.future for mjob in job_set.managed_jobs()
-                               if mjob.future.running()]
-            max_wait = 6
-            while len(running_futures) > 2 and max_wait > 0:
-                running_futures = [f for f in running_futures if f.running()]
-                time.sleep(0.5)
-            self.assertEqual(len(running_futures), 2)
+            # There should be 5 submitted and 2 queued jobs.
+            self.assertEqual(sum(mjob.job is None for mjob in job_set.managed_jobs()), 2)
+            self.assertEqual(self.fake_api_backend._job_scheduler.pending_count(), 2)
 
+            # The queued jobs are submitted once the others are cancelled.
             for mjob in job_set.managed_jobs():
                 if mjob.job is not None:
                     mjob.cancel()
@@ -301,8 +298,6 @@ class TestIBMQJobManager(IBMQTestCase):
             for mjob in job_set.managed_jobs():
                 if mjob.job is not None:
                     mjob.cancel()
-                elif job_set._job_submit_lock.locked():
-                    job_set._job_submit_lock.release()
             wait([mjob.future for mjob in job_set.managed_jobs()], timeout=5)
 
     def test_job_limit_timeout(self):
@@ -326,8 +321,6 @@ class TestIBMQJobManager(IBMQTestCase):
             for mjob in job_set.managed_jobs():
                 if mjob.job is not None:
                     mjob.cancel()
-                elif job_set._job_submit_lock.locked():
-                    job_set._job_submit_lock.release()
             wait([mjob.future for mjob in job_set.managed_jobs()], timeout=5)
 
     def test_job_tags_replace(self):
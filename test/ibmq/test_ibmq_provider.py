@@ -14,11 +14,17 @@
 
 """Tests for the AccountProvider class."""
 
-from datetime import datetime
+import time
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
 
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 from qiskit.providers.ibmq.accountprovider import AccountProvider
+from qiskit.providers.ibmq.api.clients import AccountClient
+from qiskit.providers.ibmq.backendcache import (enable_backend_config_cache,
+                                                disable_backend_config_cache)
 from qiskit.providers.ibmq.ibmqbackend import IBMQSimulator, IBMQBackend
 from qiskit.qobj import QobjHeader
 from qiskit.test import providers, slow_test
@@ -160,9 +166,70 @@ class TestAccountProvider(IBMQTestCase, providers.ProviderTestCase):
                 else:
                     self.assertEqual(properties, None)
 
+    @requires_device
+    def test_remote_backend_properties_history(self, backend):
+        """Test the properties history matches the properties filtered by date."""
+        end = datetime.now() - timedelta(days=1)
+        history = backend.properties_history(end - timedelta(days=3), end)
+        self.assertTrue(history)
+        dates = [properties.last_update_date for properties in history]
+        self.assertEqual(dates, sorted(dates))
+
+        with mock.patch.object(backend._api_client, 'backend_properties') as mock_properties:
+            for hours in range(0, 72, 8):
+                self.assertIn(backend.properties(datetime=end - timedelta(hours=hours)),
+                              history)
+            mock_properties.assert_not_called()
+
     def test_provider_backends(self):
         """Test provider_backends have correct attributes."""
         provider_backends = {back for back in dir(self.provider.backends)
                              if isinstance(getattr(self.provider.backends, back), IBMQBackend)}
         backends = {back.name().lower() for back in self.provider._backends.values()}
         self.assertEqual(provider_backends, backends)
+
+    def test_lazy_backend_discovery(self):
+        """Test getting a backend by name only instantiates that backend."""
+        provider = self._new_provider()
+        with mock.patch.object(AccountProvider, '_backend_from_raw_config',
+                               autospec=True,
+                               side_effect=AccountProvider._backend_from_raw_config) \
+                as instantiate_mock:
+            backend = provider.get_backend(self.backend_name)
+        self.assertEqual(backend.name(), self.backend_name)
+        self.assertEqual(instantiate_mock.call_count, 1)
+        self.assertIs(provider.get_backend(self.backend_name), backend)
+        self.assertIs(provider._backends[self.backend_name], backend)
+
+    def test_backend_config_cache(self):
+        """Test backend configurations are read from the disk cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            enable_backend_config_cache(cache_dir)
+            try:
+                backend_names = [backend.name() for backend in self._new_provider().backends()]
+                with mock.patch.object(AccountClient, 'list_backends',
+                                       side_effect=lambda **_: time.sleep(1) or []) \
+                        as list_mock:
+                    provider = self._new_provider()
+                    self.assertEqual([backend.name() for backend in provider.backends()],
+                                     backend_names)
+                    # The cached configurations are revalidated in the background.
+                    time.sleep(2)
+                    list_mock.assert_called_once()
+                    self.assertFalse(provider.backends())
+            finally:
+                disable_backend_config_cache()
+
+    def test_shared_backend_objects(self):
+        """Test providers share the configuration and properties of a backend."""
+        backend1 = self._new_provider().get_backend(self.backend_name)
+        backend2 = self._new_provider().get_backend(self.backend_name)
+        self.assertIsNot(backend1, backend2)
+        self.assertIs(backend1.configuration(), backend2.configuration())
+        if backend1.properties() is not None:
+            self.assertIs(backend1.properties(), backend2.properties())
+
+    def _new_provider(self):
+        """Return a new provider with the same credentials."""
+        return AccountProvider(self.provider.credentials,
+                               self.provider._api_client._session.access_token)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the local job index."""
+
+import tempfile
+from unittest import mock
+
+from qiskit.providers.ibmq.ibmqbackendservice import IBMQBackendService
+from qiskit.providers.ibmq.job.jobindex import JobIndex, enable_job_index, disable_job_index
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+def _job_info(job_id, creation_date, backend='ibmqx2', status='COMPLETED',
+              tags=None, name=None):
+    """Return job data as returned by the server."""
+    job_info = {'job_id': job_id, 'kind': 'q-object', 'status': status,
+                'creation_date': creation_date, '_backend_info': {'name': backend}}
+    if tags:
+        job_info['tags'] = tags
+    if name:
+        job_info['name'] = name
+    return job_info
+
+
+class TestJobIndex(IBMQTestCase):
+    """Tests for JobIndex."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.index = JobIndex(':memory:')
+        self.addCleanup(self.index.close)
+        self.index.add([
+            _job_info('1', '2020-01-01T10:00:00.000Z', tags=['a'], name='bell'),
+            _job_info('2', '2020-01-02T10:00:00.000Z', backend='ibmq_vigo',
+                      status='RUNNING', tags=['a', 'b']),
+            _job_info('3', '2020-01-03T12:00:00+02:00', status='ERROR_RUNNING_JOB',
+                      tags=['b'], name='ghz')])
+
+    def _query_ids(self, api_filter, **kwargs):
+        """Return the IDs of the jobs matching a filter."""
+        return [job_info['job_id'] for job_info in self.index.query(api_filter, **kwargs)]
+
+    def test_query(self):
+        """Test filters produced by job queries are answered locally."""
+        self.assertEqual(self._query_ids({}), ['3', '2', '1'])
+        self.assertEqual(self._query_ids({}, descending=False, limit=2, skip=1), ['2', '3'])
+        self.assertEqual(self._query_ids({'backend.name': 'ibmqx2'}), ['3', '1'])
+        self.assertEqual(self._query_ids({'status': {'inq': ['RUNNING', 'COMPLETED']}}),
+                         ['2', '1'])
+        self.assertEqual(self._query_ids({'name': {'regexp': 'gh'}}), ['3'])
+        self.assertEqual(self._query_ids({'tags': {'inq': ['a']}}), ['2', '1'])
+        self.assertEqual(self._query_ids({'and': [{'tags': 'a'}, {'tags': 'b'}]}), ['2'])
+        self.assertEqual(self._query_ids(
+            {'creationDate': {'gte': '2020-01-02T00:00:00+00:00',
+                              'lte': '2020-01-03T11:00:00+00:00'}}), ['3', '2'])
+        self.assertEqual(self._query_ids({'id': {'nin': ['1', '2']}}), ['3'])
+
+    def test_unsupported_filter(self):
+        """Test filters on fields that are not indexed are not supported."""
+        self.assertTrue(self.index.supports({'or': [{'status': 'RUNNING'}, {'tags': 'a'}]}))
+        self.assertFalse(self.index.supports({'hubInfo.hub.name': 'ibm-q'}))
+        self.assertFalse(self.index.supports({'status': {'like': 'RUN'}}))
+
+    def test_watermark(self):
+        """Test the position of the most recent jobs and the unfinished jobs."""
+        self.assertEqual(self.index.watermark(), ('2020-01-03T12:00:00+02:00', ['3']))
+        self.assertEqual(self.index.unfinished_job_ids(), ['2'])
+
+        self.index.add([_job_info('2', '2020-01-02T10:00:00.000Z', tags=['c'])])
+        self.assertEqual(self.index.unfinished_job_ids(), [])
+        self.assertEqual(self._query_ids({'tags': 'b'}), ['3'])
+        self.assertEqual(len(self.index), 3)
+
+
+class TestJobIndexSync(IBMQTestCase):
+    """Tests for updating the job index from the server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        enable_job_index(tempfile.mkdtemp())
+        self.addCleanup(disable_job_index)
+        self.service = IBMQBackendService(mock.MagicMock())
+        self.server_jobs = [_job_info('1', '2020-01-01T10:00:00.000Z', status='RUNNING'),
+                            _job_info('2', '2020-01-02T10:00:00.000Z')]
+        self.filters = []
+
+    def _fake_job_pages(self, api_filter, *_args, **_kwargs):
+        """Return the server jobs matching the filters used to update the index."""
+        self.filters.append(api_filter)
+        job_ids = api_filter.get('id', {})
+        job_page = [job_info for job_info in self.server_jobs
+                    if job_info['job_id'] in job_ids.get('inq', [job_info['job_id']])
+                    and job_info['job_id'] not in job_ids.get('nin', [])
+                    and job_info['creation_date'] >= api_filter.get(
+                        'creationDate', {}).get('gte', '')]
+        return iter([job_page] if job_page else [])
+
+    def test_incremental_sync(self):
+        """Test only new and unfinished jobs are retrieved."""
+        with mock.patch.object(self.service, '_job_pages', side_effect=self._fake_job_pages):
+            self.assertEqual(self.service.sync_job_index(), 2)
+            self.assertEqual(self.filters, [{}])
+
+            self.server_jobs[0]['status'] = 'COMPLETED'
+            self.server_jobs.append(_job_info('3', '2020-01-02T10:00:00.000Z'))
+            self.filters.clear()
+            self.assertEqual(self.service.sync_job_index(), 3)
+            self.assertEqual(self.filters, [
+                {'id': {'inq': ['1']}},
+                {'creationDate': {'gte': '2020-01-02T10:00:00.000Z'}, 'id': {'nin': ['2']}}])
+
+            jobs_info = list(self.service._select_job_pages(
+                {'status': 'COMPLETED'}, None, 0, True)[0])
+            self.assertEqual([job_info['job_id'] for job_info in jobs_info[0]],
+                             ['3', '2', '1'])
+
+    def test_deleted_unfinished_job(self):
+        """Test unfinished jobs deleted from the server are removed from the index."""
+        with mock.patch.object(self.service, '_job_pages', side_effect=self._fake_job_pages):
+            self.service.sync_job_index()
+            del self.server_jobs[0]
+            self.assertEqual(self.service.sync_job_index(), 1)
+
+            self.filters.clear()
+            self.service.sync_job_index()
+            self.assertEqual(self.filters, [
+                {'creationDate': {'gte': '2020-01-02T10:00:00.000Z'}, 'id': {'nin': ['2']}}])
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend job scheduler."""
+
+import threading
+from unittest import mock
+
+from qiskit.providers.ibmq.jobscheduler import BackendJobScheduler
+from qiskit.providers.ibmq.job.exceptions import IBMQJobTimeoutError
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestBackendJobScheduler(IBMQTestCase):
+    """Tests for the backend job scheduler, without a server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.backend = mock.MagicMock()
+        self.backend.name.return_value = 'backend'
+        self.backend.remaining_jobs_count.side_effect = self._remaining_jobs_count
+        self.jobs = [mock.MagicMock(), mock.MagicMock()]
+        self.backend.run.side_effect = self.jobs
+
+    def _remaining_jobs_count(self):
+        """Return the remaining jobs under a limit of one job.
+
+        A submitted job is considered finished once it was waited for.
+        """
+        submitted = self.jobs[:self.backend.run.call_count]
+        return 1 - sum(not job.wait_for_final_state.called for job in submitted)
+
+    def _submit_all(self, scheduler, qobjs):
+        """Queue Qobjs before the dispatcher can submit any of them."""
+        with scheduler._condition:
+            return [scheduler.submit(qobj) for qobj in qobjs]
+
+    def test_watch_while_queued(self):
+        """Test jobs are only watched while Qobjs wait for a free slot."""
+        scheduler = BackendJobScheduler(self.backend, poll_interval=0.05)
+        scheduled = self._submit_all(scheduler, ['first_qobj', 'second_qobj'])
+
+        self.assertEqual([future.result(timeout=10) for future in scheduled], self.jobs)
+        self.jobs[0].wait_for_final_state.assert_called_with(timeout=0.05)
+        self.jobs[1].wait_for_final_state.assert_not_called()
+
+    def test_watcher_stops(self):
+        """Test a watcher stops once the queue is empty."""
+        self.jobs[0].wait_for_final_state.side_effect = IBMQJobTimeoutError('timeout')
+        scheduler = BackendJobScheduler(self.backend, poll_interval=0.05)
+        scheduled = self._submit_all(scheduler, ['first_qobj', 'second_qobj'])
+
+        for future in scheduled:
+            future.result(timeout=10)
+        watchers = [thread for thread in threading.enumerate()
+                    if thread.name.startswith('ibmq_scheduler_watch_')]
+        for thread in watchers:
+            self.assertTrue(thread.daemon)
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+
+    def test_watch_when_queued_later(self):
+        """Test a job submitted with an empty queue is watched once a Qobj is queued."""
+        scheduler = BackendJobScheduler(self.backend, poll_interval=60)
+        self.assertIs(scheduler.submit('first_qobj').result(timeout=10), self.jobs[0])
+        self.jobs[0].wait_for_final_state.assert_not_called()
+
+        self.assertIs(scheduler.submit('second_qobj').result(timeout=10), self.jobs[1])
+        self.jobs[0].wait_for_final_state.assert_called_with(timeout=60)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the columnar view of backend properties."""
+
+import numpy as np
+
+from qiskit.providers.exceptions import BackendPropertyError
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq.utils.properties import PropertiesArrays, properties_arrays
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestPropertiesArrays(IBMQTestCase):
+    """Tests for PropertiesArrays."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.properties = FakeAlmaden().properties()
+        self.props_dict = self.properties.to_dict()
+        self.arrays = PropertiesArrays(self.properties)
+
+    def test_qubit_property(self):
+        """Test the qubit properties match the nested properties."""
+        for name in ('T1', 'T2', 'readout_error'):
+            with self.subTest(name=name):
+                expected = [next(item['value'] for item in qubit if item['name'] == name)
+                            for qubit in self.props_dict['qubits']]
+                np.testing.assert_array_equal(self.arrays.qubit_property(name), expected)
+        self.assertEqual(self.arrays.qubit_units['T1'],
+                         next(item['unit'] for item in self.props_dict['qubits'][0]
+                              if item['name'] == 'T1'))
+
+        with self.assertRaises(BackendPropertyError):
+            self.arrays.qubit_property('unknown')
+        with self.assertRaises(ValueError):
+            self.arrays.qubit_property('T1')[0] = 0
+
+    def test_gate_property(self):
+        """Test the gate parameters match the nested properties."""
+        seen = set()
+        for gate in self.props_dict['gates']:
+            if (gate['gate'], tuple(gate['qubits'])) in seen:
+                continue
+            seen.add((gate['gate'], tuple(gate['qubits'])))
+            for param in gate['parameters']:
+                self.assertEqual(
+                    self.arrays.gate_property(gate['gate'], gate['qubits'], param['name']),
+                    param['value'])
+
+        cx_rows = self.arrays.gate_rows('cx')
+        cx_errors = [param['value'] for gate in self.props_dict['gates']
+                     if gate['gate'] == 'cx' for param in gate['parameters']
+                     if param['name'] == 'gate_error']
+        np.testing.assert_array_equal(self.arrays.gate_parameter()[cx_rows], cx_errors)
+
+        with self.assertRaises(BackendPropertyError):
+            self.arrays.gate_property('cx', [0, self.arrays.n_qubits])
+
+    def test_qubits_gate_property(self):
+        """Test gate parameters are looked up by qubits, whatever the gate name."""
+        gate = next(gate for gate in self.props_dict['gates'] if len(gate['qubits']) == 2)
+        self.assertEqual(self.arrays.qubits_gate_property(gate['qubits']),
+                         self.arrays.gate_property(gate['gate'], gate['qubits']))
+        with self.assertRaises(BackendPropertyError):
+            self.arrays.qubits_gate_property([0, self.arrays.n_qubits])
+
+    def test_single_qubit_gate_parameter(self):
+        """Test single qubit gate parameters are indexed by qubit."""
+        u2_errors = self.arrays.single_qubit_gate_parameter('u2')
+        self.assertEqual(len(u2_errors), self.arrays.n_qubits)
+        for qubit, error in enumerate(u2_errors):
+            self.assertEqual(error, self.properties.gate_error('u2', qubit))
+
+    def test_properties_arrays(self):
+        """Test the view is built once per properties instance."""
+        self.assertIs(properties_arrays(self.properties), properties_arrays(self.properties))
+        self.assertIsNot(properties_arrays(self.properties),
+                         properties_arrays(FakeAlmaden().properties()))
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the local time series of backend properties."""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+from qiskit.providers.ibmq.propertieshistory import (PropertiesHistory,
+                                                     enable_properties_history_cache,
+                                                     disable_properties_history_cache)
+
+from ..ibmqtestcase import IBMQTestCase
+
+START = datetime(2020, 6, 1, tzinfo=timezone.utc)
+
+
+class TestPropertiesHistory(IBMQTestCase):
+    """Tests for PropertiesHistory."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.history = PropertiesHistory()
+        # Calibrations every 10 hours.
+        self.server_dates = [START + timedelta(hours=10 * index) for index in range(20)]
+        self.query_count = 0
+
+    def _query(self, date):
+        """Return the raw properties in effect at a date, as the server does."""
+        self.query_count += 1
+        older = [server_date for server_date in self.server_dates if server_date < date]
+        if not older:
+            return None
+        return {'backend_name': 'ibmq_fake',
+                'last_update_date': max(older).strftime('%Y-%m-%dT%H:%M:%SZ')}
+
+    def _decode(self, api_properties):
+        """Return the decoded properties."""
+        return dict(api_properties, decoded=True)
+
+    def _fill(self, start, end):
+        """Query the server until the properties during a period are known."""
+        query_dates = [start + timedelta(days=day) for day in range((end - start).days + 1)]
+        while query_dates:
+            for date in query_dates:
+                self.history.add('ibmq_fake', date, self._query(date))
+            query_dates = self.history.missing_dates('ibmq_fake', start, end)
+
+    def test_get(self):
+        """Test properties are answered locally between a snapshot and its query date."""
+        query_date = START + timedelta(hours=25)
+        self.assertEqual(self.history.get('ibmq_fake', query_date, self._decode), (False, None))
+        self.history.add('ibmq_fake', query_date, self._query(query_date))
+
+        for hours in (21, 25):
+            known, properties = self.history.get(
+                'ibmq_fake', START + timedelta(hours=hours), self._decode)
+            self.assertTrue(known)
+            self.assertEqual(properties['last_update_date'], '2020-06-01T20:00:00Z')
+            self.assertTrue(properties['decoded'])
+        for hours in (19, 26):
+            self.assertFalse(self.history.is_known('ibmq_fake', START + timedelta(hours=hours)))
+
+    def test_missing_dates(self):
+        """Test all the snapshots during a period are retrieved."""
+        start, end = START + timedelta(hours=15), START + timedelta(days=5)
+        self._fill(start, end)
+
+        snapshots = self.history.snapshots('ibmq_fake', start, end, self._decode)
+        expected = [date for date in self.server_dates if date < end][1:]
+        self.assertEqual([snapshot['last_update_date'] for snapshot in snapshots],
+                         [date.strftime('%Y-%m-%dT%H:%M:%SZ') for date in expected])
+        self.assertEqual(self.history.missing_dates('ibmq_fake', start, end), [])
+
+        query_count = self.query_count
+        for hours in range(15, 5 * 24, 7):
+            date = START + timedelta(hours=hours)
+            self.assertEqual(self.history.get('ibmq_fake', date, self._decode)[1],
+                             self._decode(self._query(date)))
+        self.assertEqual(self.query_count - query_count, len(range(15, 5 * 24, 7)))
+
+    def test_no_properties(self):
+        """Test dates before the first snapshot."""
+        self._fill(START - timedelta(days=2), START + timedelta(hours=5))
+        self.assertEqual(self.history.get('ibmq_fake', START - timedelta(days=1), self._decode),
+                         (True, None))
+        self.assertEqual(len(self.history), 1)
+
+    def test_disk_cache(self):
+        """Test the snapshots are shared through the disk cache."""
+        enable_properties_history_cache(tempfile.mkdtemp())
+        self.addCleanup(disable_properties_history_cache)
+        start, end = START, START + timedelta(days=2)
+        self._fill(start, end)
+        self.history.save('ibmq_fake')
+
+        other_history = PropertiesHistory()
+        self.assertEqual(other_history.missing_dates('ibmq_fake', start, end), [])
+        self.assertEqual(other_history.snapshots('ibmq_fake', start, end, self._decode),
+                         self.history.snapshots('ibmq_fake', start, end, self._decode))
+
+    def test_concurrent_saves(self):
+        """Test saving merges the dates stored by other processes."""
+        enable_properties_history_cache(tempfile.mkdtemp())
+        self.addCleanup(disable_properties_history_cache)
+        other_history = PropertiesHistory()
+        first_date, second_date = START + timedelta(hours=25), START + timedelta(hours=75)
+        self.history.add('ibmq_fake', first_date, self._query(first_date))
+        other_history.add('ibmq_fake', second_date, self._query(second_date))
+        self.history.save('ibmq_fake')
+        other_history.save('ibmq_fake')
+
+        new_history = PropertiesHistory()
+        for date in (first_date, second_date):
+            self.assertTrue(new_history.is_known('ibmq_fake', date))
+
+    def test_deferred_save(self):
+        """Test deferred saves are batched."""
+        enable_properties_history_cache(tempfile.mkdtemp())
+        self.addCleanup(disable_properties_history_cache)
+        first_date, second_date = START + timedelta(hours=25), START + timedelta(hours=75)
+        self.history.add('ibmq_fake', first_date, self._query(first_date))
+        self.history.save('ibmq_fake', deferred=True)
+        self.history.add('ibmq_fake', second_date, self._query(second_date))
+        self.history.save('ibmq_fake', deferred=True)
+        self.assertFalse(PropertiesHistory().is_known('ibmq_fake', second_date))
+
+        self.history.flush()
+        self.assertTrue(PropertiesHistory().is_known('ibmq_fake', second_date))
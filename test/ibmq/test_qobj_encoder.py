@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the Qobj encoders."""
+
+import copy
+import json
+
+from qiskit import assemble
+from qiskit.circuit.random import random_circuit
+
+from qiskit.providers.ibmq.utils.qobj_encoder import (
+    FragmentCacheQobjEncoder, ProcessQobjEncoder, encode_qobj, qobj_encoder,
+    enable_fragment_cache, disable_fragment_cache, enable_process_encoding,
+    disable_process_encoding)
+from qiskit.providers.ibmq.utils.json_encoder import IQXJsonEncoder
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestFragmentCacheQobjEncoder(IBMQTestCase):
+    """Tests for FragmentCacheQobjEncoder."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        self.circuits = [random_circuit(3, 5, measure=True, seed=seed) for seed in range(4)]
+
+    def test_encode(self):
+        """Test the encoded Qobj is the same as without cache."""
+        encoder = FragmentCacheQobjEncoder()
+        for shots in (100, 200):
+            qobj = assemble(self.circuits, shots=shots)
+            self.assertEqual(json.loads(encoder.encode(qobj)), json.loads(encode_qobj(qobj)))
+
+    def test_cache_info(self):
+        """Test repeated experiments are encoded once."""
+        encoder = FragmentCacheQobjEncoder()
+        encoder.encode(assemble(self.circuits, shots=100))
+        encoder.encode(assemble(self.circuits, shots=200))
+
+        cache_info = encoder.cache_info()
+        self.assertEqual(cache_info.misses, len(self.circuits))
+        self.assertEqual(cache_info.hits, len(self.circuits))
+        self.assertEqual(cache_info.entries, len(self.circuits))
+
+        encoder.cache_clear()
+        self.assertEqual(encoder.cache_info(), (0, 0, 0, 0, 0))
+
+    def test_equal_experiments(self):
+        """Test equal experiments that pickle differently share a fragment."""
+        encoder = FragmentCacheQobjEncoder()
+        qobj = assemble(self.circuits[0])
+        encoder.encode(qobj)
+
+        reordered = copy.copy(qobj)
+        experiment = copy.copy(qobj.experiments[0])
+        experiment.__dict__ = dict(reversed(list(experiment.__dict__.items())))
+        reordered.experiments = [experiment]
+        self.assertEqual(json.loads(encoder.encode(reordered)), json.loads(encode_qobj(qobj)))
+        self.assertEqual(encoder.cache_info().hits, 1)
+        self.assertEqual(encoder.cache_info().entries, 1)
+
+    def test_process_encoder(self):
+        """Test experiments not in the cache are encoded in the process pool."""
+        process_encoder = ProcessQobjEncoder(max_workers=1, min_size=0)
+        self.addCleanup(process_encoder.shutdown)
+        encoder = FragmentCacheQobjEncoder(process_encoder=process_encoder)
+        qobj = assemble(self.circuits)
+        self.assertEqual(json.loads(encoder.encode(qobj)), json.loads(encode_qobj(qobj)))
+        self.assertEqual(encoder.cache_info().misses, len(self.circuits))
+
+    def test_bounded_size(self):
+        """Test the cache does not grow beyond its maximum size."""
+        qobj = assemble(self.circuits)
+        max_bytes = 2 * min(len(json.dumps(experiment.to_dict(), cls=IQXJsonEncoder))
+                            for experiment in qobj.experiments) - 1
+        # Room for a single fragment at most.
+        encoder = FragmentCacheQobjEncoder(max_bytes=max_bytes)
+        encoder.encode(qobj)
+
+        cache_info = encoder.cache_info()
+        self.assertLessEqual(cache_info.size, max_bytes)
+        self.assertLessEqual(cache_info.entries, 1)
+
+
+class TestProcessQobjEncoder(IBMQTestCase):
+    """Tests for ProcessQobjEncoder."""
+
+    def test_submit(self):
+        """Test Qobjs submitted together are encoded as without the pool."""
+        encoder = ProcessQobjEncoder(max_workers=2, min_size=0)
+        self.addCleanup(encoder.shutdown)
+        qobjs = [assemble(random_circuit(3, 5, measure=True, seed=seed)) for seed in range(3)]
+        encodings = [encoder.submit(qobj) for qobj in qobjs]
+        for qobj, encoding in zip(qobjs, encodings):
+            self.assertEqual(encoding.result(), encode_qobj(qobj))
+
+    def test_small_qobj(self):
+        """Test small Qobjs are encoded in the calling thread."""
+        encoder = ProcessQobjEncoder(max_workers=1)
+        self.addCleanup(encoder.shutdown)
+        qobj = assemble(random_circuit(3, 5, measure=True, seed=0))
+        encoding = encoder.submit(qobj)
+        self.assertTrue(encoding.done())
+        self.assertEqual(encoding.result(), encode_qobj(qobj))
+
+
+class TestQobjEncoderSettings(IBMQTestCase):
+    """Tests for enabling the Qobj encoders."""
+
+    def test_composition(self):
+        """Test the fragment cache uses the process encoder when both are enabled."""
+        self.addCleanup(disable_process_encoding)
+        self.addCleanup(disable_fragment_cache)
+        enable_process_encoding(max_workers=1)
+        process_encoder = qobj_encoder()
+        fragment_cache = enable_fragment_cache()
+        self.assertIs(qobj_encoder(), fragment_cache)
+        self.assertIs(fragment_cache.process_encoder, process_encoder)
+
+        disable_process_encoding()
+        self.assertIs(qobj_encoder(), fragment_cache)
+        self.assertIsNone(fragment_cache.process_encoder)
+        disable_fragment_cache()
+        self.assertIsNone(qobj_encoder())
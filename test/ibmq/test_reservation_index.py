@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the backend reservation index."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from qiskit.test.mock import FakeAlmaden
+
+from qiskit.providers.ibmq.backendreservation import BackendReservation
+from qiskit.providers.ibmq.credentials import Credentials
+from qiskit.providers.ibmq.ibmqbackend import IBMQBackend
+from qiskit.providers.ibmq.ibmqbackendservice import IBMQBackendService
+from qiskit.providers.ibmq.reservationindex import IntervalIndex
+
+from ..ibmqtestcase import IBMQTestCase
+
+
+class TestIntervalIndex(IBMQTestCase):
+    """Tests for IntervalIndex."""
+
+    def test_overlapping(self):
+        """Test the overlapping reservations match a linear scan."""
+        origin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        rand = random.Random(1234)
+        reservations = []
+        for _ in range(200):
+            start = origin + timedelta(minutes=rand.randrange(10000))
+            reservations.append(BackendReservation(
+                'ibmq_almaden', start, start + timedelta(minutes=rand.randrange(1, 600))))
+        index = IntervalIndex(reservations)
+        self.assertEqual(len(index), 200)
+
+        for _ in range(100):
+            start = origin.timestamp() + rand.randrange(-600, 10600) * 60
+            end = start + rand.randrange(1, 1200) * 60
+            expected = sorted(
+                (reservation for reservation in reservations
+                 if reservation.start_datetime.timestamp() < end
+                 and reservation.end_datetime.timestamp() > start),
+                key=lambda reservation: reservation.start_datetime)
+            self.assertEqual([id(reservation) for reservation in index.overlapping(start, end)],
+                             [id(reservation) for reservation in expected])
+
+
+class TestReservationIndex(IBMQTestCase):
+    """Tests for the reservation index of a provider, without a server."""
+
+    def setUp(self):
+        """Initial test setup."""
+        super().setUp()
+        now = datetime.utcnow()
+        self.raw_reservations = {
+            'first': [{'initialDate': (now + timedelta(hours=2)).isoformat() + 'Z',
+                       'endDate': (now + timedelta(hours=3)).isoformat() + 'Z'}],
+            'second': []}
+        self.api_client = mock.MagicMock()
+        self.api_client.backend_reservations.side_effect = \
+            lambda name, *_: self.raw_reservations[name]
+        credentials = Credentials('token', 'https://localhost/api')
+        self.provider = mock.MagicMock()
+        self.provider._backends = {}
+        for name in self.raw_reservations:
+            configuration = FakeAlmaden().configuration()
+            configuration.backend_name = name
+            self.provider._backends[name] = IBMQBackend(
+                configuration, self.provider, credentials, self.api_client)
+        self.provider.backends = IBMQBackendService(self.provider)
+        self.addCleanup(self.provider.backends.stop_reservation_refresh)
+
+    def test_reservations_from_index(self):
+        """Test reservations within the indexed period are answered locally."""
+        self.provider.backends.start_reservation_refresh(horizon=24 * 60)
+        self.assertEqual(self.api_client.backend_reservations.call_count, 2)
+
+        now = datetime.now()
+        first, second = self.provider._backends['first'], self.provider._backends['second']
+        self.assertFalse(first.reservations(now, now + timedelta(hours=1)))
+        self.assertEqual(len(first.reservations(now, now + timedelta(hours=4))), 1)
+        self.assertFalse(second.reservations(now, now + timedelta(hours=4)))
+        index = self.provider.backends._reservation_index
+        self.assertTrue(index.is_reserved('first', now + timedelta(minutes=150),
+                                          now + timedelta(minutes=160)))
+        self.assertEqual(self.api_client.backend_reservations.call_count, 2)
+
+        first.reservations(now, now + timedelta(days=2))
+        self.assertEqual(self.api_client.backend_reservations.call_count, 3)
+
+        self.provider.backends.stop_reservation_refresh()
+        self.assertIsNone(index.is_reserved('first', now, now + timedelta(hours=4)))
+
+    def test_default_interval(self):
+        """Test the index is refreshed every 10 minutes by default."""
+        index = self.provider.backends._reservation_index
+        index.start()
+        self.addCleanup(index.stop)
+        self.assertEqual(index.interval, 600)
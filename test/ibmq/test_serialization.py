@@ -21,6 +21,7 @@ import dateutil.parser
 import qiskit
 from qiskit.test import slow_test
 from qiskit.providers.ibmq import least_busy
+from qiskit.providers.ibmq.utils import enable_process_encoding, disable_process_encoding
 from qiskit import assemble, transpile, schedule, QuantumCircuit
 
 from ..decorators import requires_provider
@@ -48,6 +49,18 @@ class TestSerialization(IBMQTestCase):
 
         self.assertEqual(_array_to_list(qobj.to_dict()), rqobj.to_dict())
 
+    def test_process_encoded_qobj(self):
+        """Test serializing qasm qobj data in worker processes."""
+        backend = self.provider.get_backend('ibmq_qasm_simulator')
+        qobj = bell_in_qobj(backend=backend)
+        enable_process_encoding(max_workers=1, min_size=0)
+        self.addCleanup(disable_process_encoding)
+        job = backend.run(qobj, validate_qobj=True)
+        self.assertIn('submit.encode', job.client_timings())
+        rqobj = backend.retrieve_job(job.job_id()).qobj()
+
+        self.assertEqual(_array_to_list(qobj.to_dict()), rqobj.to_dict())
+
     def test_pulse_qobj(self):
         """Test serializing pulse qobj data."""
         backends = self.provider.backends(operational=True, open_pulse=True)